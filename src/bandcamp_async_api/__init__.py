@@ -1,5 +1,8 @@
 """Bandcamp API - standalone async client for Bandcamp."""
 
+from .batch import BatchIterator, BatchResult
+from .cache import CacheBackend, CacheStats, MemoryCache, ResponseCache
+from .cassette import Cassette, CassetteMissError, RecordingSession, ReplaySession
 from .client import (
     BandcampAPIClient,
     BandcampAPIError,
@@ -7,12 +10,17 @@ from .client import (
     BandcampMustBeLoggedInError,
     BandcampRateLimitError,
 )
+from .columnar import CollectionColumns, CollectionRow
+from .feed import FeedIterator, FeedWatcher
+from .hydration import CollectionHydrator, HydratedItem, HydrationProgress
 from .models import (
+    ArtistWithDiscography,
     BCAlbum,
     BCArtist,
     BCTrack,
     CollectionItem,
     CollectionSummary,
+    DiscographyItem,
     FanItem,
     FeedBandInfo,
     FeedFanInfo,
@@ -25,8 +33,24 @@ from .models import (
     SearchResultItem,
     SearchResultTrack,
 )
+from .metrics import EndpointStats, RequestMetrics
+from .pagination import CollectionIterator
+from .parsers import ParseContext
+from .ratelimit import RateLimiter, TokenBucket
+from .retry import RequestInfo, RetryPolicy
+from .sqlite_cache import SQLiteCache
+from .sync import (
+    JSONFileSyncStore,
+    MemorySyncStore,
+    SyncDelta,
+    SyncState,
+    SyncStateStore,
+)
+from .tracing import CallbackTracer, NoOpTracer, TraceSpan, Tracer, trace_config
+from .transport import TransportConfig
 
 __all__ = [
+    "ArtistWithDiscography",
     "BCAlbum",
     "BCArtist",
     "BCTrack",
@@ -35,17 +59,55 @@ __all__ = [
     "BandcampMustBeLoggedInError",
     "BandcampNotFoundError",
     "BandcampRateLimitError",
+    "BatchIterator",
+    "BatchResult",
+    "CacheBackend",
+    "CacheStats",
+    "CallbackTracer",
+    "Cassette",
+    "CassetteMissError",
+    "CollectionColumns",
+    "CollectionHydrator",
     "CollectionItem",
+    "CollectionIterator",
+    "CollectionRow",
     "CollectionSummary",
+    "DiscographyItem",
+    "EndpointStats",
     "FanItem",
     "FeedBandInfo",
     "FeedFanInfo",
+    "FeedIterator",
     "FeedResponse",
     "FeedStory",
     "FeedTrack",
+    "FeedWatcher",
     "FollowingItem",
+    "HydratedItem",
+    "HydrationProgress",
+    "JSONFileSyncStore",
+    "MemoryCache",
+    "MemorySyncStore",
+    "NoOpTracer",
+    "ParseContext",
+    "RateLimiter",
+    "RecordingSession",
+    "ReplaySession",
+    "RequestInfo",
+    "RequestMetrics",
+    "ResponseCache",
+    "RetryPolicy",
+    "SQLiteCache",
     "SearchResultAlbum",
     "SearchResultArtist",
     "SearchResultItem",
     "SearchResultTrack",
+    "SyncDelta",
+    "SyncState",
+    "SyncStateStore",
+    "TokenBucket",
+    "TraceSpan",
+    "Tracer",
+    "TransportConfig",
+    "trace_config",
 ]
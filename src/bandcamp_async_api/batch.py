@@ -0,0 +1,98 @@
+"""Bounded-concurrency fetching of many items."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from .utils import BackgroundTaskIterator
+
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclass(slots=True)
+class BatchResult[K: Hashable, T]:
+    """Outcome of fetching one item of a batch."""
+
+    key: K  # (band_id, item_id) pair or artist ID as passed in
+    value: T | None = None
+    error: Exception | None = None  # set instead of value when the fetch failed
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was fetched successfully."""
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """Return the value, raising the fetch error if there is one."""
+        if self.error is not None:
+            raise self.error
+        return self.value  # ty:ignore[invalid-return-type]
+
+
+class BatchIterator[K: Hashable, T](BackgroundTaskIterator[BatchResult[K, T]]):
+    """Async iterator yielding batch results as they complete.
+
+    Duplicate keys are fetched once. At most ``concurrency`` fetches run at
+    a time; a failed fetch yields a result carrying its error and does not
+    stop the others.
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[K],
+        fetch: Callable[[K], Awaitable[T]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        """Initialize the iterator.
+
+        Args:
+            keys: Items to fetch.
+            fetch: Coroutine function fetching one item.
+            concurrency: Maximum fetches in flight.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        super().__init__()
+        self.keys: list[K] = list(dict.fromkeys(keys))
+        self.fetch = fetch
+        self.concurrency = concurrency
+        self._pending = iter(self.keys)
+        self._results: asyncio.Queue = asyncio.Queue()
+        self._remaining = len(self.keys)
+
+    async def _work(self) -> None:
+        for key in self._pending:
+            try:
+                result = BatchResult(key, await self.fetch(key))
+            except Exception as e:  # noqa: BLE001
+                result = BatchResult(key, error=e)
+            await self._results.put(result)
+
+    async def __anext__(self) -> BatchResult[K, T]:
+        if not self._remaining:
+            await self.aclose()
+            raise StopAsyncIteration
+        if not self._tasks:
+            workers = min(self.concurrency, self._remaining)
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(workers)]
+        result = await self._results.get()
+        self._remaining -= 1
+        return result
+
+
+async def fetch_batch[K: Hashable, T](
+    keys: Iterable[K],
+    fetch: Callable[[K], Awaitable[T]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[BatchResult[K, T]]:
+    """Fetch every key and return the results in input order.
+
+    Duplicate keys are fetched once and share one result object.
+    """
+    keys = list(keys)
+    results: dict[Any, BatchResult[K, T]] = {}
+    async with BatchIterator(keys, fetch, concurrency) as batch:
+        async for result in batch:
+            results[result.key] = result
+    return [results[key] for key in keys]
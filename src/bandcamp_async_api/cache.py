@@ -0,0 +1,184 @@
+"""Response cache for rarely changing catalog endpoints."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Protocol, runtime_checkable
+
+# Seconds to keep responses per endpoint name (see endpoints.endpoint_name).
+# Endpoints missing from the mapping are never cached.
+DEFAULT_TTLS: dict[str, float] = {
+    "tralbum_details": 3600.0,
+    "band_details": 3600.0,
+    "search": 300.0,
+}
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Storage for raw response bodies keyed by request key.
+
+    Keys start with the endpoint name followed by ``|``, so a prefix delete
+    with ``"tralbum_details|"`` drops every cached album and track.
+    """
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the stored body, or None when missing or expired."""
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a body that expires after ``ttl`` seconds."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove a single entry if present."""
+        ...
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Remove every entry whose key starts with ``prefix``."""
+        ...
+
+    async def clear(self) -> None:
+        """Remove every entry."""
+        ...
+
+
+class MemoryCache:
+    """In-process LRU cache bounded by the total size of stored bodies."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """Initialize the memory cache.
+
+        Args:
+            max_bytes: Upper bound for the summed size of keys and bodies.
+                Least recently used entries are evicted to stay under it.
+        """
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _entry_size(key: str, value: bytes) -> int:
+        return len(key) + len(value)
+
+    def _pop(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self.size_bytes -= self._entry_size(key, value)
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the stored body, or None when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            self._pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a body, evicting least recently used entries if needed."""
+        size = self._entry_size(key, value)
+        if key in self._entries:
+            self._pop(key)
+        if size > self.max_bytes:
+            return
+        while self.size_bytes + size > self.max_bytes:
+            self._pop(next(iter(self._entries)))
+            self.evictions += 1
+        self._entries[key] = (monotonic() + ttl, value)
+        self.size_bytes += size
+
+    async def delete(self, key: str) -> None:
+        """Remove a single entry if present."""
+        if key in self._entries:
+            self._pop(key)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Remove every entry whose key starts with ``prefix``."""
+        keys = [k for k in self._entries if k.startswith(prefix)]
+        for key in keys:
+            self._pop(key)
+        return len(keys)
+
+    async def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self.size_bytes = 0
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters of a response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Opt-in cache of raw API responses with per-endpoint TTLs."""
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttls: dict[str, float] | None = None,
+    ):
+        """Initialize the response cache.
+
+        Args:
+            backend: Storage backend. Defaults to an in-memory LRU cache.
+            ttls: Seconds to keep responses per endpoint name. Defaults to
+                ``DEFAULT_TTLS``; endpoints without a positive TTL are not
+                cached.
+        """
+        self.backend: CacheBackend = backend if backend is not None else MemoryCache()
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.stats = CacheStats()
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the TTL for an endpoint, 0 when it isn't cached."""
+        return self.ttls.get(endpoint, 0.0)
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        """Check whether responses of an endpoint are cached."""
+        return self.ttl_for(endpoint) > 0
+
+    async def get(self, key: str) -> bytes | None:
+        """Look up a cached body and update the hit/miss counters."""
+        value = await self.backend.get(key)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, endpoint: str, value: bytes) -> None:
+        """Store a body using the endpoint's TTL."""
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        await self.backend.set(key, value, ttl)
+        self.stats.stores += 1
+
+    async def invalidate(self, endpoint: str | None = None) -> None:
+        """Drop cached responses of one endpoint, or everything if None."""
+        if endpoint is None:
+            await self.backend.clear()
+        else:
+            await self.backend.delete_prefix(f"{endpoint}|")
+
+    async def invalidate_key(self, key: str) -> None:
+        """Drop the cached response for a single request key."""
+        await self.backend.delete(key)
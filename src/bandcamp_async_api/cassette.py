@@ -0,0 +1,407 @@
+"""Recording HTTP traffic to a cassette file and replaying it offline.
+
+A cassette is a list of request/response pairs. ``RecordingSession``
+wraps a real aiohttp session and records every response the client gets,
+error statuses such as 429 included. ``ReplaySession`` answers the same
+requests from a cassette without network access, as fast as possible or
+at a chosen multiple of the recorded speed. Both are passed to the client
+as ``session=``::
+
+    cassette = Cassette()
+    async with RecordingSession(cassette) as session:
+        async with BandcampAPIClient(session=session) as client:
+            await client.search("ambient")
+    cassette.save("traffic.jsonl.gz")
+
+    replay = ReplaySession(Cassette.load("traffic.jsonl.gz"), speed=100)
+    async with BandcampAPIClient(session=replay) as client:
+        await client.search("ambient")
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import monotonic
+from typing import Any
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from .endpoints import request_key
+from .transport import TransportConfig
+
+CASSETTE_VERSION = 1
+
+# Response headers kept in a cassette; the client only reads these
+RECORDED_HEADERS = ("Content-Type", "Retry-After")
+
+# Request fields derived from the current time, ignored when no recorded
+# request matches exactly
+VOLATILE_FIELDS = frozenset({"older_than", "older_than_token"})
+
+
+class CassetteMissError(LookupError):
+    """Raised when a replayed request has no recorded response."""
+
+
+@dataclass(slots=True)
+class Interaction:
+    """One recorded request and its response."""
+
+    method: str
+    url: str
+    status: int
+    body: bytes
+    params: dict[str, str] | None = None
+    json: Any = None
+    data: dict[str, str] | None = None
+    headers: dict[str, str] = field(default_factory=dict)  # response headers
+    duration: float = 0.0  # seconds from sending the request to the full body
+
+    def key(self) -> str:
+        """Return the request key that matches this interaction exactly."""
+        return request_key(
+            self.method, self.url, params=self.params, json=self.json, data=self.data
+        )
+
+    def loose_key(self) -> str:
+        """Return the request key with time-dependent fields removed."""
+        return loose_request_key(
+            self.method, self.url, params=self.params, json=self.json, data=self.data
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        try:
+            body, encoding = self.body.decode(), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(self.body).decode(), "base64"
+        entry: dict[str, Any] = {
+            "method": self.method,
+            "url": self.url,
+            "status": self.status,
+            "duration": round(self.duration, 6),
+        }
+        for name in ("params", "json", "data"):
+            value = getattr(self, name)
+            if value is not None:
+                entry[name] = value
+        if self.headers:
+            entry["headers"] = self.headers
+        entry["encoding"] = encoding
+        entry["body"] = body
+        return entry
+
+    @classmethod
+    def from_dict(cls, entry: dict[str, Any]) -> "Interaction":
+        """Rebuild an interaction from :meth:`to_dict` output."""
+        body = entry.get("body", "")
+        if entry.get("encoding") == "base64":
+            raw = base64.b64decode(body)
+        else:
+            raw = body.encode()
+        return cls(
+            method=entry["method"],
+            url=entry["url"],
+            status=entry["status"],
+            body=raw,
+            params=entry.get("params"),
+            json=entry.get("json"),
+            data=entry.get("data"),
+            headers=entry.get("headers", {}),
+            duration=entry.get("duration", 0.0),
+        )
+
+
+def _stringify(values: dict[str, Any] | None) -> dict[str, str] | None:
+    # Query and form values go over the wire as strings
+    return {k: str(v) for k, v in values.items()} if values is not None else None
+
+
+def loose_request_key(
+    method: str,
+    url: str,
+    params: dict[str, Any] | None = None,
+    json: Any = None,
+    data: dict[str, Any] | None = None,
+    **_: Any,
+) -> str:
+    """Build a request key ignoring the fields in ``VOLATILE_FIELDS``.
+
+    The first collection and feed page requests carry the current time, so
+    they never match a recording exactly.
+    """
+
+    def strip(values: Any) -> Any:
+        if not isinstance(values, dict):
+            return values
+        return {k: v for k, v in values.items() if k not in VOLATILE_FIELDS}
+
+    return request_key(
+        method, url, params=strip(params), json=strip(json), data=strip(data)
+    )
+
+
+class Cassette:
+    """Recorded interactions, stored as JSON lines (gzipped for ``.gz`` paths)."""
+
+    def __init__(self, interactions: list[Interaction] | None = None):
+        """Initialize the cassette.
+
+        Args:
+            interactions: Interactions in recording order.
+        """
+        self.interactions: list[Interaction] = interactions or []
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def append(self, interaction: Interaction) -> None:
+        """Add an interaction."""
+        self.interactions.append(interaction)
+
+    def save(self, path: str | Path) -> None:
+        """Write the cassette to ``path``."""
+        path = Path(path)
+        lines = [json.dumps({"version": CASSETTE_VERSION})]
+        lines += [
+            json.dumps(i.to_dict(), separators=(",", ":")) for i in self.interactions
+        ]
+        content = ("\n".join(lines) + "\n").encode()
+        if path.suffix == ".gz":
+            content = gzip.compress(content)
+        path.write_bytes(content)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        """Read a cassette written by :meth:`save`."""
+        path = Path(path)
+        content = path.read_bytes()
+        if path.suffix == ".gz":
+            content = gzip.decompress(content)
+        lines = content.decode().splitlines()
+        header = json.loads(lines[0]) if lines else {}
+        if header.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {header.get('version')}")
+        return cls([Interaction.from_dict(json.loads(line)) for line in lines[1:]])
+
+
+class CassetteResponse:
+    """The subset of ``aiohttp.ClientResponse`` the client uses."""
+
+    def __init__(self, method: str, url: str, status: int, headers, body: bytes):
+        """Initialize the response."""
+        self.method = method
+        self.url = URL(url)
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self._body = body
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status is below 400."""
+        return self.status < 400
+
+    async def read(self) -> bytes:
+        """Return the response body."""
+        return self._body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        """Return the response body decoded."""
+        return self._body.decode(encoding)
+
+    async def json(self, **_: Any) -> Any:
+        """Return the response body parsed as JSON."""
+        return json.loads(self._body)
+
+    def raise_for_status(self) -> None:
+        """Raise ``aiohttp.ClientResponseError`` for 4xx and 5xx statuses."""
+        if self.ok:
+            return
+        request_info = aiohttp.RequestInfo(
+            self.url, self.method, CIMultiDictProxy(CIMultiDict()), self.url
+        )
+        raise aiohttp.ClientResponseError(
+            request_info, (), status=self.status, headers=self.headers
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+class _RequestContext:
+    """Awaitable async context manager, like aiohttp's request context."""
+
+    def __init__(self, coro):
+        self._coro = coro
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    async def __aenter__(self) -> CassetteResponse:
+        return await self._coro
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+class _CassetteSession(ABC):
+    """Session methods shared by the recording and replaying sessions."""
+
+    closed = False
+
+    def get(self, url: str, **kwargs: Any) -> _RequestContext:
+        """Send a GET request."""
+        return _RequestContext(self._request("GET", url, **kwargs))
+
+    def post(self, url: str, **kwargs: Any) -> _RequestContext:
+        """Send a POST request."""
+        return _RequestContext(self._request("POST", url, **kwargs))
+
+    def head(self, url: str, **kwargs: Any) -> _RequestContext:
+        """Send a HEAD request."""
+        return _RequestContext(self._request("HEAD", url, **kwargs))
+
+    @abstractmethod
+    async def _request(self, method: str, url: str, **kwargs: Any) -> CassetteResponse:
+        """Answer one request."""
+
+    async def close(self) -> None:
+        """Close the session."""
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class RecordingSession(_CassetteSession):
+    """Session sending real requests and recording their responses.
+
+    Request headers, which carry the identity cookie, are not recorded.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        session: aiohttp.ClientSession | None = None,
+        transport: TransportConfig | None = None,
+    ):
+        """Initialize the session.
+
+        Args:
+            cassette: Cassette receiving the interactions.
+            session: Session sending the requests. Created from ``transport``
+                and closed with this session when not provided.
+            transport: Connection pool settings for the created session.
+        """
+        self.cassette = cassette
+        self._session = session
+        self._owns_session = session is None
+        self.transport = transport or TransportConfig()
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> CassetteResponse:
+        if self._session is None:
+            self._session = self.transport.create_session()
+        started = monotonic()
+        async with self._session.request(method, url, **kwargs) as resp:
+            body = await resp.read()
+            headers = {
+                h: resp.headers[h] for h in RECORDED_HEADERS if h in resp.headers
+            }
+            status = resp.status
+        self.cassette.append(
+            Interaction(
+                method=method,
+                url=url,
+                status=status,
+                body=body,
+                params=_stringify(kwargs.get("params")),
+                json=kwargs.get("json"),
+                data=_stringify(kwargs.get("data")),
+                headers=headers,
+                duration=monotonic() - started,
+            )
+        )
+        return CassetteResponse(method, url, status, headers, body)
+
+    async def close(self) -> None:
+        """Close the underlying session if this session created it."""
+        await super().close()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+
+
+class ReplaySession(_CassetteSession):
+    """Session answering requests from a cassette, without network access.
+
+    Each request is matched exactly first, then ignoring time-dependent
+    fields (see ``VOLATILE_FIELDS``). Responses recorded for the same
+    request are replayed in recording order, so a 429 followed by a 200
+    replays as such; once they are used up the last one keeps being
+    returned, unless ``repeat`` is False. Requests without a recording
+    raise ``CassetteMissError``.
+    """
+
+    def __init__(
+        self, cassette: Cassette, speed: float | None = None, repeat: bool = True
+    ):
+        """Initialize the session.
+
+        Args:
+            cassette: Recorded interactions to replay.
+            speed: Replay the recorded response times divided by this factor,
+                e.g. 100 for 100x real rate. None answers without delay.
+            repeat: Keep returning the last recorded response of a request
+                once all of them were replayed.
+        """
+        self.cassette = cassette
+        self.speed = speed
+        self.repeat = repeat
+        self.replayed = 0
+        self._exact: dict[str, deque[Interaction]] = defaultdict(deque)
+        self._loose: dict[str, deque[Interaction]] = defaultdict(deque)
+        self._last: dict[str, Interaction] = {}
+        self._used: set[int] = set()
+        for interaction in cassette.interactions:
+            self._exact[interaction.key()].append(interaction)
+            self._loose[interaction.loose_key()].append(interaction)
+
+    def _take(self, key: str, loose_key: str) -> Interaction | None:
+        for index, k in ((self._exact, key), (self._loose, loose_key)):
+            queue = index.get(k)
+            while queue:
+                interaction = queue.popleft()
+                # Consumed through the other index already
+                if id(interaction) in self._used:
+                    continue
+                self._used.add(id(interaction))
+                self._last[key] = self._last[loose_key] = interaction
+                return interaction
+        if self.repeat:
+            return self._last.get(key) or self._last.get(loose_key)
+        return None
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> CassetteResponse:
+        key = request_key(method, url, **kwargs)
+        loose_key = loose_request_key(method, url, **kwargs)
+        interaction = self._take(key, loose_key)
+        if interaction is None:
+            raise CassetteMissError(f"No recorded response for {method} {url}")
+        if self.speed:
+            await asyncio.sleep(interaction.duration / self.speed)
+        self.replayed += 1
+        return CassetteResponse(
+            method, url, interaction.status, interaction.headers, interaction.body
+        )
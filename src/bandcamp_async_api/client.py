@@ -1,20 +1,53 @@
 """Bandcamp API Client - standalone async client."""
 
-from typing import Any
-from time import time
+import asyncio
+from collections.abc import AsyncIterable, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import replace
+from typing import Any, TypeVar
+from time import monotonic, time
 
 import aiohttp
 
+from .batch import DEFAULT_CONCURRENCY, BatchIterator, BatchResult, fetch_batch
+from .cache import ResponseCache
+from .columnar import CollectionColumns
+from .decoding import (
+    DEFAULT_OFFLOAD_THRESHOLD,
+    JSONLoads,
+    decode_json,
+    default_json_loads,
+)
+from .endpoints import endpoint_name, request_key
+
+from .feed import FeedIterator, FeedWatcher, StoryCallback
+from .hydration import CollectionHydrator, ProgressCallback
 from .models import (
+    ArtistWithDiscography,
     BCAlbum,
     BCArtist,
     BCTrack,
+    CollectionItem,
     CollectionSummary,
     FeedResponse,
+    FeedStory,
+    SearchResultAlbum,
     SearchResultItem,
+    SearchResultTrack,
     CollectionType,
 )
-from .parsers import BandcampParsers
+from .metrics import RequestMetrics
+from .pagination import CollectionIterator
+from .parsers import BandcampParsers, ParseContext
+from .ratelimit import RateLimiter
+from .retry import RequestInfo, RetryPolicy, is_idempotent
+from .sync import SyncDelta, SyncStateStore, sync_collection
+from .tracing import NoOpTracer, Tracer, trace_config
+from .transport import WARMUP_URLS, TransportConfig, warm_up_connections
+from .utils import LRUDict
+
+T = TypeVar("T")
 
 
 class BandcampAPIError(Exception):
@@ -47,10 +80,22 @@ class BandcampRateLimitError(BandcampAPIError):
         self.retry_after = retry_after
 
 
+# Created once: contexts keep a reference to every variable set in them, so
+# per-client variables would leak. Each holds a mapping keyed by client,
+# replaced rather than mutated so copied contexts are unaffected.
+_last_request_info: ContextVar[dict["BandcampAPIClient", RequestInfo] | None] = (
+    ContextVar("bandcamp_last_request_info", default=None)
+)
+_deadline: ContextVar[dict["BandcampAPIClient", float | None] | None] = ContextVar(
+    "bandcamp_deadline", default=None
+)
+
+
 class BandcampAPIClient:
     """Async Bandcamp API client - standalone, no external dependencies."""
 
     BASE_URL = "https://bandcamp.com/api"
+    FEED_URL = "https://bandcamp.com/fan_dash_feed_updates"
 
     def __init__(
         self,
@@ -58,6 +103,20 @@ class BandcampAPIClient:
         identity_token: str | None = None,
         user_agent: str = "bandcamp-api/1.0",
         default_retry_after: int = 10,
+        transport: TransportConfig | None = None,
+        coalesce_requests: bool = True,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        race_tralbum_types: bool = False,
+        tralbum_type_hints: int = 10000,
+        band_details_reuse_window: float = 0.0,
+        json_loads: JSONLoads | None = None,
+        json_offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
+        lazy_parsing: bool = False,
+        parse_context: ParseContext | None = None,
+        metrics: RequestMetrics | None = None,
+        tracer: Tracer | None = None,
     ):
         """Initialize the Bandcamp API client.
 
@@ -66,6 +125,37 @@ class BandcampAPIClient:
             identity_token: Optional identity token for collection access.
             user_agent: User agent string to use for requests.
             default_retry_after: Default seconds to wait when rate limited without Retry-After header.
+            transport: Connection pool settings for the session the client creates
+                itself. Ignored when ``session`` is provided.
+            coalesce_requests: Share one in-flight HTTP call between concurrent
+                identical requests instead of sending duplicates.
+            cache: Optional response cache for catalog endpoints. Disabled
+                when not provided.
+            rate_limiter: Optional client-side rate limiter. Share one instance
+                between clients to pace them together.
+            retry_policy: Optional policy for retrying 429s, 5xx responses and
+                connection errors. Without one every failure is raised at once.
+            race_tralbum_types: Make ``get_album`` request the album and track
+                variants concurrently when the release type is unknown.
+            tralbum_type_hints: Number of remembered album/track type hints.
+            band_details_reuse_window: Seconds a band_details payload is reused
+                by the artist methods. 0 disables reuse.
+            json_loads: Function decoding a response body (bytes) into JSON.
+                Defaults to orjson or msgspec when installed, else stdlib json.
+            json_offload_threshold: Body size in bytes from which decoding runs
+                in a worker thread. None always decodes on the event loop.
+            lazy_parsing: Parse artist bios, album/track about, credits and
+                lyrics, and album track lists only when first read.
+            parse_context: Identity map interning repeated strings and
+                sharing one BCArtist per band across parsed responses. Each
+                client gets its own bounded one by default.
+            metrics: Optional collector of per-endpoint latency histograms,
+                status, byte, retry and cache counters. Disabled when not
+                provided.
+            tracer: Optional tracer receiving spans for the connection,
+                upstream wait, download, decode and parse phases: a
+                ``CallbackTracer`` or an OpenTelemetry tracer. Disabled when
+                not provided.
         """
         self._session = session
         self._session_overridden = session is not None
@@ -73,11 +163,31 @@ class BandcampAPIClient:
         self.headers: dict[str, Any] = {"User-Agent": user_agent}
         self.default_retry_after = default_retry_after
         self._fan_id: int | None = None
-        self._parsers = BandcampParsers()
+        self._parsers = BandcampParsers(lazy=lazy_parsing, context=parse_context)
+        self.transport = transport or TransportConfig()
+        self.coalesce_requests = coalesce_requests
+        self._inflight: dict[
+            str, tuple[asyncio.Future[dict[str, Any]], RequestInfo]
+        ] = {}
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.race_tralbum_types = race_tralbum_types
+        self._tralbum_types: LRUDict[tuple[str, str], str] = LRUDict(tralbum_type_hints)
+        self.band_details_reuse_window = band_details_reuse_window
+        self.json_loads = json_loads or default_json_loads()
+        self.json_offload_threshold = json_offload_threshold
+        self.metrics = metrics
+        self.tracer: Tracer = tracer or NoOpTracer()
+        # Network phase spans come from aiohttp hooks on client-owned sessions
+        self._trace_configs = [trace_config(tracer)] if tracer is not None else None
+        self._recent_band_details: LRUDict[str, tuple[float, dict[str, Any]]] = LRUDict(
+            128
+        )
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._session = self._session or aiohttp.ClientSession()
+        await self._ensure_session()
         return self
 
     def session_close(self) -> None:
@@ -85,15 +195,44 @@ class BandcampAPIClient:
         if not self._session_overridden and self._session:
             self._session.close()
 
+    async def close(self) -> None:
+        """Close the session and its connection pool if created by the client."""
+        if not self._session_overridden and self._session:
+            await self._session.close()
+            self._session = None
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        self.session_close()
+        await self.close()
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Ensure we have a session, create if needed."""
-        self._session = self._session or aiohttp.ClientSession()
+        self._session = self._session or self.transport.create_session(
+            self._trace_configs
+        )
         return self._session
 
+    async def warm_up(
+        self,
+        urls: tuple[str, ...] = WARMUP_URLS,
+        connections_per_host: int = 4,
+    ) -> int:
+        """Pre-open keep-alive connections to bandcamp.com and bcbits.com.
+
+        Call once at startup so early requests reuse established TLS
+        connections instead of paying the handshake latency.
+
+        Args:
+            urls: Base URLs of the hosts to connect to.
+            connections_per_host: Connections to open for every URL. Values
+                above ``transport.limit_per_host`` are capped by the pool.
+
+        Returns:
+            Number of connections that were opened successfully.
+        """
+        session = await self._ensure_session()
+        return await warm_up_connections(session, urls, connections_per_host)
+
     def _process_json_response(self, resp_json: dict[str, Any]) -> dict[str, Any]:
         # Check for Bandcamp API errors
         if isinstance(resp_json, dict) and "error" in resp_json:
@@ -108,6 +247,225 @@ class BandcampAPIClient:
         return resp_json
 
     async def _request(self, method: str, url: str, **kwargs) -> dict[str, Any]:
+        endpoint = endpoint_name(url)
+        with self.tracer.start_as_current_span(
+            "bandcamp.request",
+            attributes={"bandcamp.endpoint": endpoint, "http.request.method": method},
+        ) as span:
+            key = request_key(method, url, **kwargs)
+            info = RequestInfo(endpoint=endpoint)
+            shared: RequestInfo | None = None  # info of the call joined by a waiter
+            metrics = self.metrics
+            if metrics is not None:
+                metrics.record_call(endpoint)
+
+            try:
+                if self.cache is not None and self.cache.is_cacheable(endpoint):
+                    body = await self.cache.get(key)
+                    if metrics is not None:
+                        metrics.record_cache(endpoint, hit=body is not None)
+                    if body is not None:
+                        info.from_cache = True
+                        return await self._decode(body)
+
+                if not self.coalesce_requests:
+                    return await self._fetch(key, endpoint, info, method, url, **kwargs)
+
+                # Concurrent identical requests await one shared call. Each waiter
+                # parses its own model from the one shared decoded payload, so
+                # lists and dicts taken from it (e.g. tags) are shared between
+                # those models.
+                inflight = self._inflight.get(key)
+                if inflight is None:
+                    future = asyncio.ensure_future(
+                        self._fetch(key, endpoint, info, method, url, **kwargs)
+                    )
+                    self._inflight[key] = (future, info)
+                    future.add_done_callback(lambda f: self._inflight_done(key, f))
+                else:
+                    future, shared = inflight
+                    if metrics is not None:
+                        metrics.record_coalesced(endpoint)
+
+                # Shield so one cancelled waiter doesn't cancel the call for the rest.
+                return await asyncio.shield(future)
+            finally:
+                if shared is not None:
+                    # Copied once the shared call is done, so its attempts are
+                    # final and the caller that sent it is not marked coalesced
+                    info = replace(shared, coalesced=True)
+                _last_request_info.set({**(_last_request_info.get() or {}), self: info})
+                span.set_attribute("bandcamp.attempts", info.attempts)
+                span.set_attribute("bandcamp.cache_hit", info.from_cache)
+                span.set_attribute("bandcamp.coalesced", info.coalesced)
+
+    def _inflight_done(self, key: str, future: asyncio.Future) -> None:
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight[0] is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Mark the exception retrieved in case every waiter was cancelled.
+            future.exception()
+
+    @property
+    def last_request_info(self) -> RequestInfo | None:
+        """Metadata of the latest API request made from the current task.
+
+        Reports the endpoint, number of HTTP attempts (retries included),
+        and whether the response came from the cache or a coalesced call.
+        """
+        return (_last_request_info.get() or {}).get(self)
+
+    @contextmanager
+    def deadline(self, seconds: float | None) -> Iterator[None]:
+        """Limit each request made in the block to ``seconds``, retries included.
+
+        Overrides ``RetryPolicy.deadline`` for calls made from the current
+        task, and applies without a retry policy too. A request joining an
+        identical in-flight one shares that request's deadline.
+
+        Args:
+            seconds: Time budget per request. None keeps the policy's deadline.
+        """
+        token = _deadline.set({**(_deadline.get() or {}), self: seconds})
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
+
+    async def _fetch(
+        self,
+        key: str,
+        endpoint: str,
+        info: RequestInfo,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Send a request with retries and cache a successful response."""
+        metrics = self.metrics
+        deadline = (_deadline.get() or {}).get(self)
+        if deadline is None and self.retry_policy is not None:
+            deadline = self.retry_policy.deadline
+        started = monotonic()
+        while True:
+            info.attempts += 1
+            try:
+                if deadline is None:
+                    body = await self._send_paced(endpoint, method, url, **kwargs)
+                else:
+                    # The attempt, rate limiter wait included, gets what is left
+                    async with asyncio.timeout(deadline - (monotonic() - started)):
+                        body = await self._send_paced(endpoint, method, url, **kwargs)
+                break
+            except (BandcampAPIError, aiohttp.ClientError, TimeoutError) as e:
+                delay = self._retry_delay(
+                    e, info, method, monotonic() - started, deadline
+                )
+                if delay is None:
+                    raise
+                if metrics is not None:
+                    metrics.record_retry(endpoint)
+            await asyncio.sleep(delay)
+        if metrics is not None:
+            metrics.record_body(endpoint, len(body))
+
+        data = self._process_json_response(await self._decode(body))
+        if self.cache is not None and self.cache.is_cacheable(endpoint):
+            await self.cache.set(key, endpoint, body)
+        return data
+
+    async def _decode(self, body: bytes) -> Any:
+        with self.tracer.start_as_current_span(
+            "bandcamp.decode", attributes={"bandcamp.payload_bytes": len(body)}
+        ):
+            try:
+                return await decode_json(
+                    body, self.json_loads, self.json_offload_threshold
+                )
+            except Exception as e:
+                # Each decoder raises its own error type; an HTML error page or
+                # an empty body must still surface as an API error
+                raise BandcampAPIError(
+                    f"Invalid JSON response ({len(body)} bytes): {e}"
+                ) from e
+
+    def _parse(
+        self, parse: Callable[[dict[str, Any]], T], data: dict[str, Any], items: str
+    ) -> T:
+        """Run a parser inside a ``bandcamp.parse`` span.
+
+        Args:
+            parse: Parser method.
+            data: Decoded payload.
+            items: Payload key of the list reported as the item count.
+        """
+        with self.tracer.start_as_current_span(
+            "bandcamp.parse",
+            attributes={
+                "bandcamp.parser": parse.__name__,
+                "bandcamp.item_count": len(data.get(items) or ()),
+            },
+        ):
+            return parse(data)
+
+    def _retry_delay(
+        self,
+        error: Exception,
+        info: RequestInfo,
+        method: str,
+        elapsed: float,
+        deadline: float | None = None,
+    ) -> float | None:
+        """Return the wait before retrying a failed attempt, or None to raise."""
+        policy = self.retry_policy
+        if policy is None or not is_idempotent(method, info.endpoint):
+            return None
+
+        retry_after = None
+        if isinstance(error, BandcampRateLimitError):
+            if not policy.retry_rate_limited:
+                return None
+            retry_after = error.retry_after
+        elif isinstance(error, aiohttp.ClientResponseError):
+            if error.status not in policy.retry_statuses:
+                return None
+        elif not isinstance(error, (aiohttp.ClientConnectionError, TimeoutError)):
+            return None
+
+        return policy.next_delay(info.attempts, elapsed, retry_after, deadline)
+
+    async def _send_paced(
+        self, endpoint: str, method: str, url: str, **kwargs
+    ) -> bytes:
+        """Send a single request through the rate limiter, if any, and time it."""
+        limiter = self.rate_limiter
+        if limiter is not None:
+            await limiter.acquire(endpoint)
+
+        # Timed from here, so waiting for the rate limiter is not latency
+        started = monotonic()
+        responded = False
+        try:
+            body = await self._send_request(method, url, **kwargs)
+            responded = True
+        except BandcampRateLimitError as e:
+            responded = True
+            if limiter is not None:
+                limiter.on_rate_limited(endpoint, e.retry_after)
+            raise
+        except (BandcampAPIError, aiohttp.ClientResponseError):
+            responded = True
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_attempt(endpoint, monotonic() - started, responded)
+        if limiter is not None:
+            limiter.on_success(endpoint)
+        return body
+
+    async def _send_request(self, method: str, url: str, **kwargs) -> bytes:
+        """Send one HTTP request and return the raw body of a 2xx response."""
         session = await self._ensure_session()
 
         # Add identity cookie if available
@@ -118,26 +476,37 @@ class BandcampAPIClient:
 
         # Dynamically call the appropriate method (get, post, etc.)
         request_method = getattr(session, method.lower())
-        async with request_method(url, **kwargs) as resp:
-            # Handle rate limit (429) before raising for status
-            if resp.status == 429:
-                # Try to get Retry-After header, use default if missing/invalid
-                try:
-                    retry_after = int(
-                        resp.headers.get('Retry-After', str(self.default_retry_after))
+        with self.tracer.start_as_current_span(
+            "bandcamp.http",
+            attributes={"http.request.method": method, "url.full": url},
+        ) as span:
+            async with request_method(url, **kwargs) as resp:
+                span.set_attribute("http.response.status_code", resp.status)
+                if self.metrics is not None:
+                    self.metrics.record_response(endpoint_name(url), resp.status)
+                # Handle rate limit (429) before raising for status
+                if resp.status == 429:
+                    # Try to get Retry-After header, use default if missing/invalid
+                    try:
+                        retry_after = int(
+                            resp.headers.get(
+                                'Retry-After', str(self.default_retry_after)
+                            )
+                        )
+                    except (ValueError, TypeError):
+                        retry_after = self.default_retry_after
+
+                    raise BandcampRateLimitError(
+                        f"Rate limit exceeded (429). Retry after {retry_after} seconds.",
+                        retry_after=retry_after,
                     )
-                except (ValueError, TypeError):
-                    retry_after = self.default_retry_after
-
-                raise BandcampRateLimitError(
-                    f"Rate limit exceeded (429). Retry after {retry_after} seconds.",
-                    retry_after=retry_after,
-                )
 
-            resp.raise_for_status()
-            resp_json = await resp.json()
-
-            return self._process_json_response(resp_json)
+                resp.raise_for_status()
+                # Read bytes once; decoders parse them without a str copy
+                with self.tracer.start_as_current_span("bandcamp.download") as download:
+                    body = await resp.read()
+                    download.set_attribute("bandcamp.payload_bytes", len(body))
+                return body
 
     async def _get(self, **kwargs) -> dict[str, Any]:
         """Make GET request and handle common error cases."""
@@ -167,29 +536,116 @@ class BandcampAPIClient:
         results = data.get("results", [])
 
         output = [self._parsers.parse_search_result_item(item) for item in results]
-        return [_ for _ in output if _]
+        output = [_ for _ in output if _]
+        for item in output:
+            if isinstance(item, SearchResultAlbum):
+                self.remember_tralbum_type(item.artist_id, item.id, "a")
+            elif isinstance(item, SearchResultTrack):
+                self.remember_tralbum_type(item.artist_id, item.id, "t")
+        return output
+
+    @staticmethod
+    def _tralbum_key(band_id: int | str, tralbum_id: int | str) -> tuple[str, str]:
+        return str(band_id), str(tralbum_id)
+
+    def tralbum_type_hint(
+        self, band_id: int | str, tralbum_id: int | str
+    ) -> str | None:
+        """Return the known tralbum type ("a" or "t") of a release, if any."""
+        return self._tralbum_types.get(self._tralbum_key(band_id, tralbum_id))
+
+    def remember_tralbum_type(
+        self, band_id: int | str, tralbum_id: int | str, tralbum_type: str | None
+    ) -> None:
+        """Record whether a release is an album ("a") or a track ("t").
+
+        Hints are seeded automatically from search results, collection items,
+        feed stories and discography entries, and let ``get_album`` request
+        the right type first.
+        """
+        if tralbum_type in ("a", "t") and band_id and tralbum_id:
+            self._tralbum_types[self._tralbum_key(band_id, tralbum_id)] = tralbum_type
 
-    async def get_album(self, artist_id: int | str, album_id: int | str) -> BCAlbum:
+    async def _get_tralbum(
+        self, artist_id: int | str, tralbum_id: int | str, tralbum_type: str
+    ) -> dict[str, Any]:
+        url = f"{self.BASE_URL}/mobile/24/tralbum_details"
+        params = {
+            "band_id": artist_id,
+            "tralbum_id": tralbum_id,
+            "tralbum_type": tralbum_type,
+        }
+        return await self._get(url=url, params=params)
+
+    async def _race_tralbum(
+        self, artist_id: int | str, tralbum_id: int | str
+    ) -> tuple[dict[str, Any], str]:
+        """Request both tralbum types at once and return the first that exists."""
+        tasks = {
+            asyncio.ensure_future(self._get_tralbum(artist_id, tralbum_id, t)): t
+            for t in ("a", "t")
+        }
+        pending = set(tasks)
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        return task.result(), tasks[task]
+                    if error is None or isinstance(error, BandcampNotFoundError):
+                        error = exc
+        finally:
+            for task in pending:
+                task.cancel()
+        raise error  # ty:ignore[invalid-raise]
+
+    async def get_album(
+        self,
+        artist_id: int | str,
+        album_id: int | str,
+        race: bool | None = None,
+    ) -> BCAlbum:
         """Get album details by artist and album ID.
 
+        Single-track releases are served by the track variant of the
+        endpoint. A known type hint decides which variant is requested
+        first; otherwise the album variant is tried before the track one.
+
         Args:
             artist_id: Bandcamp artist/band ID.
             album_id: Bandcamp album ID.
+            race: When the type is unknown, request both variants
+                concurrently instead of one after another. Defaults to the
+                client's ``race_tralbum_types`` setting.
 
         Returns:
             Album object with full details.
         """
-        url = f"{self.BASE_URL}/mobile/24/tralbum_details"
-        params = {"band_id": artist_id, "tralbum_id": album_id, "tralbum_type": "a"}
-
-        try:
-            data = await self._get(url=url, params=params)
-        except BandcampNotFoundError:
-            # Try as a single track instead
-            params["tralbum_type"] = "t"
-            data = await self._get(url=url, params=params)
+        hint = self.tralbum_type_hint(artist_id, album_id)
+        race = self.race_tralbum_types if race is None else race
+
+        with self.tracer.start_as_current_span(
+            "bandcamp.get_album",
+            attributes={"bandcamp.band_id": artist_id, "bandcamp.tralbum_id": album_id},
+        ) as span:
+            if hint is None and race:
+                data, tralbum_type = await self._race_tralbum(artist_id, album_id)
+            else:
+                first, second = ("t", "a") if hint == "t" else ("a", "t")
+                try:
+                    data = await self._get_tralbum(artist_id, album_id, first)
+                    tralbum_type = first
+                except BandcampNotFoundError:
+                    data = await self._get_tralbum(artist_id, album_id, second)
+                    tralbum_type = second
 
-        return self._parsers.parse_album(data)
+            span.set_attribute("bandcamp.tralbum_type", tralbum_type)
+            self.remember_tralbum_type(artist_id, album_id, tralbum_type)
+            return self._parse(self._parsers.parse_album, data, "tracks")
 
     async def get_track(self, artist_id: int | str, track_id: int | str) -> BCTrack:
         """Get track details by artist and track ID.
@@ -201,11 +657,13 @@ class BandcampAPIClient:
         Returns:
             Track object with full details.
         """
-        url = f"{self.BASE_URL}/mobile/24/tralbum_details"
-        params = {"band_id": artist_id, "tralbum_id": track_id, "tralbum_type": "t"}
-
-        data = await self._get(url=url, params=params)
-        return self._parsers.parse_track(data)
+        with self.tracer.start_as_current_span(
+            "bandcamp.get_track",
+            attributes={"bandcamp.band_id": artist_id, "bandcamp.tralbum_id": track_id},
+        ):
+            data = await self._get_tralbum(artist_id, track_id, "t")
+            self.remember_tralbum_type(artist_id, track_id, "t")
+            return self._parse(self._parsers.parse_track, data, "tracks")
 
     async def get_artist(self, artist_id: int | str) -> BCArtist:
         """Get artist/band details by ID.
@@ -216,9 +674,165 @@ class BandcampAPIClient:
         Returns:
             Artist object with full details.
         """
+        with self.tracer.start_as_current_span(
+            "bandcamp.get_artist", attributes={"bandcamp.band_id": artist_id}
+        ):
+            data = await self._band_details(artist_id)
+            return self._parse(self._parsers.parse_artist, data, "discography")
+
+    async def get_artist_with_discography(
+        self, artist_id: int | str
+    ) -> ArtistWithDiscography:
+        """Get artist details and discography with a single request.
+
+        Args:
+            artist_id: Bandcamp artist/band ID.
+
+        Returns:
+            Artist object together with typed discography items.
+        """
+        data = await self._band_details(artist_id)
+        return self._parsers.parse_artist_with_discography(data)
+
+    async def get_albums(
+        self,
+        items: Iterable[tuple[int | str, int | str]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[BatchResult[tuple[int | str, int | str], BCAlbum]]:
+        """Get many albums with bounded concurrency.
+
+        Duplicate pairs are fetched once. A failed album does not stop the
+        others: its result carries the error instead of a value.
+
+        Args:
+            items: (artist_id, album_id) pairs.
+            concurrency: Maximum requests in flight.
+
+        Returns:
+            One BatchResult per input pair, in input order.
+        """
+        return await fetch_batch(map(tuple, items), self._fetch_album_pair, concurrency)
+
+    def iter_albums(
+        self,
+        items: Iterable[tuple[int | str, int | str]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> BatchIterator[tuple[int | str, int | str], BCAlbum]:
+        """Like :meth:`get_albums`, yielding results as they complete."""
+        return BatchIterator(map(tuple, items), self._fetch_album_pair, concurrency)
+
+    async def get_tracks(
+        self,
+        items: Iterable[tuple[int | str, int | str]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[BatchResult[tuple[int | str, int | str], BCTrack]]:
+        """Get many tracks with bounded concurrency.
+
+        Args:
+            items: (artist_id, track_id) pairs.
+            concurrency: Maximum requests in flight.
+
+        Returns:
+            One BatchResult per input pair, in input order.
+        """
+        return await fetch_batch(map(tuple, items), self._fetch_track_pair, concurrency)
+
+    def iter_tracks(
+        self,
+        items: Iterable[tuple[int | str, int | str]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> BatchIterator[tuple[int | str, int | str], BCTrack]:
+        """Like :meth:`get_tracks`, yielding results as they complete."""
+        return BatchIterator(map(tuple, items), self._fetch_track_pair, concurrency)
+
+    async def get_artists(
+        self,
+        artist_ids: Iterable[int | str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[BatchResult[int | str, BCArtist]]:
+        """Get many artists with bounded concurrency.
+
+        Args:
+            artist_ids: Bandcamp artist/band IDs.
+            concurrency: Maximum requests in flight.
+
+        Returns:
+            One BatchResult per input ID, in input order.
+        """
+        return await fetch_batch(artist_ids, self.get_artist, concurrency)
+
+    def iter_artists(
+        self,
+        artist_ids: Iterable[int | str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> BatchIterator[int | str, BCArtist]:
+        """Like :meth:`get_artists`, yielding results as they complete."""
+        return BatchIterator(artist_ids, self.get_artist, concurrency)
+
+    async def _fetch_album_pair(self, pair: tuple[int | str, int | str]) -> BCAlbum:
+        return await self.get_album(*pair)
+
+    async def _fetch_track_pair(self, pair: tuple[int | str, int | str]) -> BCTrack:
+        return await self.get_track(*pair)
+
+    async def _band_details(self, artist_id: int | str) -> dict[str, Any]:
+        """Fetch band_details, reusing a payload fetched moments ago.
+
+        Lets ``get_artist`` and ``get_artist_discography`` called back to
+        back share one request when ``band_details_reuse_window`` is set.
+        """
+        key = str(artist_id)
+        if self.band_details_reuse_window > 0:
+            recent = self._recent_band_details.get(key)
+            if recent is not None:
+                fetched_at, data = recent
+                if monotonic() - fetched_at < self.band_details_reuse_window:
+                    return data
+
         url = f"{self.BASE_URL}/mobile/24/band_details"
         data = await self._post(url=url, json={"band_id": artist_id})
-        return self._parsers.parse_artist(data)
+
+        for entry in data.get("discography", []):
+            item_type = entry.get("item_type") or ""
+            self.remember_tralbum_type(
+                entry.get("band_id", artist_id), entry.get("item_id"), item_type[:1]
+            )
+        if self.band_details_reuse_window > 0:
+            self._recent_band_details[key] = (monotonic(), data)
+        return data
+
+    async def invalidate_tralbum(
+        self, artist_id: int | str, tralbum_id: int | str
+    ) -> None:
+        """Drop cached album and track responses for a release.
+
+        Args:
+            artist_id: Bandcamp artist/band ID.
+            tralbum_id: Bandcamp album or track ID.
+        """
+        if self.cache is None:
+            return
+        url = f"{self.BASE_URL}/mobile/24/tralbum_details"
+        for tralbum_type in ("a", "t"):
+            params = {
+                "band_id": artist_id,
+                "tralbum_id": tralbum_id,
+                "tralbum_type": tralbum_type,
+            }
+            await self.cache.invalidate_key(request_key("GET", url, params=params))
+
+    async def invalidate_artist(self, artist_id: int | str) -> None:
+        """Drop the cached band_details response for an artist.
+
+        Args:
+            artist_id: Bandcamp artist/band ID.
+        """
+        if self.cache is None:
+            return
+        url = f"{self.BASE_URL}/mobile/24/band_details"
+        await self.cache.invalidate_key(
+            request_key("POST", url, json={"band_id": artist_id})
+        )
 
     async def get_collection_summary(self) -> CollectionSummary:
         """Get user's collection summary (requires identity token).
@@ -277,18 +891,100 @@ class BandcampAPIClient:
             BandcampAPIError: If fan_id cannot be determined from the
                 collection summary.
         """
-        if fan_id is None:
-            if not self.identity:
-                raise BandcampMustBeLoggedInError(
-                    "You must be logged in or provide a fan_id to access collection data"
+        fan_id, response_data = await self._collection_page(
+            collection_type, older_than_token, count, fan_id
+        )
+
+        # The JSON key for the item array differs: following endpoints use
+        # "followeers" (Bandcamp's typo), collection/wishlist use "items".
+        if collection_type in self._FOLLOWING_TYPES:
+            raw_items = response_data.get("followeers", [])
+            parser = (
+                self._parsers.parse_following_item
+                if collection_type == CollectionType.FOLLOWING
+                else self._parsers.parse_fan_item
+            )
+            items = [parser(item) for item in raw_items]
+        else:
+            raw_items = response_data.get("items", [])
+            items = [self._parsers.parse_collection_item(item) for item in raw_items]
+            for item in items:
+                self.remember_tralbum_type(
+                    item.band_id, item.item_id, item.tralbum_type
                 )
-            if self._fan_id is None:
-                await self.get_collection_summary()
-            if self._fan_id is None:
-                raise BandcampAPIError(
-                    "Could not determine fan_id from collection summary"
+
+        return CollectionSummary(
+            fan_id=fan_id,
+            items=items,
+            has_more=response_data.get("more_available", False),
+            last_token=self._page_last_token(response_data, raw_items),
+        )
+
+    async def get_collection_columns(
+        self,
+        collection_type: CollectionType = CollectionType.COLLECTION,
+        fan_id: int | None = None,
+        count: int = 500,
+        older_than_token: str | None = None,
+        max_items: int | None = None,
+    ) -> CollectionColumns:
+        """Fetch a whole collection or wishlist into a columnar store.
+
+        Raw items are appended to the columns directly, without building a
+        CollectionItem per item, which keeps million-item libraries compact.
+
+        Args:
+            collection_type: COLLECTION or WISHLIST.
+            fan_id: Fan ID to query. Defaults to the logged-in user.
+            count: Items requested per page.
+            older_than_token: Cursor to start from. Starts at the newest item
+                when not provided.
+            max_items: Stop once at least this many items are stored.
+
+        Returns:
+            CollectionColumns; ``has_more`` and ``last_token`` allow resuming
+            when ``max_items`` cut the walk short.
+
+        Raises:
+            ValueError: If collection_type is a following/followers list.
+        """
+        if collection_type in self._FOLLOWING_TYPES:
+            raise ValueError(
+                f"{collection_type.name} items cannot be stored in columns"
+            )
+
+        columns = CollectionColumns(fan_id)
+        token = older_than_token
+        while True:
+            fan_id, response_data = await self._collection_page(
+                collection_type, token, count, fan_id
+            )
+            raw_items = response_data.get("items", [])
+            columns.extend(raw_items)
+            for raw in raw_items:
+                self.remember_tralbum_type(
+                    raw["band_id"], raw["item_id"], raw.get("tralbum_type")
                 )
-            fan_id = self._fan_id
+            token = self._page_last_token(response_data, raw_items)
+            columns.fan_id = fan_id
+            columns.last_token = token
+            columns.has_more = response_data.get("more_available", False)
+            if not columns.has_more or not raw_items:
+                break
+            if max_items is not None and len(columns) >= max_items:
+                break
+        return columns
+
+    async def _collection_page(
+        self,
+        collection_type: CollectionType,
+        older_than_token: str | None,
+        count: int,
+        fan_id: int | None,
+    ) -> tuple[int, dict[str, Any]]:
+        """Request one raw collection page; returns the resolved fan_id too."""
+        if fan_id is None:
+            fan_id = await self._own_fan_id()
 
         if older_than_token is None:
             older_than_token = str(time()) + ":0:a::"
@@ -301,35 +997,120 @@ class BandcampAPIClient:
             "count": count,
         }
 
-        response_data = await self._post(url=url, json=data)
+        return fan_id, await self._post(url=url, json=data)
 
-        # The JSON key for the item array differs: following endpoints use
-        # "followeers" (Bandcamp's typo), collection/wishlist use "items".
-        if collection_type in self._FOLLOWING_TYPES:
-            raw_items = response_data.get("followeers", [])
-            parser = (
-                self._parsers.parse_following_item
-                if collection_type == CollectionType.FOLLOWING
-                else self._parsers.parse_fan_item
+    async def _own_fan_id(self) -> int:
+        """Return the logged-in fan's ID, requesting the summary if needed."""
+        if not self.identity:
+            raise BandcampMustBeLoggedInError(
+                "You must be logged in or provide a fan_id to access collection data"
             )
-            items = [parser(item) for item in raw_items]
-        else:
-            raw_items = response_data.get("items", [])
-            items = [self._parsers.parse_collection_item(item) for item in raw_items]
-
-        has_more = response_data.get("more_available", False)
+        if self._fan_id is None:
+            await self.get_collection_summary()
+        if self._fan_id is None:
+            raise BandcampAPIError("Could not determine fan_id from collection summary")
+        return self._fan_id
 
+    @staticmethod
+    def _page_last_token(
+        response_data: dict[str, Any], raw_items: list[dict[str, Any]]
+    ) -> str | None:
         # Use the last item's token as the pagination cursor — the
         # response-level "last_token" overshoots and causes duplicates.
-        last_token = response_data.get("last_token")
         if raw_items and "token" in raw_items[-1]:
-            last_token = raw_items[-1]["token"]
+            return raw_items[-1]["token"]
+        return response_data.get("last_token")
 
-        return CollectionSummary(
-            fan_id=fan_id,
-            items=items,
-            has_more=has_more,
-            last_token=last_token,
+    def iter_collection(
+        self,
+        collection_type: CollectionType = CollectionType.COLLECTION,
+        fan_id: int | None = None,
+        count: int = 50,
+        older_than_token: str | None = None,
+        prefetch: int = 1,
+    ) -> CollectionIterator:
+        """Iterate over every item of a collection, newest first.
+
+        The next page is requested while the current one is being consumed.
+        The iterator's ``cursor`` can be passed back as ``older_than_token``
+        to resume an interrupted walk.
+
+        Args:
+            collection_type: Collection type (COLLECTION, WISHLIST, FOLLOWING,
+                FOLLOWING_FANS, or FOLLOWERS).
+            fan_id: Fan ID to query. Defaults to the logged-in user.
+            count: Items per page.
+            older_than_token: Cursor to resume from.
+            prefetch: Pages fetched ahead of the consumer. 0 disables
+                prefetching.
+
+        Returns:
+            Async iterator of collection items.
+        """
+        return CollectionIterator(
+            self, collection_type, fan_id, count, older_than_token, prefetch
+        )
+
+    def hydrate_collection(
+        self,
+        collection_type: CollectionType = CollectionType.COLLECTION,
+        fan_id: int | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_pending: int | None = None,
+        on_progress: ProgressCallback | None = None,
+        items: AsyncIterable[CollectionItem] | None = None,
+    ) -> CollectionHydrator:
+        """Walk a collection and yield each item with its full album or track.
+
+        Pages are only requested as fast as albums and tracks are fetched
+        and consumed. Failed lookups are yielded with their error instead of
+        stopping the walk.
+
+        Args:
+            collection_type: COLLECTION or WISHLIST.
+            fan_id: Fan ID to query. Defaults to the logged-in user.
+            concurrency: Maximum album/track requests in flight.
+            max_pending: Finished results buffered for the consumer.
+            on_progress: Called with HydrationProgress after every item.
+            items: Collection items to hydrate instead of walking the
+                collection, e.g. an iterator resumed from a saved cursor.
+
+        Returns:
+            Async iterator of HydratedItem.
+        """
+        if collection_type in self._FOLLOWING_TYPES:
+            raise ValueError(f"{collection_type.name} items cannot be hydrated")
+        if items is None:
+            items = self.iter_collection(collection_type, fan_id)
+        return CollectionHydrator(self, items, concurrency, max_pending, on_progress)
+
+    async def sync_collection(
+        self,
+        store: SyncStateStore,
+        collection_type: CollectionType = CollectionType.COLLECTION,
+        fan_id: int | None = None,
+        full: bool = False,
+        count: int = 50,
+    ) -> SyncDelta:
+        """Fetch what changed in a collection since the last sync.
+
+        Pages are requested only until an already known item is reached;
+        the newest token and the known item keys are saved to ``store``.
+
+        Args:
+            store: Persistence for the per fan and type sync state, e.g.
+                JSONFileSyncStore.
+            collection_type: Collection type to sync.
+            fan_id: Fan ID to sync. Defaults to the logged-in user.
+            full: Walk the whole collection to also detect removed items.
+            count: Items per page.
+
+        Returns:
+            SyncDelta with the added items (and removed item keys on a full
+            sync).
+        """
+        return await sync_collection(
+            self, store, collection_type, fan_id, full=full, count=count
         )
 
     async def get_artist_discography(
@@ -344,16 +1125,36 @@ class BandcampAPIClient:
             artist_id: Bandcamp artist/band ID.
 
         Returns:
-            List of discography items with type and IDs.
+            List of discography items with type and IDs. Use
+            ``get_artist_with_discography`` for parsed models.
         """
         # Note: Using mobile/24/band_details instead of band/3/discography
         # because it provides more complete data including tracks
-        artist_data = await self._post(
-            url=f"{self.BASE_URL}/mobile/24/band_details", json={"band_id": artist_id}
-        )
-
+        artist_data = await self._band_details(artist_id)
         return artist_data.get("discography", [])
 
+    def watch_feed(
+        self,
+        callback: StoryCallback | None = None,
+        queue: asyncio.Queue | None = None,
+        **kwargs: Any,
+    ) -> FeedWatcher:
+        """Create a watcher delivering new feed stories as they appear.
+
+        Use as ``async with client.watch_feed(queue=queue):`` or call
+        ``start()``/``stop()``. Keyword arguments (intervals, ``since``,
+        ``deliver_existing``, ...) are passed to :class:`FeedWatcher`.
+
+        Args:
+            callback: Coroutine function called with each new story and its
+                featured track (None when not listed).
+            queue: Queue receiving each new (story, track) pair.
+
+        Returns:
+            FeedWatcher, not started yet.
+        """
+        return FeedWatcher(self, callback=callback, queue=queue, **kwargs)
+
     async def get_feed(
         self,
         older_than: int | None = None,
@@ -367,6 +1168,38 @@ class BandcampAPIClient:
         :param older_than: Unix timestamp for pagination. Returns stories
             older than this timestamp. Defaults to current time.
         """
+        response_data = await self._feed_page(older_than)
+        feed = self._parsers.parse_feed_response(response_data)
+        self._remember_story_types(feed.stories)
+        return feed
+
+    def iter_feed(
+        self,
+        older_than: int | None = None,
+        until: int | None = None,
+        max_stories: int | None = None,
+        prefetch: int = 1,
+    ) -> FeedIterator:
+        """Iterate over the feed history, newest first.
+
+        The next page is requested while the current one is being consumed.
+        ``fan_info`` and ``band_info`` of every page are merged into the
+        iterator's lookup tables; entries already known are not parsed again.
+
+        Args:
+            older_than: Unix timestamp to start from. Defaults to now.
+            until: Stop at stories older than this Unix timestamp.
+            max_stories: Stop after this many stories.
+            prefetch: Pages fetched ahead of the consumer. 0 disables
+                prefetching.
+
+        Returns:
+            Async iterator of (FeedStory, FeedTrack | None) pairs.
+        """
+        return FeedIterator(self, older_than, until, max_stories, prefetch)
+
+    async def _feed_page(self, older_than: int | None) -> dict[str, Any]:
+        """Request one raw feed page."""
         if not self.identity:
             raise BandcampMustBeLoggedInError(
                 "You must be logged in to access feed data"
@@ -379,11 +1212,16 @@ class BandcampAPIClient:
         if older_than is None:
             older_than = int(time())
 
-        url = "https://bandcamp.com/fan_dash_feed_updates"
+        url = self.FEED_URL
         form_data = {
             "fan_id": str(self._fan_id),
             "older_than": str(older_than),
         }
 
-        response_data = await self._post(url=url, data=form_data)
-        return self._parsers.parse_feed_response(response_data)
+        return await self._post(url=url, data=form_data)
+
+    def _remember_story_types(self, stories: list[FeedStory]) -> None:
+        for story in stories:
+            self.remember_tralbum_type(
+                story.band_id, story.tralbum_id, story.tralbum_type
+            )
@@ -0,0 +1,251 @@
+"""Column-oriented storage for large collections."""
+
+import math
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .models import CollectionItem
+
+# Stored in integer columns in place of a missing (None) value.
+MISSING = -1
+
+_INT_COLUMNS = ("item_id", "band_id", "art_id", "num_streamable_tracks")
+_CATEGORY_COLUMNS = ("item_type", "tralbum_type", "band_name")
+_TEXT_COLUMNS = ("item_title", "item_url", "token")
+
+
+class CategoryColumn:
+    """Dictionary-encoded string column.
+
+    Each distinct value is stored once; rows hold a small integer code into
+    ``values``. Filtering compares codes, not strings.
+    """
+
+    def __init__(self):
+        """Initialize an empty column."""
+        self.codes = array("I")
+        self.values: list[str | None] = []
+        self._index: dict[str | None, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> str | None:
+        return self.values[self.codes[row]]
+
+    def code(self, value: str | None) -> int | None:
+        """Return the code of ``value``, or None if no row holds it."""
+        return self._index.get(value)
+
+    def append(self, value: str | None) -> None:
+        """Add a row."""
+        code = self._index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._index[value] = code
+        self.codes.append(code)
+
+    def to_list(self) -> list[str | None]:
+        """Return the decoded column; rows share the stored strings."""
+        values = self.values
+        return [values[code] for code in self.codes]
+
+
+class CollectionColumns:
+    """Collection items stored column by column.
+
+    Integer fields live in ``array('q')`` buffers (``MISSING`` marks None),
+    which NumPy can wrap without copying (``numpy.frombuffer(columns.item_id,
+    dtype=numpy.int64)``). ``item_type``, ``tralbum_type`` and ``band_name``
+    are dictionary-encoded :class:`CategoryColumn` objects. No
+    :class:`CollectionItem` exists until a row is materialized with
+    :meth:`item` or :meth:`CollectionRow.to_item`.
+    """
+
+    def __init__(self, fan_id: int | None = None):
+        """Initialize an empty store.
+
+        Args:
+            fan_id: Fan the items belong to.
+        """
+        self.fan_id = fan_id
+        self.has_more = False
+        self.last_token: str | None = None
+
+        self.item_id = array("q")
+        self.band_id = array("q")
+        self.art_id = array("q")
+        self.num_streamable_tracks = array("q")
+        self.item_type = CategoryColumn()
+        self.tralbum_type = CategoryColumn()
+        self.band_name = CategoryColumn()
+        self.item_title: list[str] = []
+        self.item_url: list[str] = []
+        self.token: list[str | None] = []
+        self.is_purchasable = array("b")
+        self.price = array("d")  # NaN marks a missing price
+
+    def __len__(self) -> int:
+        return len(self.item_id)
+
+    def __getitem__(self, row: int) -> "CollectionRow":
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("row index out of range")
+        return CollectionRow(self, row)
+
+    def __iter__(self) -> Iterator["CollectionRow"]:
+        for row in range(len(self)):
+            yield CollectionRow(self, row)
+
+    def append(self, data: dict[str, Any]) -> None:
+        """Add one raw item from a collection/wishlist API response."""
+        self.item_id.append(data["item_id"])
+        self.band_id.append(data["band_id"])
+        self.art_id.append(_int_or_missing(data.get("art_id")))
+        self.num_streamable_tracks.append(
+            _int_or_missing(data.get("num_streamable_tracks"))
+        )
+        self.item_type.append(data.get("item_type", ""))
+        self.tralbum_type.append(data.get("tralbum_type"))
+        self.band_name.append(data.get("band_name", ""))
+        self.item_title.append(data.get("item_title", ""))
+        self.item_url.append(data.get("item_url", ""))
+        self.token.append(data.get("token"))
+        self.is_purchasable.append(bool(data.get("is_purchasable", False)))
+        price = data.get("price")
+        self.price.append(math.nan if price is None else price)
+
+    def extend(self, items: Iterable[dict[str, Any]]) -> None:
+        """Add raw items from a collection/wishlist API response."""
+        for data in items:
+            self.append(data)
+
+    def value(self, name: str, row: int) -> Any:
+        """Return one field of one row as CollectionItem would hold it."""
+        if name in _INT_COLUMNS:
+            value = getattr(self, name)[row]
+            return None if value == MISSING else value
+        if name == "is_purchasable":
+            return bool(self.is_purchasable[row])
+        if name == "price":
+            price = self.price[row]
+            return None if math.isnan(price) else price
+        if name in _CATEGORY_COLUMNS or name in _TEXT_COLUMNS:
+            return getattr(self, name)[row]
+        raise AttributeError(name)
+
+    def item(self, row: int) -> CollectionItem:
+        """Materialize one row as a CollectionItem."""
+        return CollectionItem(
+            item_type=self.item_type[row],
+            item_id=self.item_id[row],
+            band_id=self.band_id[row],
+            tralbum_type=self.tralbum_type[row],
+            band_name=self.band_name[row],
+            item_title=self.item_title[row],
+            item_url=self.item_url[row],
+            art_id=self.value("art_id", row),
+            num_streamable_tracks=self.value("num_streamable_tracks", row),
+            is_purchasable=bool(self.is_purchasable[row]),
+            price=self.value("price", row),
+            token=self.token[row],
+        )
+
+    def items(self) -> list[CollectionItem]:
+        """Materialize every row."""
+        return [self.item(row) for row in range(len(self))]
+
+    def rows(self, band_id: int | None = None, item_type: str | None = None) -> array:
+        """Return the indexes of rows matching every given filter.
+
+        Args:
+            band_id: Keep rows of this band.
+            item_type: Keep rows of this item type ("album", "track", ...).
+        """
+        selected: Iterable[int] = range(len(self))
+        if item_type is not None:
+            code = self.item_type.code(item_type)
+            if code is None:
+                return array("q")
+            codes = self.item_type.codes
+            selected = [row for row in selected if codes[row] == code]
+        if band_id is not None:
+            band_ids = self.band_id
+            selected = [row for row in selected if band_ids[row] == band_id]
+        return array("q", selected)
+
+    def filter(
+        self, band_id: int | None = None, item_type: str | None = None
+    ) -> "CollectionColumns":
+        """Return a new store with the rows matching every given filter."""
+        return self.take(self.rows(band_id=band_id, item_type=item_type))
+
+    def take(self, rows: Iterable[int]) -> "CollectionColumns":
+        """Return a new store with the given rows, in the given order."""
+        result = CollectionColumns(self.fan_id)
+        for row in rows:
+            for name in _INT_COLUMNS:
+                getattr(result, name).append(getattr(self, name)[row])
+            for name in _CATEGORY_COLUMNS:
+                getattr(result, name).append(getattr(self, name)[row])
+            for name in _TEXT_COLUMNS:
+                getattr(result, name).append(getattr(self, name)[row])
+            result.is_purchasable.append(self.is_purchasable[row])
+            result.price.append(self.price[row])
+        return result
+
+    def to_columns(self) -> dict[str, array | list]:
+        """Export every column without building per-row objects.
+
+        Integer, boolean and price columns are returned as the underlying
+        arrays (not copies); string columns as lists sharing the stored
+        strings.
+        """
+        columns: dict[str, array | list] = {
+            name: getattr(self, name) for name in _INT_COLUMNS
+        }
+        for name in _CATEGORY_COLUMNS:
+            columns[name] = getattr(self, name).to_list()
+        for name in _TEXT_COLUMNS:
+            columns[name] = getattr(self, name)
+        columns["is_purchasable"] = self.is_purchasable
+        columns["price"] = self.price
+        return columns
+
+
+class CollectionRow:
+    """Lightweight view of one row of a CollectionColumns store.
+
+    Field access reads straight from the columns; :meth:`to_item` builds
+    the equivalent CollectionItem.
+    """
+
+    __slots__ = ("_columns", "_row")
+
+    def __init__(self, columns: CollectionColumns, row: int):
+        """Initialize the view.
+
+        Args:
+            columns: Store the row belongs to.
+            row: Row index.
+        """
+        self._columns = columns
+        self._row = row
+
+    def __getattr__(self, name: str) -> Any:
+        return self._columns.value(name, self._row)
+
+    def __repr__(self) -> str:
+        return f"CollectionRow({self._row}, item_id={self.item_id})"
+
+    def to_item(self) -> CollectionItem:
+        """Materialize the row as a CollectionItem."""
+        return self._columns.item(self._row)
+
+
+def _int_or_missing(value: int | None) -> int:
+    return MISSING if value is None else value
@@ -0,0 +1,50 @@
+"""JSON decoding with optional fast backends."""
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+type JSONLoads = Callable[[bytes], Any]
+
+# Bodies at least this large are decoded in a worker thread by default.
+DEFAULT_OFFLOAD_THRESHOLD = 1024 * 1024
+
+
+def default_json_loads() -> JSONLoads:
+    """Return the fastest installed JSON decoder.
+
+    Prefers ``orjson``, then ``msgspec``, falling back to the standard
+    library. All of them accept the raw response bytes directly.
+    """
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return orjson.loads
+
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        return msgspec.json.decode
+
+    return json.loads
+
+
+async def decode_json(
+    body: bytes, loads: JSONLoads, offload_threshold: int | None = None
+) -> Any:
+    """Decode a response body, off the event loop when it is large.
+
+    Args:
+        body: Raw response bytes.
+        loads: Decoder to use.
+        offload_threshold: Size in bytes from which decoding runs in a
+            worker thread. None always decodes inline.
+    """
+    if offload_threshold is not None and len(body) >= offload_threshold:
+        return await asyncio.to_thread(loads, body)
+    return loads(body)
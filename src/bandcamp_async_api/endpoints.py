@@ -0,0 +1,58 @@
+"""Endpoint naming and request identity helpers."""
+
+from json import dumps
+from typing import Any
+from urllib.parse import urlsplit
+
+# Canonical endpoint names keyed by the URL path segment that identifies them.
+_ENDPOINT_NAMES = {
+    "app_autocomplete": "search",
+    "tralbum_details": "tralbum_details",
+    "band_details": "band_details",
+    "collection_summary": "collection_summary",
+    "fan_dash_feed_updates": "feed",
+}
+
+
+def endpoint_name(url: str) -> str:
+    """Return the canonical endpoint name for a Bandcamp API URL.
+
+    Collection endpoints keep their collection type, e.g.
+    ``fancollection/collection_items``; unknown URLs fall back to their last
+    path segment.
+    """
+    segments = [s for s in urlsplit(url).path.split("/") if s]
+    if not segments:
+        return ""
+    if "fancollection" in segments:
+        return f"fancollection/{segments[-1]}"
+    return _ENDPOINT_NAMES.get(segments[-1], segments[-1])
+
+
+def request_key(
+    method: str,
+    url: str,
+    params: dict[str, Any] | None = None,
+    json: Any = None,
+    data: dict[str, Any] | None = None,
+    **_: Any,
+) -> str:
+    """Build a stable identity string for a request.
+
+    Two requests with the same key are interchangeable: same endpoint,
+    method, URL and payload. Query and form values are compared as strings
+    since that is how they go over the wire; so are the top-level numbers of
+    a JSON object body, since IDs are accepted both as numbers and strings.
+    """
+    if isinstance(json, dict):
+        json = {
+            k: str(v) if isinstance(v, int | float) and not isinstance(v, bool) else v
+            for k, v in json.items()
+        }
+    payload = {
+        "params": {k: str(v) for k, v in (params or {}).items()},
+        "json": json,
+        "data": {k: str(v) for k, v in (data or {}).items()},
+    }
+    encoded = dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{endpoint_name(url)}|{method.upper()}|{url}|{encoded}"
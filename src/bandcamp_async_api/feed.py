@@ -0,0 +1,276 @@
+"""Watching the fan dash feed for new stories."""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+from .models import FeedBandInfo, FeedFanInfo, FeedResponse, FeedStory, FeedTrack
+from .pagination import PrefetchIterator
+from .utils import LRUDict
+
+if TYPE_CHECKING:
+    from .client import BandcampAPIClient
+
+_LOGGER = logging.getLogger(__name__)
+
+type StoryKey = tuple[str, int, int]
+type FeedEntry = tuple[FeedStory, FeedTrack | None]
+type StoryCallback = Callable[[FeedStory, FeedTrack | None], Awaitable[None]]
+
+
+def story_key(story: FeedStory) -> StoryKey:
+    """Return the key identifying a story: (story_type, fan_id, item_id)."""
+    return story.story_type, story.fan_id, story.item_id
+
+
+def story_timestamp(story: FeedStory) -> int | None:
+    """Return the story date as a Unix timestamp, or None if unparsable."""
+    try:
+        return int(parsedate_to_datetime(story.story_date).timestamp())
+    except (TypeError, ValueError):
+        return None
+
+
+def feed_entries(feed: FeedResponse) -> list[FeedEntry]:
+    """Pair every story of a feed page with its featured track, if listed."""
+    return [(story, feed.track_for(story)) for story in feed.stories]
+
+
+class FeedWatcher:
+    """Polls the feed and delivers stories that were not seen before.
+
+    The newest story date seen so far is the high-water mark: each poll
+    reads the newest page (and older pages while every story on them is
+    new, up to ``max_pages``) and delivers stories at or after the mark
+    whose (story_type, fan_id, item_id) was not delivered yet. The interval
+    between polls doubles while nothing new arrives, up to
+    ``max_interval``, and drops back to ``min_interval`` as soon as
+    something does. Request errors are logged and treated as an idle poll.
+
+    New (story, track) pairs are passed to ``callback`` and/or put on
+    ``queue``; the track is None when the page did not list the story's
+    featured track.
+    """
+
+    def __init__(
+        self,
+        client: "BandcampAPIClient",
+        callback: StoryCallback | None = None,
+        queue: asyncio.Queue | None = None,
+        min_interval: float = 60.0,
+        max_interval: float = 900.0,
+        backoff_factor: float = 2.0,
+        max_pages: int = 5,
+        deliver_existing: bool = False,
+        since: int | None = None,
+        dedupe_size: int = 10000,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            client: Logged-in client used to read the feed.
+            callback: Coroutine function called with each new story and its
+                featured track.
+            queue: Queue receiving each new (story, track) pair.
+            min_interval: Seconds between polls while stories keep coming.
+            max_interval: Upper bound for the idle poll interval.
+            backoff_factor: Interval multiplier after a poll with nothing new.
+            max_pages: Pages read per poll when catching up.
+            deliver_existing: Deliver the stories of the first poll. By
+                default they only set the high-water mark.
+            since: Initial high-water mark (Unix time), e.g. saved from a
+                previous run's ``high_water``.
+            dedupe_size: Story keys remembered for deduplication.
+        """
+        self.client = client
+        self.callback = callback
+        self.queue = queue
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.max_pages = max_pages
+        self.deliver_existing = deliver_existing or since is not None
+        self.high_water = since
+        self.interval = min_interval
+        self.polls = 0
+        self.last_error: Exception | None = None
+        self._seen: LRUDict[StoryKey, None] = LRUDict(dedupe_size)
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    def _is_new(self, story: FeedStory) -> bool:
+        if story_key(story) in self._seen:
+            return False
+        if self.high_water is None:
+            return True
+        timestamp = story_timestamp(story)
+        return timestamp is None or timestamp >= self.high_water
+
+    async def _read_new(self) -> list[FeedEntry]:
+        """Read pages until reaching known stories; return the new ones."""
+        new: list[FeedEntry] = []
+        newest = self.high_water
+        older_than = None
+        for _ in range(self.max_pages):
+            feed = await self.client.get_feed(older_than=older_than)
+            entries = feed_entries(feed)
+            fresh = [entry for entry in entries if self._is_new(entry[0])]
+            new.extend(fresh)
+            if feed.newest_story_date is not None:
+                newest = max(newest or 0, feed.newest_story_date)
+            # Keep paging only while the whole page was new
+            if (
+                self.high_water is None
+                or len(fresh) < len(entries)
+                or not feed.has_more
+                or feed.oldest_story_date is None
+            ):
+                break
+            older_than = feed.oldest_story_date
+        self.high_water = newest
+        return new
+
+    async def poll_once(self) -> list[FeedEntry]:
+        """Poll now, deliver new stories and return them (oldest first)."""
+        first_poll = self.polls == 0
+        self.polls += 1
+        new = await self._read_new()
+        for story, _ in new:
+            self._seen[story_key(story)] = None
+        if first_poll and not self.deliver_existing:
+            return []
+
+        new.reverse()
+        for story, track in new:
+            if self.callback is not None:
+                try:
+                    await self.callback(story, track)
+                except Exception:
+                    _LOGGER.exception("Feed callback failed for %s", story_key(story))
+            if self.queue is not None:
+                await self.queue.put((story, track))
+        return new
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                new = await self.poll_once()
+                self.last_error = None
+            except Exception as e:  # noqa: BLE001
+                # Network and API errors alike: retry after an idle interval
+                _LOGGER.warning("Feed poll failed: %s", e)
+                self.last_error = e
+                new = []
+            if new:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(
+                    self.max_interval, self.interval * self.backoff_factor
+                )
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start polling in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+
+class FeedIterator(PrefetchIterator[FeedEntry]):
+    """Async iterator over the feed history as (story, featured track) pairs.
+
+    ``fan_info`` and ``band_info`` grow as pages arrive: one int-keyed table
+    for the whole walk, in which entries repeated by later pages are not
+    parsed again. ``cursor`` holds the date of the last yielded story (the
+    starting ``older_than`` before the first one), so an interrupted walk
+    resumes with the stories older than it. Dates have one-second
+    resolution: unyielded stories sharing the last yielded story's second
+    are skipped by such a resume.
+    """
+
+    def __init__(
+        self,
+        client: "BandcampAPIClient",
+        older_than: int | None = None,
+        until: int | None = None,
+        max_stories: int | None = None,
+        prefetch: int = 1,
+    ):
+        """Initialize the iterator.
+
+        Args:
+            client: Logged-in client used to request pages.
+            older_than: Unix timestamp to start from. Defaults to now.
+            until: Stop at the first story older than this Unix timestamp.
+            max_stories: Stop after this many stories.
+            prefetch: Pages fetched ahead of the consumer.
+        """
+        super().__init__(prefetch)
+        self.client = client
+        self.cursor = older_than
+        self._older_than = older_than
+        self.until = until
+        self.max_stories = max_stories
+        self.stories_yielded = 0
+        self.fan_info: dict[int, FeedFanInfo] = {}
+        self.band_info: dict[int, FeedBandInfo] = {}
+
+    async def _fetch_page(self) -> list[FeedEntry]:
+        data = await self.client._feed_page(self._older_than)
+        self.pages_fetched += 1
+        parsers = self.client._parsers
+        stories_data = data.get("stories", {})
+        stories = [parsers.parse_feed_story(e) for e in stories_data.get("entries", [])]
+        tracks = {
+            track.track_id: track
+            for track in map(
+                parsers.parse_feed_track, stories_data.get("track_list", [])
+            )
+        }
+        parsers.merge_feed_lookups(data, self.fan_info, self.band_info)
+        self.client._remember_story_types(stories)
+
+        oldest = stories_data.get("oldest_story_date")
+        if (
+            not stories
+            or not oldest
+            or (self.until is not None and oldest < self.until)
+        ):
+            self._exhausted = True
+        self._older_than = oldest
+        return [(story, tracks.get(story.featured_track)) for story in stories]
+
+    def _page_items(self, page: list[FeedEntry]) -> list[FeedEntry]:
+        return page
+
+    async def __anext__(self) -> FeedEntry:
+        if self.max_stories is not None and self.stories_yielded >= self.max_stories:
+            await self.aclose()
+            raise StopAsyncIteration
+        entry = await super().__anext__()
+        timestamp = story_timestamp(entry[0])
+        if self.until is not None and timestamp is not None and timestamp < self.until:
+            await self.aclose()
+            self._buffer.clear()
+            self._finished = True
+            raise StopAsyncIteration
+        if timestamp is not None:
+            self.cursor = timestamp
+        self.stories_yielded += 1
+        return entry
@@ -0,0 +1,160 @@
+"""Turning collection items into full album and track models."""
+
+import asyncio
+import inspect
+from collections.abc import AsyncIterable, Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .batch import DEFAULT_CONCURRENCY
+from .models import BCAlbum, BCTrack, CollectionItem
+from .utils import DONE, BackgroundTaskIterator
+
+if TYPE_CHECKING:
+    from .client import BandcampAPIClient
+
+
+@dataclass(slots=True)
+class HydratedItem:
+    """A collection item together with its full model, or the fetch error."""
+
+    item: CollectionItem
+    model: BCAlbum | BCTrack | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the model was fetched successfully."""
+        return self.error is None
+
+
+@dataclass(slots=True)
+class HydrationProgress:
+    """Counters reported to the progress callback."""
+
+    items_read: int = 0  # items taken from the collection so far
+    hydrated: int = 0
+    failed: int = 0
+    pages_fetched: int = 0
+
+    @property
+    def done(self) -> int:
+        """Items whose fetch has finished, successfully or not."""
+        return self.hydrated + self.failed
+
+
+type ProgressCallback = Callable[[HydrationProgress], Awaitable[None] | None]
+
+
+class CollectionHydrator(BackgroundTaskIterator[HydratedItem]):
+    """Async iterator yielding a HydratedItem per collection item.
+
+    ``concurrency`` workers take items from the source iterator and fetch
+    the album or track of each. Results are yielded in completion order.
+    At most ``max_pending`` finished results wait for the consumer; when
+    they are not consumed the workers stop taking items, so the source
+    stops requesting pages. Album and track requests go through the
+    client, so its response cache, coalescing and rate limiter apply.
+    Closing it also closes the source, stopping its page fetching.
+    """
+
+    def __init__(
+        self,
+        client: "BandcampAPIClient",
+        items: AsyncIterable[CollectionItem],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_pending: int | None = None,
+        on_progress: ProgressCallback | None = None,
+    ):
+        """Initialize the hydrator.
+
+        Args:
+            client: Client used to fetch albums and tracks.
+            items: Collection items to hydrate, e.g. ``client.iter_collection()``.
+            concurrency: Maximum album/track requests in flight.
+            max_pending: Finished results buffered for the consumer. Defaults
+                to ``concurrency``.
+            on_progress: Called (and awaited, if it returns an awaitable)
+                with the progress counters after every finished item.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        super().__init__()
+        self.client = client
+        self.items = items
+        self.concurrency = concurrency
+        self.on_progress = on_progress
+        self.progress = HydrationProgress()
+        self._source = aiter(items)
+        self._source_lock = asyncio.Lock()
+        self._source_exhausted = False
+        self._results: asyncio.Queue = asyncio.Queue(maxsize=max_pending or concurrency)
+        self._running = 0
+        self._finished = False
+
+    async def hydrate(self, item: CollectionItem) -> BCAlbum | BCTrack:
+        """Fetch the full model of one collection item."""
+        if (item.tralbum_type or item.item_type[:1]) == "t":
+            return await self.client.get_track(item.band_id, item.item_id)
+        return await self.client.get_album(item.band_id, item.item_id)
+
+    async def _next_item(self) -> CollectionItem | None:
+        async with self._source_lock:
+            if self._source_exhausted:
+                return None
+            try:
+                item = await anext(self._source)
+            except StopAsyncIteration:
+                self._source_exhausted = True
+                return None
+        self.progress.items_read += 1
+        self.progress.pages_fetched = getattr(self.items, "pages_fetched", 0)
+        return item
+
+    async def _work(self) -> None:
+        try:
+            while (item := await self._next_item()) is not None:
+                try:
+                    result = HydratedItem(item, await self.hydrate(item))
+                    self.progress.hydrated += 1
+                except Exception as e:  # noqa: BLE001
+                    result = HydratedItem(item, error=e)
+                    self.progress.failed += 1
+                if self.on_progress is not None:
+                    maybe_awaitable = self.on_progress(self.progress)
+                    if inspect.isawaitable(maybe_awaitable):
+                        await maybe_awaitable
+                # Blocks while max_pending results wait for the consumer
+                await self._results.put(result)
+        except Exception as e:  # noqa: BLE001
+            # Source errors are re-raised in the consumer by __anext__
+            await self._results.put(e)
+        self._running -= 1
+        if not self._running:
+            await self._results.put(DONE)
+
+    async def __anext__(self) -> HydratedItem:
+        if self._finished:
+            raise StopAsyncIteration
+        if not self._tasks:
+            self._running = self.concurrency
+            self._tasks = [
+                asyncio.create_task(self._work()) for _ in range(self.concurrency)
+            ]
+        result = await self._results.get()
+        if result is DONE:
+            self._finished = True
+            await self.aclose()
+            raise StopAsyncIteration
+        if isinstance(result, Exception):
+            self._finished = True
+            await self.aclose()
+            raise result
+        return result
+
+    async def aclose(self) -> None:
+        """Stop the workers and close the source iterator."""
+        await super().aclose()
+        aclose = getattr(self._source, "aclose", None)
+        if aclose is not None:
+            await aclose()
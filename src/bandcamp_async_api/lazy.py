@@ -0,0 +1,133 @@
+"""Models whose heavy fields are parsed on first access."""
+
+from collections.abc import Callable, Iterable
+from dataclasses import fields
+from typing import TYPE_CHECKING, Any
+
+from .models import BCAlbum, BCArtist, BCTrack
+
+if TYPE_CHECKING:
+    from .parsers import BandcampParsers
+
+
+class LazyField:
+    """Descriptor that fills a dataclass slot from the raw payload on first read.
+
+    Wraps the slot inherited from the model class. Until the field is read
+    or assigned, the slot holds a placeholder and the instance keeps the
+    raw payload it was parsed from.
+    """
+
+    def __init__(self, loader: Callable[[Any], Any]):
+        """Initialize the descriptor.
+
+        Args:
+            loader: Called with the instance; returns the field value built
+                from ``instance._raw``.
+        """
+        self.loader = loader
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.slot = next(
+            base.__dict__[name] for base in owner.__mro__[1:] if name in base.__dict__
+        )
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        pending = getattr(obj, "_pending", None)
+        if pending and self.name in pending:
+            self.slot.__set__(obj, self.loader(obj))
+            obj._resolved(self.name)
+        return self.slot.__get__(obj, objtype)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self.slot.__set__(obj, value)
+        pending = getattr(obj, "_pending", None)
+        if pending and self.name in pending:
+            obj._resolved(self.name)
+
+
+class LazyModel:
+    """Mixin keeping the raw payload until every lazy field is resolved.
+
+    Subclasses declare the ``_raw``, ``_parsers`` and ``_pending`` slots.
+    """
+
+    __slots__ = ()
+
+    _raw: dict[str, Any] | None
+    _parsers: "BandcampParsers | None"
+    _pending: set[str] | None
+
+    def defer(
+        self, raw: dict[str, Any], parsers: "BandcampParsers", names: Iterable[str]
+    ) -> None:
+        """Mark fields to be parsed from ``raw`` when first read."""
+        self._raw = raw
+        self._parsers = parsers
+        self._pending = set(names)
+
+    def _resolved(self, name: str) -> None:
+        pending = self._pending
+        pending.discard(name)
+        if not pending:
+            # Nothing left to parse: let the payload be freed
+            self._raw = self._parsers = self._pending = None
+
+    def __eq__(self, other: object) -> bool:
+        # The dataclass __eq__ requires the exact same class; compare as the
+        # eager model instead, so lazy and eager parses of a payload match
+        model = _eager_model(type(self))
+        if not isinstance(other, model) or _eager_model(type(other)) is not model:
+            return NotImplemented
+        names = [f.name for f in fields(model) if f.compare]
+        return [getattr(self, name) for name in names] == [
+            getattr(other, name) for name in names
+        ]
+
+    @property
+    def is_hydrated(self) -> bool:
+        """Whether every lazy field has been parsed."""
+        return not getattr(self, "_pending", None)
+
+
+def _eager_model(cls: type) -> type:
+    """Return the dataclass a model class was declared as (itself if eager)."""
+    return next(base for base in cls.__mro__ if "__dataclass_fields__" in base.__dict__)
+
+
+def track_payload(raw: dict[str, Any]) -> dict[str, Any]:
+    """Return the track entry of a standalone track response."""
+    return raw.get("tracks", [{}])[0] if raw.get("tracks") else raw
+
+
+class LazyBCArtist(LazyModel, BCArtist):
+    """BCArtist whose ``bio`` is parsed on first access."""
+
+    __slots__ = ("_parsers", "_pending", "_raw")
+
+    bio = LazyField(lambda artist: artist._raw.get("bio"))
+
+
+class LazyBCAlbum(LazyModel, BCAlbum):
+    """BCAlbum whose ``about``, ``credits`` and ``tracks`` are parsed on first access."""
+
+    __slots__ = ("_parsers", "_pending", "_raw")
+
+    about = LazyField(lambda album: album._raw.get("about"))
+    credits = LazyField(lambda album: album._raw.get("credits"))
+    tracks = LazyField(
+        lambda album: album._parsers._parse_album_tracks(album._raw, album)
+    )
+
+
+class LazyBCTrack(LazyModel, BCTrack):
+    """BCTrack whose ``lyrics``, ``about`` and ``credits`` are parsed on first access."""
+
+    __slots__ = ("_parsers", "_pending", "_raw")
+
+    lyrics = LazyField(lambda track: track_payload(track._raw).get("lyrics"))
+    about = LazyField(lambda track: track._raw.get("about"))
+    credits = LazyField(lambda track: track._raw.get("credits"))
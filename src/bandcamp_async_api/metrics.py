@@ -0,0 +1,203 @@
+"""Per-endpoint request metrics and their Prometheus text export."""
+
+import copy
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in seconds."""
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)  # per bucket, then +Inf
+    sum: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, seconds: float) -> None:
+        """Add a duration."""
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    @property
+    def mean(self) -> float:
+        """Average duration, 0 when empty."""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile (0-1) by interpolating within its bucket.
+
+        Durations above the last bucket are reported as its upper bound.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for upper, count in zip(self.buckets, self.counts, strict=False):
+            if count and seen + count >= rank:
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = upper
+        return self.buckets[-1]
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    """Counters of one endpoint (see ``endpoint_name``)."""
+
+    calls: int = 0  # API calls, including cache hits and coalesced waiters
+    attempts: int = 0  # HTTP requests sent, retries included
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    bytes_received: int = 0  # response bodies of successful requests
+    statuses: Counter[int] = field(default_factory=Counter)
+    errors: int = 0  # attempts failing without a response (connection, timeout)
+    retries: int = 0
+    rate_limited: int = 0  # 429 responses
+    cache_hits: int = 0
+    cache_misses: int = 0
+    coalesced: int = 0  # calls that awaited an identical in-flight request
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of cache lookups answered from the cache."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+
+class RequestMetrics:
+    """Request metrics collected by a client, keyed by endpoint name.
+
+    Pass an instance as ``BandcampAPIClient(metrics=...)``; share one
+    between clients to aggregate them. Without one the client skips all
+    bookkeeping.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """Initialize empty metrics.
+
+        Args:
+            buckets: Upper bounds in seconds of the latency histogram buckets.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.endpoints: dict[str, EndpointStats] = {}
+
+    def _stats(self, endpoint: str) -> EndpointStats:
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = EndpointStats(latency=LatencyHistogram(self.buckets))
+            self.endpoints[endpoint] = stats
+        return stats
+
+    def record_call(self, endpoint: str) -> None:
+        """Count an API call."""
+        self._stats(endpoint).calls += 1
+
+    def record_cache(self, endpoint: str, hit: bool) -> None:
+        """Count a cache lookup."""
+        stats = self._stats(endpoint)
+        if hit:
+            stats.cache_hits += 1
+        else:
+            stats.cache_misses += 1
+
+    def record_coalesced(self, endpoint: str) -> None:
+        """Count a call served by an identical in-flight request."""
+        self._stats(endpoint).coalesced += 1
+
+    def record_response(self, endpoint: str, status: int) -> None:
+        """Count a response status."""
+        stats = self._stats(endpoint)
+        stats.statuses[status] += 1
+        if status == 429:
+            stats.rate_limited += 1
+
+    def record_body(self, endpoint: str, size: int) -> None:
+        """Count the bytes of a successful response body."""
+        self._stats(endpoint).bytes_received += size
+
+    def record_attempt(
+        self, endpoint: str, seconds: float, responded: bool = True
+    ) -> None:
+        """Record the duration of an HTTP attempt.
+
+        Args:
+            endpoint: Endpoint name.
+            seconds: Time from sending the request to the end of the body.
+            responded: False when the attempt ended without a response
+                (connection failure, timeout, cancellation); counted as
+                ``errors``.
+        """
+        stats = self._stats(endpoint)
+        stats.attempts += 1
+        stats.latency.observe(seconds)
+        if not responded:
+            stats.errors += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        """Count a retried attempt."""
+        self._stats(endpoint).retries += 1
+
+    def snapshot(self) -> dict[str, EndpointStats]:
+        """Return a copy of the current stats, keyed by endpoint name."""
+        return copy.deepcopy(self.endpoints)
+
+    def reset(self) -> None:
+        """Drop all collected stats."""
+        self.endpoints.clear()
+
+    def to_prometheus(self, prefix: str = "bandcamp_api") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        endpoints = sorted(self.endpoints.items())
+
+        def counter(name: str, help_text: str, attr: str) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for endpoint, stats in endpoints:
+                value = getattr(stats, attr)
+                lines.append(f'{prefix}_{name}{{endpoint="{endpoint}"}} {value}')
+
+        counter("calls_total", "API calls made through the client.", "calls")
+        counter("requests_total", "HTTP requests sent, retries included.", "attempts")
+        counter("response_bytes_total", "Bytes of response bodies.", "bytes_received")
+        counter("errors_total", "Requests failing without a response.", "errors")
+        counter("retries_total", "Retried requests.", "retries")
+        counter("rate_limited_total", "Responses with status 429.", "rate_limited")
+        counter("cache_hits_total", "Calls answered from the cache.", "cache_hits")
+        counter("cache_misses_total", "Cache lookups that missed.", "cache_misses")
+        counter("coalesced_total", "Calls sharing an in-flight request.", "coalesced")
+
+        name = f"{prefix}_responses_total"
+        lines.append(f"# HELP {name} HTTP responses by status code.")
+        lines.append(f"# TYPE {name} counter")
+        for endpoint, stats in endpoints:
+            for status, count in sorted(stats.statuses.items()):
+                lines.append(
+                    f'{name}{{endpoint="{endpoint}",status="{status}"}} {count}'
+                )
+
+        name = f"{prefix}_request_duration_seconds"
+        lines.append(f"# HELP {name} HTTP request duration.")
+        lines.append(f"# TYPE {name} histogram")
+        for endpoint, stats in endpoints:
+            histogram = stats.latency
+            cumulative = 0
+            bounds = [*map(str, histogram.buckets), "+Inf"]
+            for bound, count in zip(bounds, histogram.counts, strict=True):
+                cumulative += count
+                lines.append(
+                    f'{name}_bucket{{endpoint="{endpoint}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'{name}_sum{{endpoint="{endpoint}"}} {histogram.sum}')
+            lines.append(f'{name}_count{{endpoint="{endpoint}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
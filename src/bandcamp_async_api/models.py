@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResultItem:
     """Base class for search result items."""
 
@@ -15,7 +15,7 @@ class SearchResultItem:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResultArtist(SearchResultItem):
     """Artist search result."""
 
@@ -27,7 +27,7 @@ class SearchResultArtist(SearchResultItem):
     genre: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResultAlbum(SearchResultItem):
     """Album search result."""
 
@@ -39,7 +39,7 @@ class SearchResultAlbum(SearchResultItem):
     tags: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResultTrack(SearchResultItem):
     """Track search result."""
 
@@ -52,7 +52,7 @@ class SearchResultTrack(SearchResultItem):
     image_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BCArtist:
     """Bandcamp artist/band data.
 
@@ -72,7 +72,35 @@ class BCArtist:
     genre: str | None = None  # genre_name from API
 
 
-@dataclass
+@dataclass(slots=True)
+class DiscographyItem:
+    """A release from an artist's discography.
+
+    Based on /api/mobile/24/band_details discography array schema.
+    Maps to API fields: item_id, item_type, band_id, title, artist_name,
+    band_name, art_id, release_date, is_purchasable, etc.
+    """
+
+    item_id: int  # item_id from API
+    item_type: str  # item_type from API ("album" or "track")
+    band_id: int  # band_id from API
+    title: str = ""  # title from API
+    artist_name: str | None = None  # artist_name from API (performer credit)
+    band_name: str = ""  # band_name from API
+    art_url: str | None = None  # constructed from art_id
+    release_date: int | str | None = None  # release_date from API, as returned
+    is_purchasable: bool = False  # is_purchasable from API
+
+
+@dataclass(slots=True)
+class ArtistWithDiscography:
+    """Artist profile and discography parsed from one band_details response."""
+
+    artist: BCArtist
+    discography: list[DiscographyItem]
+
+
+@dataclass(slots=True)
 class BCAlbum:
     """Bandcamp album data.
 
@@ -113,7 +141,7 @@ class BCAlbum:
     supporters: list[dict[str, Any]] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BCTrack:
     """Bandcamp track data.
 
@@ -142,7 +170,7 @@ class BCTrack:
     tralbum_artist: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionItem:
     """Item from user's collection.
 
@@ -167,7 +195,7 @@ class CollectionItem:
     token: str | None = None  # token from API (used for pagination)
 
 
-@dataclass
+@dataclass(slots=True)
 class FollowingItem:
     """A band/artist from the user's following list.
 
@@ -187,7 +215,7 @@ class FollowingItem:
     token: str | None = None  # token from API (used for pagination)
 
 
-@dataclass
+@dataclass(slots=True)
 class FanItem:
     """A fan/user from following_fans or followers endpoints.
 
@@ -205,7 +233,7 @@ class FanItem:
     token: str | None = None  # token from API (used for pagination)
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionSummary:
     """User's collection summary.
 
@@ -231,7 +259,7 @@ class CollectionType(Enum):
     FOLLOWERS = "followers"
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedStory:
     """A story entry from the fan dash feed.
 
@@ -272,7 +300,7 @@ class FeedStory:
     featured_track_encodings_id: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedTrack:
     """A playable track from the feed's track_list.
 
@@ -295,7 +323,7 @@ class FeedTrack:
     track_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedBandInfo:
     """Artist/band metadata from the feed's band_info lookup."""
 
@@ -306,7 +334,7 @@ class FeedBandInfo:
     followed: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedFanInfo:
     """Fan metadata from the feed's fan_info lookup."""
 
@@ -319,12 +347,15 @@ class FeedFanInfo:
     fav_genre_name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedResponse:
     """Response from the fan_dash_feed_updates endpoint.
 
     Contains stories (activity entries), playable tracks, and lookup tables
-    for fans and bands referenced in the stories.
+    for fans and bands referenced in the stories. Int-keyed indexes over
+    the tracks, fans and bands are built on construction; use
+    :meth:`track_for`, :meth:`fan_for` and :meth:`band_for` to resolve a
+    story's references without scanning the lists.
     """
 
     stories: list[FeedStory]
@@ -334,3 +365,31 @@ class FeedResponse:
     oldest_story_date: int | None = None
     newest_story_date: int | None = None
     has_more: bool = False
+    tracks_by_id: dict[int, FeedTrack] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    fans_by_id: dict[int, FeedFanInfo] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    bands_by_id: dict[int, FeedBandInfo] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.tracks_by_id = {track.track_id: track for track in self.track_list}
+        self.fans_by_id = {int(k): v for k, v in self.fan_info.items()}
+        self.bands_by_id = {int(k): v for k, v in self.band_info.items()}
+
+    def track_for(self, story: FeedStory) -> FeedTrack | None:
+        """Return the story's featured track, if this page listed it."""
+        if story.featured_track is None:
+            return None
+        return self.tracks_by_id.get(story.featured_track)
+
+    def fan_for(self, story: FeedStory) -> FeedFanInfo | None:
+        """Return the info of the fan the story is about, if listed."""
+        return self.fans_by_id.get(story.fan_id)
+
+    def band_for(self, story: FeedStory) -> FeedBandInfo | None:
+        """Return the info of the story's band, if listed."""
+        return self.bands_by_id.get(story.band_id)
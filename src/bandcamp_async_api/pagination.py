@@ -0,0 +1,169 @@
+"""Async iteration over paginated endpoints."""
+
+import asyncio
+from abc import abstractmethod
+from collections import deque
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from .models import (
+    CollectionItem,
+    CollectionSummary,
+    CollectionType,
+    FanItem,
+    FollowingItem,
+)
+from .utils import DONE, BackgroundTaskIterator
+
+if TYPE_CHECKING:
+    from .client import BandcampAPIClient
+
+
+class PrefetchIterator[T](BackgroundTaskIterator[T]):
+    """Base for async iterators over paged endpoints.
+
+    Pages are requested by a background task that runs ahead of the
+    consumer: while the current page is being consumed, up to ``prefetch``
+    further pages are fetched and buffered. Subclasses implement
+    :meth:`_fetch_page` (setting ``_exhausted`` after the last page) and
+    :meth:`_page_items`.
+    """
+
+    def __init__(self, prefetch: int = 1):
+        """Initialize the iterator.
+
+        Args:
+            prefetch: Pages fetched ahead of the consumer. 0 fetches each page
+                only once the previous one is exhausted.
+        """
+        super().__init__()
+        self.prefetch = prefetch
+        self.pages_fetched = 0
+        self._exhausted = False
+        self._finished = False  # every queued page has been taken
+        self._buffer: deque[T] = deque()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        # One slot per fetched page the consumer has not taken yet
+        self._slots = asyncio.Semaphore(max(prefetch, 1))
+
+    @abstractmethod
+    async def _fetch_page(self) -> Any:
+        """Request the next page."""
+
+    @abstractmethod
+    def _page_items(self, page: Any) -> Iterable[T]:
+        """Return the items of a page, called when the consumer reaches it."""
+
+    def _yielded(self, item: T) -> None:
+        """Hook called with every item before it is returned."""
+
+    async def _produce(self) -> None:
+        try:
+            while not self._exhausted:
+                # Wait before fetching, not after: `prefetch` untaken pages
+                # already fetched means the consumer is far enough behind
+                await self._slots.acquire()
+                page = await self._fetch_page()
+                self._queue.put_nowait(page)
+        except Exception as e:  # noqa: BLE001
+            # Re-raised in the consumer by _next_page
+            self._queue.put_nowait(e)
+            return
+        self._queue.put_nowait(DONE)
+
+    async def _next_page(self) -> Any:
+        if self._finished:
+            return None
+        if self.prefetch <= 0:
+            if self._exhausted:
+                return None
+            return await self._fetch_page()
+
+        if not self._tasks:
+            self._tasks.append(asyncio.create_task(self._produce()))
+        page = await self._queue.get()
+        if page is DONE:
+            self._finished = True
+            return None
+        if isinstance(page, Exception):
+            # The producer has stopped; the next call starts a new one that
+            # requests the failed page again
+            self._tasks.clear()
+            self._slots.release()
+            raise page
+        self._slots.release()
+        return page
+
+    async def __anext__(self) -> T:
+        while not self._buffer:
+            page = await self._next_page()
+            if page is None:
+                await self.aclose()
+                raise StopAsyncIteration
+            self._buffer.extend(self._page_items(page))
+
+        item = self._buffer.popleft()
+        self._yielded(item)
+        return item
+
+
+class CollectionIterator(PrefetchIterator[CollectionItem | FollowingItem | FanItem]):
+    """Async iterator over every item of a collection endpoint.
+
+    ``cursor`` always holds the pagination token of the last yielded item,
+    so an interrupted walk can be resumed by passing it as
+    ``older_than_token``.
+    """
+
+    def __init__(
+        self,
+        client: "BandcampAPIClient",
+        collection_type: CollectionType = CollectionType.COLLECTION,
+        fan_id: int | None = None,
+        count: int = 50,
+        older_than_token: str | None = None,
+        prefetch: int = 1,
+    ):
+        """Initialize the iterator.
+
+        Args:
+            client: Client used to request pages.
+            collection_type: Collection endpoint to walk.
+            fan_id: Fan whose collection to walk. Defaults to the logged-in fan.
+            count: Items per page.
+            older_than_token: Cursor to resume from. Starts at the newest item
+                when not provided.
+            prefetch: Pages fetched ahead of the consumer. 0 fetches each page
+                only once the previous one is exhausted.
+        """
+        super().__init__(prefetch)
+        self.client = client
+        self.collection_type = collection_type
+        self.fan_id = fan_id
+        self.count = count
+        self.cursor = older_than_token
+        self._next_token = older_than_token
+
+    async def _fetch_page(self) -> CollectionSummary:
+        page = await self.client.get_collection_items(
+            self.collection_type,
+            older_than_token=self._next_token,
+            count=self.count,
+            fan_id=self.fan_id,
+        )
+        self.pages_fetched += 1
+        self.fan_id = page.fan_id
+        self._next_token = page.last_token
+        if not page.has_more or not page.items:
+            self._exhausted = True
+        return page
+
+    def _page_items(
+        self, page: CollectionSummary
+    ) -> list[CollectionItem | FollowingItem | FanItem]:
+        if not page.items:
+            self.cursor = page.last_token or self.cursor
+        return page.items
+
+    def _yielded(self, item: CollectionItem | FollowingItem | FanItem) -> None:
+        self.cursor = item.token or self.cursor
@@ -3,11 +3,14 @@
 import re
 from typing import Any
 
+from .lazy import LazyBCAlbum, LazyBCArtist, LazyBCTrack, track_payload
 from .models import (
+    ArtistWithDiscography,
     BCAlbum,
     BCArtist,
     BCTrack,
     CollectionItem,
+    DiscographyItem,
     FanItem,
     FeedBandInfo,
     FeedFanInfo,
@@ -20,14 +23,99 @@ from .models import (
     SearchResultItem,
     SearchResultTrack,
 )
+from .utils import LRUDict
 
 
 _SUBDOMAIN_RE = re.compile(r"^[a-zA-Z0-9-]+$")
 
 
+class ParseContext:
+    """Identity map shared by every parse of one BandcampParsers instance.
+
+    Interns strings that repeat across items (band names and URLs, item and
+    story types) and keeps one BCArtist per band_id for album and track
+    responses. Both maps are bounded LRUs, so long scans stay flat in memory.
+    Shared artists are returned as-is: mutating one changes it for every
+    album and track that references it.
+    """
+
+    def __init__(self, max_strings: int = 20000, max_artists: int = 5000):
+        """Initialize the context.
+
+        Args:
+            max_strings: Distinct strings kept for interning.
+            max_artists: Artists kept for reuse, by band_id.
+        """
+        self._strings: LRUDict[str, str] = LRUDict(max_strings)
+        self._artists: LRUDict[int, BCArtist] = LRUDict(max_artists)
+
+    def intern[T](self, value: T) -> T:
+        """Return the stored copy of an equal string, storing ``value`` if new."""
+        if not isinstance(value, str):
+            return value
+        stored = self._strings.get(value)
+        if stored is None:
+            self._strings[value] = value
+            return value
+        return stored  # ty:ignore[invalid-return-type]
+
+    def artist(
+        self,
+        band_id: int,
+        name: str,
+        url: str | None,
+        location: str | None,
+        image_url: str | None,
+        is_label: bool,
+    ) -> BCArtist:
+        """Return the shared BCArtist for these values, creating it if needed.
+
+        A stored artist is reused only if every field matches; otherwise a
+        new one replaces it.
+        """
+        artist = self._artists.get(band_id)
+        if (
+            artist is not None
+            and artist.name == name
+            and artist.url == url
+            and artist.location == location
+            and artist.image_url == image_url
+            and artist.is_label == is_label
+        ):
+            return artist
+        artist = BCArtist(
+            id=band_id,
+            name=self.intern(name),
+            url=url,
+            location=self.intern(location),
+            image_url=image_url,
+            is_label=is_label,
+        )
+        self._artists[band_id] = artist
+        return artist
+
+    def clear(self) -> None:
+        """Forget every interned string and shared artist."""
+        self._strings.clear()
+        self._artists.clear()
+
+
 class BandcampParsers:
     """Parsers for Bandcamp API responses to model objects."""
 
+    def __init__(self, lazy: bool = False, context: ParseContext | None = None):
+        """Initialize the parsers.
+
+        Args:
+            lazy: Parse heavy fields (artist bio, album/track about, credits
+                and lyrics, album tracks) only when first read. The models
+                keep a reference to the raw payload until then.
+            context: Identity map for interned strings and shared artists.
+                A new one is created when not provided.
+        """
+        self.lazy = lazy
+        self.context = context or ParseContext()
+
     @staticmethod
     def _build_image_url(image_id: Any) -> str | None:
         """Build image URL from image_id."""
@@ -85,8 +173,9 @@ class BandcampParsers:
     def parse_artist(self, data: dict[str, Any]) -> BCArtist:
         """Parse artist data from API response."""
         band_data = data.get("band", data)
+        lazy = self.lazy
 
-        return BCArtist(
+        artist = (LazyBCArtist if lazy else BCArtist)(
             id=data["id"],
             name=data["name"],
             url=data["bandcamp_url"],
@@ -97,10 +186,40 @@ class BandcampParsers:
                 else None
             ),
             is_label=band_data.get("is_label", False),
-            bio=data.get("bio"),
+            bio=None if lazy else data.get("bio"),
             tags=[tag["name"] for tag in data.get("tags", [])],
             genre=data.get("genre_name"),
         )
+        if lazy:
+            artist.defer(data, self, ("bio",))
+        return artist
+
+    def parse_discography_item(self, data: dict[str, Any]) -> DiscographyItem:
+        """Parse a discography entry from the band_details response."""
+        intern = self.context.intern
+        return DiscographyItem(
+            item_id=data["item_id"],
+            item_type=intern(data.get("item_type", "")),
+            band_id=data.get("band_id", 0),
+            title=data.get("title", ""),
+            artist_name=intern(data.get("artist_name")),
+            band_name=intern(data.get("band_name", "")),
+            art_url=self._build_art_url(data.get("art_id"), "album"),
+            release_date=data.get("release_date"),
+            is_purchasable=data.get("is_purchasable", False),
+        )
+
+    def parse_artist_with_discography(
+        self, data: dict[str, Any]
+    ) -> ArtistWithDiscography:
+        """Parse artist and discography from one band_details response."""
+        return ArtistWithDiscography(
+            artist=self.parse_artist(data),
+            discography=[
+                self.parse_discography_item(item)
+                for item in data.get("discography", [])
+            ],
+        )
 
     def parse_album(self, data: dict[str, Any]) -> BCAlbum:
         """Parse album data from API response."""
@@ -119,7 +238,8 @@ class BandcampParsers:
         # Parse price info
         price_info = self._parse_price_info(data)
 
-        album = BCAlbum(
+        lazy = self.lazy
+        album = (LazyBCAlbum if lazy else BCAlbum)(
             id=data["id"],
             title=data.get("title", data.get("album_title", "Unknown")),
             artist=artist,
@@ -131,8 +251,8 @@ class BandcampParsers:
             is_preorder=data.get("is_preorder", False),
             is_purchasable=data.get("is_purchasable", False),
             is_set_price=data.get("is_set_price", False),
-            about=data.get("about"),
-            credits=data.get("credits"),
+            about=None if lazy else data.get("about"),
+            credits=None if lazy else data.get("credits"),
             tags=[tag["name"] for tag in data.get("tags", [])],
             total_tracks=data.get("num_downloadable_tracks", 0),
             type=album_type,
@@ -142,24 +262,34 @@ class BandcampParsers:
             tralbum_artist=data.get("tralbum_artist"),
         )
 
-        # Parse tracks if available
-        if "tracks" in data:
-            album.tracks = []
-            for track_data in data["tracks"]:
-                if track_data.get("is_streamable", True):
-                    track = self._parse_track_from_album(track_data, album)
-                    album.tracks.append(track)
+        if lazy:
+            album.defer(data, self, ("about", "credits", "tracks"))
+        else:
+            album.tracks = self._parse_album_tracks(data, album)
 
         return album
 
+    def _parse_album_tracks(
+        self, data: dict[str, Any], album: BCAlbum
+    ) -> list[BCTrack] | None:
+        """Parse the streamable tracks of an album response, if present."""
+        if "tracks" not in data:
+            return None
+        return [
+            self._parse_track_from_album(track_data, album)
+            for track_data in data["tracks"]
+            if track_data.get("is_streamable", True)
+        ]
+
     def parse_track(self, data: dict[str, Any]) -> BCTrack:
         """Parse track data from API response."""
         # For single tracks, the data structure is similar to albums
         artist = self._parse_artist_from_album(data)
 
-        track_data = data.get("tracks", [{}])[0] if data.get("tracks") else data
+        track_data = track_payload(data)
+        lazy = self.lazy
 
-        return BCTrack(
+        track = (LazyBCTrack if lazy else BCTrack)(
             id=data["id"],
             title=data.get("title", track_data.get("title", "Unknown")),
             artist=artist,
@@ -168,21 +298,25 @@ class BandcampParsers:
             duration=track_data.get("duration"),
             streaming_url=track_data.get("streaming_url"),
             track_number=track_data.get("track_num", 0) or 0,
-            lyrics=track_data.get("lyrics"),
-            about=data.get("about"),
-            credits=data.get("credits"),
+            lyrics=None if lazy else track_data.get("lyrics"),
+            about=None if lazy else data.get("about"),
+            credits=None if lazy else data.get("credits"),
             tralbum_artist=data.get("tralbum_artist"),
         )
+        if lazy:
+            track.defer(data, self, ("lyrics", "about", "credits"))
+        return track
 
     def parse_collection_item(self, data: dict[str, Any]) -> CollectionItem:
         """Parse collection item from API response."""
+        intern = self.context.intern
         # Extract price as float from dict or use directly if already float
         return CollectionItem(
-            item_type=data.get("item_type", ""),
+            item_type=intern(data.get("item_type", "")),
             item_id=data["item_id"],
             band_id=data["band_id"],
-            tralbum_type=data.get("tralbum_type"),
-            band_name=data.get("band_name", ""),
+            tralbum_type=intern(data.get("tralbum_type")),
+            band_name=intern(data.get("band_name", "")),
             item_title=data.get("item_title", ""),
             item_url=data.get("item_url", ""),
             art_id=data.get("art_id"),
@@ -244,8 +378,8 @@ class BandcampParsers:
         """
         band_data = data.get("band", {})
 
-        return BCArtist(
-            id=band_data.get("band_id", data.get("band_id", 0)),
+        return self.context.artist(
+            band_id=band_data.get("band_id", data.get("band_id", 0)),
             name=band_data.get("name", "Unknown"),
             url=(
                 data.get("bandcamp_url", "").split("/album")[0]
@@ -314,28 +448,29 @@ class BandcampParsers:
 
     def parse_feed_story(self, data: dict[str, Any]) -> FeedStory:
         """Parse a story entry from the fan dash feed response."""
+        intern = self.context.intern
         return FeedStory(
-            story_type=data.get("story_type", ""),
+            story_type=intern(data.get("story_type", "")),
             fan_id=data["fan_id"],
             item_id=data["item_id"],
-            item_type=data.get("item_type", ""),
+            item_type=intern(data.get("item_type", "")),
             tralbum_id=data.get("tralbum_id", data["item_id"]),
-            tralbum_type=data.get("tralbum_type", ""),
+            tralbum_type=intern(data.get("tralbum_type", "")),
             band_id=data.get("band_id", 0),
             story_date=data.get("story_date", ""),
             item_title=data.get("item_title", ""),
             item_url=data.get("item_url", ""),
             item_art_url=data.get("item_art_url"),
             item_art_id=data.get("item_art_id"),
-            band_name=data.get("band_name", ""),
-            band_url=data.get("band_url", ""),
+            band_name=intern(data.get("band_name", "")),
+            band_url=intern(data.get("band_url", "")),
             album_id=data.get("album_id"),
             album_title=data.get("album_title"),
             genre_id=data.get("genre_id"),
             tags=data.get("tags"),
             is_purchasable=data.get("is_purchasable", False),
             price=data.get("price"),
-            currency=data.get("currency"),
+            currency=intern(data.get("currency")),
             is_preorder=data.get("is_preorder", False),
             num_streamable_tracks=data.get("num_streamable_tracks"),
             also_collected_count=data.get("also_collected_count", 0),
@@ -348,11 +483,12 @@ class BandcampParsers:
 
     def parse_feed_track(self, data: dict[str, Any]) -> FeedTrack:
         """Parse a track entry from the feed's track_list."""
+        intern = self.context.intern
         return FeedTrack(
             track_id=data["track_id"],
             title=data.get("title", ""),
             band_id=data.get("band_id", 0),
-            band_name=data.get("band_name", ""),
+            band_name=intern(data.get("band_name", "")),
             album_id=data.get("album_id"),
             album_title=data.get("album_title"),
             track_num=data.get("track_num"),
@@ -361,7 +497,7 @@ class BandcampParsers:
             art_id=data.get("art_id"),
             is_purchasable=data.get("is_purchasable", False),
             price=data.get("price"),
-            currency=data.get("currency"),
+            currency=intern(data.get("currency")),
             track_url=data.get("track_url"),
         )
 
@@ -419,6 +555,25 @@ class BandcampParsers:
             has_more=has_more,
         )
 
+    def merge_feed_lookups(
+        self,
+        data: dict[str, Any],
+        fan_info: dict[int, FeedFanInfo],
+        band_info: dict[int, FeedBandInfo],
+    ) -> None:
+        """Add a feed response's fan_info/band_info entries to int-keyed tables.
+
+        Entries whose ID is already in a table are skipped without parsing.
+        """
+        for key, value in data.get("fan_info", {}).items():
+            fan_id = int(key)
+            if fan_id not in fan_info:
+                fan_info[fan_id] = self.parse_feed_fan_info(value)
+        for key, value in data.get("band_info", {}).items():
+            band_id = int(key)
+            if band_id not in band_info:
+                band_info[band_id] = self.parse_feed_band_info(value)
+
     def _build_art_url(self, art_id: int | None, item_type: str) -> str | None:
         """Build artwork URL from art_id and item type."""
         if not art_id:
@@ -0,0 +1,154 @@
+"""Client-side rate limiting with adaptive backoff."""
+
+import asyncio
+from time import monotonic
+
+# Requests per second allowed per endpoint family before any 429 is seen.
+DEFAULT_RATES: dict[str, float] = {
+    "search": 2.0,
+    "tralbum": 5.0,
+    "band": 5.0,
+    "fancollection": 2.0,
+    "feed": 1.0,
+    "default": 5.0,
+}
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Map an endpoint name (see endpoints.endpoint_name) to its limiter family."""
+    if endpoint == "search":
+        return "search"
+    if endpoint == "tralbum_details":
+        return "tralbum"
+    if endpoint == "band_details":
+        return "band"
+    if endpoint == "collection_summary" or endpoint.startswith("fancollection/"):
+        return "fancollection"
+    if endpoint == "feed":
+        return "feed"
+    return "default"
+
+
+class TokenBucket:
+    """Token bucket whose refill rate adapts with AIMD.
+
+    The rate is cut multiplicatively on every 429 and grows back additively
+    on every successful request, up to the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 5,
+        min_rate: float = 0.1,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.05,
+    ):
+        """Initialize the bucket.
+
+        Args:
+            rate: Maximum sustained requests per second.
+            burst: Bucket capacity, i.e. requests allowed back to back.
+            min_rate: Floor the rate never drops below.
+            decrease_factor: Multiplier applied to the rate on a 429.
+            increase_step: Requests per second regained per success.
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.tokens = float(burst)
+        self._updated = monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent. Waiters are served in order."""
+        async with self._lock:
+            while True:
+                now = monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def on_rate_limited(self, retry_after: float | None = None) -> None:
+        """Back off after a 429: shrink the rate and pause for Retry-After."""
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self.tokens = 0.0
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, monotonic() + retry_after)
+
+    def on_success(self) -> None:
+        """Recover part of the rate after a successful request."""
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+
+class RateLimiter:
+    """Per endpoint family token buckets shared by any number of clients.
+
+    Pass the same instance to several ``BandcampAPIClient`` objects (or use
+    :meth:`shared`) to pace them together. Buckets use asyncio primitives,
+    so a limiter must only be used from one event loop.
+    """
+
+    _shared: "RateLimiter | None" = None
+
+    def __init__(
+        self,
+        rates: dict[str, float] | None = None,
+        burst: int = 5,
+        min_rate: float = 0.1,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.05,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            rates: Requests per second per family (search, tralbum, band,
+                fancollection, feed, default). Missing families use
+                ``DEFAULT_RATES``.
+            burst: Bucket capacity of every family.
+            min_rate: Floor the adaptive rate never drops below.
+            decrease_factor: Multiplier applied to a family's rate on a 429.
+            increase_step: Requests per second regained per success.
+        """
+        self.rates = {**DEFAULT_RATES, **(rates or {})}
+        self.buckets = {
+            family: TokenBucket(rate, burst, min_rate, decrease_factor, increase_step)
+            for family, rate in self.rates.items()
+        }
+
+    @classmethod
+    def shared(cls) -> "RateLimiter":
+        """Return the process-wide limiter, created with defaults on first use."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """Return the bucket that paces an endpoint."""
+        return self.buckets.get(endpoint_family(endpoint), self.buckets["default"])
+
+    async def acquire(self, endpoint: str) -> None:
+        """Wait until a request to an endpoint may be sent."""
+        await self.bucket(endpoint).acquire()
+
+    def on_rate_limited(self, endpoint: str, retry_after: float | None = None) -> None:
+        """Record a 429 from an endpoint."""
+        self.bucket(endpoint).on_rate_limited(retry_after)
+
+    def on_success(self, endpoint: str) -> None:
+        """Record a successful request to an endpoint."""
+        self.bucket(endpoint).on_success()
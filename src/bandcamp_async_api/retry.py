@@ -0,0 +1,84 @@
+"""Retry policy for transient Bandcamp API failures."""
+
+import random
+from dataclasses import dataclass, field
+
+# POST endpoints that only read data and are safe to send twice.
+READ_ONLY_POST_ENDPOINTS = frozenset({"band_details", "feed"})
+
+
+def is_idempotent(method: str, endpoint: str) -> bool:
+    """Check whether a request can be repeated without side effects."""
+    if method.upper() in ("GET", "HEAD", "OPTIONS"):
+        return True
+    return endpoint in READ_ONLY_POST_ENDPOINTS or endpoint.startswith("fancollection/")
+
+
+@dataclass
+class RetryPolicy:
+    """How the client retries transient failures.
+
+    Retries 429s, the listed 5xx statuses, connection errors and timeouts,
+    sleeping with exponential backoff and full jitter between attempts. A
+    429's Retry-After is honored as the minimum wait. Only idempotent
+    requests are retried.
+    """
+
+    max_attempts: int = 3  # total attempts, including the first one
+    base_delay: float = 0.5  # seconds, doubled with every attempt
+    max_delay: float = 30.0  # cap for a single backoff before jitter
+    deadline: float | None = None  # seconds a request may take including retries
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset({500, 502, 503, 504})
+    )
+    retry_rate_limited: bool = True
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """Return the wait after a failed attempt (1-based).
+
+        Full jitter: a uniform draw between 0 and the exponential delay,
+        raised to ``retry_after`` when the server asked for a longer wait.
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def next_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        retry_after: float | None = None,
+        deadline: float | None = None,
+    ) -> float | None:
+        """Return the wait before the next attempt, or None to give up.
+
+        Args:
+            attempt: Number of attempts made so far.
+            elapsed: Seconds spent on the call so far.
+            retry_after: Server-requested wait, if any.
+            deadline: Per-call deadline overriding ``self.deadline``.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = self.backoff(attempt, retry_after)
+        deadline = self.deadline if deadline is None else deadline
+        if deadline is not None and elapsed + delay > deadline:
+            return None
+        return delay
+
+
+@dataclass
+class RequestInfo:
+    """Metadata about how a request was served."""
+
+    endpoint: str
+    attempts: int = 0  # HTTP attempts, 0 when served from the cache
+    from_cache: bool = False
+    coalesced: bool = False  # joined another caller's in-flight request
+
+    @property
+    def retries(self) -> int:
+        """Number of attempts after the first one."""
+        return max(0, self.attempts - 1)
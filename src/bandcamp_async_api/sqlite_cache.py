@@ -0,0 +1,215 @@
+"""SQLite cache backend that survives process restarts."""
+
+import asyncio
+import contextlib
+import logging
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from time import time
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class SQLiteCache:
+    """Single-file cache backend with zlib-compressed bodies.
+
+    Implements the ``CacheBackend`` protocol. The database runs in WAL mode
+    and every query executes in a worker thread, so cache access never
+    blocks the event loop. Expiry uses wall-clock timestamps, which keeps
+    entries valid across restarts.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int | None = None,
+        compress_level: int = 6,
+        maintenance_interval: float = 600.0,
+    ):
+        """Initialize the SQLite cache.
+
+        Args:
+            path: Database file. Created on first use.
+            max_bytes: Upper bound for the summed size of compressed bodies.
+                Least recently used entries are evicted during maintenance.
+                None means unbounded.
+            compress_level: zlib compression level for stored bodies.
+            maintenance_interval: Seconds between background purges of
+                expired entries, size eviction and incremental vacuum.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.maintenance_interval = maintenance_interval
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._maintenance_task: asyncio.Task | None = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        self.start_maintenance()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            # auto_vacuum must be set before the first table is created
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, func, *args):
+        """Run a blocking database call in a worker thread."""
+
+        def _locked():
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    return func(conn, *args)
+
+        return await asyncio.to_thread(_locked)
+
+    @staticmethod
+    def _get(conn: sqlite3.Connection, key: str) -> bytes | None:
+        row = conn.execute(
+            "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        body, expires_at = row
+        now = time()
+        if expires_at <= now:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return zlib.decompress(body)
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the stored body, or None when missing or expired."""
+        return await self._run(self._get, key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a compressed body that expires after ``ttl`` seconds."""
+        body = zlib.compress(value, self.compress_level)
+        now = time()
+        await self._run(
+            lambda conn: conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, now + ttl, now, len(body), body),
+            )
+        )
+
+    async def delete(self, key: str) -> None:
+        """Remove a single entry if present."""
+        await self._run(
+            lambda conn: conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        )
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Remove every entry whose key starts with ``prefix``."""
+        cursor = await self._run(
+            lambda conn: conn.execute(
+                "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+        )
+        return cursor.rowcount
+
+    async def clear(self) -> None:
+        """Remove every entry."""
+        await self._run(lambda conn: conn.execute("DELETE FROM responses"))
+
+    async def size_bytes(self) -> int:
+        """Return the summed size of stored (compressed) bodies."""
+        row = await self._run(
+            lambda conn: conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        )
+        return row[0]
+
+    def _maintain(self, conn: sqlite3.Connection) -> int:
+        removed = conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (time(),)
+        ).rowcount
+        if self.max_bytes is not None:
+            # Drop least recently used rows until the running total fits.
+            removed += conn.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (
+                            ORDER BY accessed_at DESC
+                        ) AS running_size
+                        FROM responses
+                    ) WHERE running_size > ?
+                )
+                """,
+                (self.max_bytes,),
+            ).rowcount
+        return removed
+
+    async def maintain(self) -> int:
+        """Purge expired entries, enforce ``max_bytes`` and reclaim space.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed = await self._run(self._maintain)
+        # The pragma frees one page per step; fetchall() runs it to the end.
+        await self._run(
+            lambda conn: conn.execute("PRAGMA incremental_vacuum").fetchall()
+        )
+        return removed
+
+    async def _maintenance_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.maintenance_interval)
+            try:
+                removed = await self.maintain()
+            except sqlite3.Error as e:
+                _LOGGER.warning("SQLite cache maintenance failed: %s", e)
+            else:
+                _LOGGER.debug("SQLite cache maintenance removed %d entries", removed)
+
+    def start_maintenance(self) -> None:
+        """Start the background maintenance task on the running loop."""
+        if self._maintenance_task is None or self._maintenance_task.done():
+            self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+
+    async def close(self) -> None:
+        """Stop background maintenance and close the database."""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._maintenance_task
+            self._maintenance_task = None
+        if self._conn is not None:
+            await asyncio.to_thread(self._close_conn)
+
+    def _close_conn(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,201 @@
+"""Incremental collection sync with persisted high-water marks."""
+
+import asyncio
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+from .models import CollectionItem, CollectionType, FanItem, FollowingItem
+
+if TYPE_CHECKING:
+    from .client import BandcampAPIClient
+
+type SyncItem = CollectionItem | FollowingItem | FanItem
+
+
+def item_key(item: SyncItem) -> str:
+    """Return a stable key identifying an item within its collection.
+
+    Collection and wishlist items are keyed by tralbum type and ID
+    (``"a123"``, ``"t456"``), followed bands by ``"b<band_id>"`` and fans by
+    ``"f<fan_id>"``.
+    """
+    if isinstance(item, CollectionItem):
+        return f"{item.tralbum_type or item.item_type[:1]}{item.item_id}"
+    if isinstance(item, FollowingItem):
+        return f"b{item.band_id}"
+    return f"f{item.fan_id}"
+
+
+@dataclass(slots=True)
+class SyncState:
+    """What is known about one fan's collection of one type."""
+
+    fan_id: int
+    collection_type: str  # CollectionType value
+    high_water_token: str | None = None  # token of the newest item seen
+    item_keys: list[str] = field(default_factory=list)  # see item_key
+    synced_at: float = 0.0  # Unix time of the last sync
+
+
+@dataclass(slots=True)
+class SyncDelta:
+    """Changes found by one sync."""
+
+    fan_id: int
+    collection_type: CollectionType
+    added: list[SyncItem] = field(default_factory=list)  # newest first
+    removed: list[str] = field(default_factory=list)  # item keys, full syncs only
+    full: bool = False  # whether the whole collection was walked
+    pages_fetched: int = 0
+
+
+@runtime_checkable
+class SyncStateStore(Protocol):
+    """Persistence for SyncState, one entry per fan and collection type."""
+
+    async def load(
+        self, fan_id: int, collection_type: CollectionType
+    ) -> SyncState | None:
+        """Return the stored state, or None before the first sync."""
+        ...
+
+    async def save(self, state: SyncState) -> None:
+        """Store a state, replacing the previous one."""
+        ...
+
+
+class MemorySyncStore:
+    """SyncStateStore keeping states in memory, for tests and short jobs."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self.states: dict[tuple[int, str], SyncState] = {}
+
+    async def load(
+        self, fan_id: int, collection_type: CollectionType
+    ) -> SyncState | None:
+        """Return the stored state, or None before the first sync."""
+        return self.states.get((fan_id, collection_type.value))
+
+    async def save(self, state: SyncState) -> None:
+        """Store a state, replacing the previous one."""
+        self.states[(state.fan_id, state.collection_type)] = state
+
+
+class JSONFileSyncStore:
+    """SyncStateStore persisting every state in one JSON file.
+
+    The file is rewritten atomically (temporary file plus rename) in a
+    worker thread on every save.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize the store.
+
+        Args:
+            path: JSON file to read and write. Created on first save.
+        """
+        self.path = Path(path)
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _entry(fan_id: int, collection_type: str) -> str:
+        return f"{fan_id}/{collection_type}"
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, data: dict[str, dict]) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp, self.path)
+
+    async def load(
+        self, fan_id: int, collection_type: CollectionType
+    ) -> SyncState | None:
+        """Return the stored state, or None before the first sync."""
+        data = await asyncio.to_thread(self._read)
+        entry = data.get(self._entry(fan_id, collection_type.value))
+        return SyncState(**entry) if entry is not None else None
+
+    async def save(self, state: SyncState) -> None:
+        """Store a state, replacing the previous one."""
+        async with self._lock:
+            data = await asyncio.to_thread(self._read)
+            data[self._entry(state.fan_id, state.collection_type)] = asdict(state)
+            await asyncio.to_thread(self._write, data)
+
+
+async def sync_collection(
+    client: "BandcampAPIClient",
+    store: SyncStateStore,
+    collection_type: CollectionType = CollectionType.COLLECTION,
+    fan_id: int | None = None,
+    full: bool = False,
+    count: int = 50,
+) -> SyncDelta:
+    """Fetch what changed in a collection since the last sync.
+
+    Collections are listed newest first, so an incremental sync stops at
+    the first item it already knows (or at the stored high-water token) and
+    usually needs a single page. Items removed from a collection cannot be
+    seen that way; a full sync walks every page and reports them too. The
+    first sync of a fan and type is always full.
+
+    Args:
+        client: Client used to request pages.
+        store: Where sync states are loaded from and saved to.
+        collection_type: Collection endpoint to sync.
+        fan_id: Fan to sync. Defaults to the logged-in fan.
+        full: Walk the whole collection and report removed items.
+        count: Items per page.
+    """
+    if fan_id is None:
+        fan_id = await client._own_fan_id()
+    state = await store.load(fan_id, collection_type)
+    full = full or state is None
+    known = set(state.item_keys) if state is not None else set()
+    high_water = state.high_water_token if state is not None else None
+
+    delta = SyncDelta(fan_id, collection_type, full=full)
+    seen: list[str] = []
+    newest_token = None
+    async with client.iter_collection(
+        collection_type, fan_id, count=count, prefetch=0
+    ) as items:
+        async for item in items:
+            if newest_token is None:
+                newest_token = item.token
+            key = item_key(item)
+            if not full and (key in known or item.token == high_water):
+                break
+            seen.append(key)
+            if key not in known:
+                delta.added.append(item)
+        delta.pages_fetched = items.pages_fetched
+
+    seen_keys = set(seen)
+    previous = [key for key in state.item_keys if key not in seen_keys] if state else []
+    if full:
+        delta.removed = previous
+        item_keys = seen
+    else:
+        item_keys = seen + previous
+
+    await store.save(
+        SyncState(
+            fan_id=fan_id,
+            collection_type=collection_type.value,
+            high_water_token=newest_token or high_water,
+            item_keys=item_keys,
+            synced_at=time(),
+        )
+    )
+    return delta
@@ -0,0 +1,276 @@
+"""Tracing spans around the request, decode and parse phases of API calls.
+
+The client reports its work through a tracer with the subset of the
+OpenTelemetry ``Tracer`` API it needs (``start_span`` and
+``start_as_current_span``), so an OpenTelemetry tracer can be passed as
+is. ``CallbackTracer`` implements the same interface without any
+dependency and hands finished spans to a callback. Without a tracer the
+client uses ``NoOpTracer``.
+
+Spans emitted by the client, nested as listed:
+
+- ``bandcamp.get_album`` / ``bandcamp.get_track`` / ``bandcamp.get_artist``
+- ``bandcamp.request``: one API request, cache and coalescing included
+- ``bandcamp.http``: one HTTP attempt
+- ``bandcamp.connect``: connection acquisition, pool wait, DNS, TCP and
+  TLS included (from aiohttp's ``TraceConfig``)
+- ``bandcamp.upstream_wait``: from the sent request to the response
+  headers (from aiohttp's ``TraceConfig``)
+- ``bandcamp.download``: reading the response body
+- ``bandcamp.decode``: JSON decoding
+- ``bandcamp.parse``: building models from the decoded payload
+
+The two network phases need ``trace_config(tracer)`` on the session. The
+client adds it to sessions it creates; add it yourself to a session you
+pass in.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Protocol, runtime_checkable
+
+import aiohttp
+
+Attributes = dict[str, Any]
+
+
+@runtime_checkable
+class Span(Protocol):
+    """The span methods the client calls, as in OpenTelemetry."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute."""
+        ...
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Record an exception raised during the span."""
+        ...
+
+    def end(self) -> None:
+        """Finish the span."""
+        ...
+
+
+@runtime_checkable
+class Tracer(Protocol):
+    """The tracer methods the client calls, as in OpenTelemetry.
+
+    Spans started with ``start_as_current_span`` become the parent of the
+    spans started inside them, and record exceptions leaving the block.
+    """
+
+    def start_span(self, name: str, attributes: Attributes | None = None) -> Span:
+        """Start a span ended explicitly with ``Span.end``."""
+        ...
+
+    def start_as_current_span(self, name: str, attributes: Attributes | None = None):
+        """Return a context manager running its block inside a new span."""
+        ...
+
+
+class _NoOpSpan:
+    """Span that records nothing; also its own context manager."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
+class NoOpTracer:
+    """Tracer that records nothing, used when the client has no tracer."""
+
+    def start_span(self, name: str, attributes: Attributes | None = None) -> _NoOpSpan:
+        """Return the shared no-op span."""
+        return _NOOP_SPAN
+
+    def start_as_current_span(
+        self, name: str, attributes: Attributes | None = None
+    ) -> _NoOpSpan:
+        """Return the shared no-op span."""
+        return _NOOP_SPAN
+
+
+_current_span: ContextVar["TraceSpan | None"] = ContextVar(
+    "bandcamp_current_span", default=None
+)
+
+
+@dataclass(slots=True, eq=False)
+class TraceSpan:
+    """A span recorded by ``CallbackTracer``.
+
+    Times are ``time.perf_counter()`` readings in seconds.
+    """
+
+    name: str
+    attributes: Attributes = field(default_factory=dict)
+    parent: "TraceSpan | None" = None
+    start_time: float = field(default_factory=perf_counter)
+    end_time: float | None = None
+    exception: BaseException | None = None
+    _on_end: Callable[["TraceSpan"], None] | None = field(default=None, repr=False)
+
+    @property
+    def duration(self) -> float:
+        """Seconds between start and end, 0 while the span is open."""
+        return 0.0 if self.end_time is None else self.end_time - self.start_time
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute."""
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Record an exception raised during the span."""
+        self.exception = exception
+
+    def is_recording(self) -> bool:
+        """Whether the span is still open."""
+        return self.end_time is None
+
+    def end(self) -> None:
+        """Finish the span and pass it to the tracer's ``on_end`` hook."""
+        if self.end_time is not None:
+            return
+        self.end_time = perf_counter()
+        if self._on_end is not None:
+            self._on_end(self)
+
+
+class CallbackTracer:
+    """Dependency-free tracer passing spans to hook callbacks.
+
+    Example::
+
+        spans = []
+        client = BandcampAPIClient(tracer=CallbackTracer(on_end=spans.append))
+    """
+
+    def __init__(
+        self,
+        on_end: Callable[[TraceSpan], None] | None = None,
+        on_start: Callable[[TraceSpan], None] | None = None,
+    ):
+        """Initialize the tracer.
+
+        Args:
+            on_end: Called with every finished span.
+            on_start: Called with every started span, before it has timings
+                and attributes set during the span.
+        """
+        self.on_end = on_end
+        self.on_start = on_start
+
+    def start_span(self, name: str, attributes: Attributes | None = None) -> TraceSpan:
+        """Start a span, child of the current one, ended with ``end()``."""
+        span = TraceSpan(
+            name,
+            dict(attributes) if attributes else {},
+            parent=_current_span.get(),
+            _on_end=self.on_end,
+        )
+        if self.on_start is not None:
+            self.on_start(span)
+        return span
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: Attributes | None = None
+    ) -> Iterator[TraceSpan]:
+        """Run the block inside a new span that is the current one."""
+        span = self.start_span(name, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+
+def _end_span(ctx: SimpleNamespace, name: str, error: BaseException | None = None):
+    span = getattr(ctx, name, None)
+    if span is not None:
+        if error is not None:
+            span.record_exception(error)
+        span.end()
+        setattr(ctx, name, None)
+
+
+def trace_config(tracer: Tracer) -> aiohttp.TraceConfig:
+    """Build an aiohttp ``TraceConfig`` emitting the network phase spans.
+
+    ``bandcamp.connect`` carries ``bandcamp.connection.reused`` and, when
+    the pool was full, ``bandcamp.connection.queued``.
+
+    Args:
+        tracer: Tracer receiving the spans, usually the client's.
+    """
+
+    async def on_request_start(session, ctx, params) -> None:
+        ctx.connect = tracer.start_span(
+            "bandcamp.connect", attributes={"server.address": params.url.host or ""}
+        )
+        ctx.upstream = None
+
+    async def on_connection_queued_start(session, ctx, params) -> None:
+        if ctx.connect is not None:
+            ctx.connect.set_attribute("bandcamp.connection.queued", True)
+
+    async def on_connection_create_start(session, ctx, params) -> None:
+        if ctx.connect is not None:
+            ctx.connect.set_attribute("bandcamp.connection.reused", False)
+
+    async def on_connection_reuseconn(session, ctx, params) -> None:
+        if ctx.connect is not None:
+            ctx.connect.set_attribute("bandcamp.connection.reused", True)
+
+    async def on_request_headers_sent(session, ctx, params) -> None:
+        _end_span(ctx, "connect")
+        ctx.upstream = tracer.start_span("bandcamp.upstream_wait")
+
+    async def on_request_end(session, ctx, params) -> None:
+        _end_span(ctx, "connect")
+        if ctx.upstream is not None:
+            ctx.upstream.set_attribute(
+                "http.response.status_code", params.response.status
+            )
+        _end_span(ctx, "upstream")
+
+    async def on_request_exception(session, ctx, params) -> None:
+        _end_span(ctx, "connect", params.exception)
+        _end_span(ctx, "upstream", params.exception)
+
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(on_request_start)
+    config.on_connection_queued_start.append(on_connection_queued_start)
+    config.on_connection_create_start.append(on_connection_create_start)
+    config.on_connection_reuseconn.append(on_connection_reuseconn)
+    config.on_request_headers_sent.append(on_request_headers_sent)
+    config.on_request_end.append(on_request_end)
+    config.on_request_exception.append(on_request_exception)
+    return config
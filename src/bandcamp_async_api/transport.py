@@ -0,0 +1,101 @@
+"""Transport configuration for client-owned aiohttp sessions."""
+
+import asyncio
+import logging
+import ssl
+from dataclasses import dataclass
+from functools import cache
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hosts the client talks to: the API itself and the image/stream CDN.
+WARMUP_URLS = ("https://bandcamp.com", "https://f4.bcbits.com")
+
+
+@cache
+def _shared_ssl_context() -> ssl.SSLContext:
+    """Build the default TLS context once per process."""
+    return ssl.create_default_context()
+
+
+@dataclass
+class TransportConfig:
+    """Connection pool settings used when the client creates its own session.
+
+    Ignored when a session is passed to the client explicitly — the caller
+    owns that session's connector.
+    """
+
+    limit: int = 100  # total simultaneous connections
+    limit_per_host: int = 20  # simultaneous connections per host
+    keepalive_timeout: float = 60.0  # seconds an idle connection stays pooled
+    use_dns_cache: bool = True
+    ttl_dns_cache: int | None = 300  # seconds; None caches forever
+    reuse_tls_context: bool = True  # share one SSLContext across connectors
+    happy_eyeballs: bool = True  # race IPv6/IPv4 connection attempts
+    happy_eyeballs_delay: float = 0.25
+    enable_cleanup_closed: bool = False
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        """Create a TCP connector with these settings."""
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.use_dns_cache,
+            ttl_dns_cache=self.ttl_dns_cache,
+            ssl=_shared_ssl_context() if self.reuse_tls_context else True,
+            happy_eyeballs_delay=(
+                self.happy_eyeballs_delay if self.happy_eyeballs else None
+            ),
+            enable_cleanup_closed=self.enable_cleanup_closed,
+        )
+
+    def create_session(
+        self, trace_configs: list[aiohttp.TraceConfig] | None = None
+    ) -> aiohttp.ClientSession:
+        """Create a session that owns a connector built from these settings.
+
+        Args:
+            trace_configs: aiohttp request tracing hooks for the session.
+        """
+        return aiohttp.ClientSession(
+            connector=self.create_connector(), trace_configs=trace_configs
+        )
+
+
+async def warm_up_connections(
+    session: aiohttp.ClientSession,
+    urls: tuple[str, ...] = WARMUP_URLS,
+    connections_per_host: int = 4,
+) -> int:
+    """Open pooled keep-alive connections ahead of the first real requests.
+
+    Fires ``connections_per_host`` concurrent HEAD requests per URL so the
+    connector ends up holding that many established TLS connections per
+    host. Failures are logged and ignored — warm-up is best-effort.
+
+    Args:
+        session: Session whose connection pool should be warmed.
+        urls: Base URLs of the hosts to connect to.
+        connections_per_host: Connections to open for every URL.
+
+    Returns:
+        Number of connections that were opened successfully.
+    """
+
+    async def _touch(url: str) -> bool:
+        try:
+            async with session.head(url, allow_redirects=False) as resp:
+                await resp.release()
+        except (aiohttp.ClientError, TimeoutError) as e:
+            _LOGGER.debug("Connection warm-up for %s failed: %s", url, e)
+            return False
+        return True
+
+    results = await asyncio.gather(
+        *(_touch(url) for url in urls for _ in range(connections_per_host))
+    )
+    return sum(results)
@@ -0,0 +1,87 @@
+"""Small shared helpers."""
+
+import asyncio
+import contextlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+# Queued by background tasks once they have no more results
+DONE = object()
+
+
+class LRUDict[K, V]:
+    """Mapping that keeps at most ``maxsize`` recently used entries."""
+
+    def __init__(self, maxsize: int):
+        """Initialize the mapping.
+
+        Args:
+            maxsize: Number of entries kept; the least recently used entry
+                is dropped when a new one would exceed it.
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the value for ``key`` and mark it recently used."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        """Remove ``key`` and return its value."""
+        return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._data.clear()
+
+
+class BackgroundTaskIterator[T](ABC):
+    """Base for async iterators fed by background tasks.
+
+    Subclasses start their tasks on the first ``__anext__`` and keep them in
+    ``_tasks``. Use as ``async with`` (or call :meth:`aclose`) when the loop
+    may exit early, so the tasks are cancelled.
+    """
+
+    def __init__(self):
+        """Initialize the iterator without tasks."""
+        self._tasks: list[asyncio.Task] = []
+
+    def __aiter__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    @abstractmethod
+    async def __anext__(self) -> T:
+        """Return the next result."""
+
+    async def aclose(self) -> None:
+        """Cancel background tasks that have not completed."""
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
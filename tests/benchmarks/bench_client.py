@@ -0,0 +1,270 @@
+"""Benchmark the client against a local fake Bandcamp server.
+
+Run with ``python tests/benchmarks/bench_client.py``. No network access is
+needed: every request goes to the aiohttp stand-in in ``fake_server.py``,
+with the latency, error rate and 429 rate given on the command line.
+
+For every scenario (search, artist lookups, collection hydration,
+collection paging and feed walking) reports the items processed per
+second, p50/p99 latency of the HTTP requests made, the request count and
+the peak memory allocated. ``--output`` saves the results as JSON;
+``--compare`` checks them against a saved run and exits with status 1 when
+a scenario's throughput dropped by more than ``--threshold``.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from fake_server import FakeBandcamp
+
+from bandcamp_async_api import BandcampAPIClient, RetryPolicy
+
+type Scenario = Callable[[BandcampAPIClient, argparse.Namespace], Awaitable[int]]
+
+
+@dataclass(slots=True)
+class ScenarioResult:
+    """Measurements of one scenario run."""
+
+    items: int
+    seconds: float
+    items_per_sec: float
+    requests: int
+    p50_ms: float
+    p99_ms: float
+    peak_kib: float
+    failed_requests: int
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of ``values`` (0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def record_latencies(client: BandcampAPIClient) -> tuple[list[float], list[int]]:
+    """Time every HTTP attempt the client makes.
+
+    Returns the list receiving latencies in seconds and a one-element list
+    counting failed attempts.
+    """
+    latencies: list[float] = []
+    failures = [0]
+    send = client._send_request
+
+    async def timed_send(method: str, url: str, **kwargs) -> bytes:
+        started = perf_counter()
+        try:
+            return await send(method, url, **kwargs)
+        except Exception:
+            failures[0] += 1
+            raise
+        finally:
+            latencies.append(perf_counter() - started)
+
+    client._send_request = timed_send  # ty:ignore[invalid-assignment]
+    return latencies, failures
+
+
+async def bench_search(client: BandcampAPIClient, args: argparse.Namespace) -> int:
+    """Run ``--searches`` searches, ``--concurrency`` at a time."""
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(i: int) -> int:
+        async with semaphore:
+            return len(await client.search(f"query {i}"))
+
+    counts = await asyncio.gather(*(one(i) for i in range(args.searches)))
+    return sum(counts)
+
+
+async def bench_artists(client: BandcampAPIClient, args: argparse.Namespace) -> int:
+    """Look up ``--artists`` artists with get_artists."""
+    ids = range(1000, 1000 + args.artists)
+    results = await client.get_artists(ids, concurrency=args.concurrency)
+    return sum(result.ok for result in results)
+
+
+async def bench_hydration(client: BandcampAPIClient, args: argparse.Namespace) -> int:
+    """Hydrate the whole collection into albums and tracks."""
+    hydrated = 0
+    async with client.hydrate_collection(concurrency=args.concurrency) as items:
+        async for item in items:
+            hydrated += item.ok
+    return hydrated
+
+
+async def bench_collection(client: BandcampAPIClient, args: argparse.Namespace) -> int:
+    """Walk every collection page."""
+    count = 0
+    async with client.iter_collection(count=args.page_size) as items:
+        async for _ in items:
+            count += 1
+    return count
+
+
+async def bench_feed(client: BandcampAPIClient, args: argparse.Namespace) -> int:
+    """Walk the whole feed history."""
+    count = 0
+    async with client.iter_feed() as feed:
+        async for _ in feed:
+            count += 1
+    return count
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "search": bench_search,
+    "artists": bench_artists,
+    "hydration": bench_hydration,
+    "collection": bench_collection,
+    "feed": bench_feed,
+}
+
+
+def make_client(server: FakeBandcamp, args: argparse.Namespace) -> BandcampAPIClient:
+    """Create a client with retries, so injected failures are retried."""
+    policy = RetryPolicy(max_attempts=args.max_attempts, base_delay=0.01)
+    return server.client(retry_policy=policy)
+
+
+async def run_scenario(scenario: Scenario, args: argparse.Namespace) -> ScenarioResult:
+    """Run a scenario against a fresh server, then again to measure memory."""
+    async with FakeBandcamp(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        collection_size=args.collection_size,
+        feed_size=args.feed_size,
+    ) as server:
+        async with make_client(server, args) as client:
+            latencies, failures = record_latencies(client)
+            started = perf_counter()
+            items = await scenario(client, args)
+            seconds = perf_counter() - started
+
+        # Memory is measured in a separate run: tracemalloc slows allocation
+        async with make_client(server, args) as client:
+            tracemalloc.start()
+            await scenario(client, args)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    return ScenarioResult(
+        items=items,
+        seconds=round(seconds, 4),
+        items_per_sec=round(items / seconds, 1) if seconds else 0.0,
+        requests=len(latencies),
+        p50_ms=round(percentile(latencies, 50) * 1000, 2),
+        p99_ms=round(percentile(latencies, 99) * 1000, 2),
+        peak_kib=round(peak / 1024, 1),
+        failed_requests=failures[0],
+    )
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Return a message per scenario whose throughput regressed."""
+    regressions = []
+    for name, result in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before or not before["items_per_sec"]:
+            continue
+        ratio = result["items_per_sec"] / before["items_per_sec"]
+        if ratio < 1 - threshold:
+            regressions.append(
+                f"{name}: {result['items_per_sec']} items/s vs "
+                f"{before['items_per_sec']} in baseline ({ratio:.0%})"
+            )
+    return regressions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)} (default: all)"
+    )
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.005, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--max-attempts", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--searches", type=int, default=200)
+    parser.add_argument("--artists", type=int, default=200)
+    parser.add_argument("--collection-size", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--feed-size", type=int, default=500)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed throughput drop"
+    )
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    return args
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the selected scenarios and return the results document."""
+    names = args.scenarios or list(SCENARIOS)
+    scenarios = {}
+    for name in names:
+        scenarios[name] = asdict(await run_scenario(SCENARIOS[name], args))
+    return {
+        "python": platform.python_version(),
+        "config": {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("scenarios", "output", "compare")
+        },
+        "scenarios": scenarios,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks, print a table and return the exit status."""
+    args = parse_args(argv)
+    results = asyncio.run(run(args))
+
+    print(
+        f"{'scenario':<12} {'items':>7} {'items/s':>10} {'requests':>9} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'peak KiB':>10} {'failed':>7}"
+    )
+    for name, r in results["scenarios"].items():
+        print(
+            f"{name:<12} {r['items']:>7} {r['items_per_sec']:>10.1f} "
+            f"{r['requests']:>9} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+            f"{r['peak_kib']:>10.1f} {r['failed_requests']:>7}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.compare:
+        regressions = compare(
+            results, json.loads(args.compare.read_text()), args.threshold
+        )
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
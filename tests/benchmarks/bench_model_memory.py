@@ -0,0 +1,85 @@
+"""Measure the memory footprint of model instances.
+
+Run with ``python tests/benchmarks/bench_model_memory.py``. Reports the
+bytes allocated per instance (object plus its ``__dict__`` when it has one)
+for the models held in large numbers, excluding field values, which are
+shared between all instances built here.
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+
+from bandcamp_async_api.models import (
+    BCArtist,
+    BCTrack,
+    CollectionItem,
+    FeedStory,
+    FeedTrack,
+    FollowingItem,
+    SearchResultAlbum,
+)
+
+ARTIST = BCArtist(id=1, name="Artist", url="https://artist.bandcamp.com")
+
+FACTORIES = {
+    "CollectionItem": lambda i: CollectionItem(
+        item_type="album",
+        item_id=i,
+        band_id=1,
+        tralbum_type="a",
+        band_name="Artist",
+        item_title="Title",
+        token="token",
+    ),
+    "FollowingItem": lambda i: FollowingItem(band_id=i, name="Artist"),
+    "FeedStory": lambda i: FeedStory(
+        story_type="nr",
+        fan_id=1,
+        item_id=i,
+        item_type="a",
+        tralbum_id=i,
+        tralbum_type="a",
+        band_id=1,
+    ),
+    "FeedTrack": lambda i: FeedTrack(track_id=i, title="Title"),
+    "BCTrack": lambda i: BCTrack(id=i, title="Title", artist=ARTIST),
+    "SearchResultAlbum": lambda i: SearchResultAlbum(
+        id=i, name="Title", url="https://artist.bandcamp.com/album/title"
+    ),
+}
+
+
+def bytes_per_instance(factory, count: int) -> float:
+    """Return the average bytes allocated per instance built by ``factory``."""
+    ids = list(range(1000, 1000 + count))  # allocate the ints up front
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(i) for i in ids]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    list_size = sys.getsizeof(instances)
+    return (after - before - list_size) / len(instances)
+
+
+def main() -> None:
+    """Print bytes per instance for every benchmarked model."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args()
+
+    results = {
+        name: round(bytes_per_instance(factory, args.count), 1)
+        for name, factory in FACTORIES.items()
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, size in results.items():
+        print(f"{name:<20} {size:>8.1f} bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
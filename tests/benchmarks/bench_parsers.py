@@ -0,0 +1,226 @@
+"""Measure BandcampParsers throughput and allocations.
+
+Run with ``python tests/benchmarks/bench_parsers.py``. Parses synthetic
+payloads (see ``payloads.py``) of configurable size and reports, per
+case, items parsed per second and the memory blocks and bytes allocated
+per item.
+
+Throughput depends on the machine, so it is also reported as a score
+relative to a fixed pure-Python calibration loop timed in the same run;
+the score is what ``--check`` compares against the stored baseline
+(``parser_baseline.json``), together with allocations per item. Update
+the baseline with ``--update-baseline`` after an intended change.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from payloads import T0, album_payload, collection_page, feed_page, search_payload
+
+from bandcamp_async_api.parsers import BandcampParsers
+
+BASELINE = Path(__file__).with_name("parser_baseline.json")
+DEFAULT_THRESHOLD = 0.25  # allowed relative regression
+
+
+@dataclass(slots=True)
+class Case:
+    """A payload and the parse call whose throughput is measured."""
+
+    payload: Any
+    items: int  # items parsed per call
+    parse: Callable[[BandcampParsers, Any], Any]
+
+
+@dataclass(slots=True)
+class CaseResult:
+    """Measurements of one case."""
+
+    items: int
+    items_per_sec: float
+    score: float  # items_per_sec relative to the calibration loop
+    blocks_per_item: float
+    bytes_per_item: float
+
+
+def build_cases(size: int) -> dict[str, Case]:
+    """Build the benchmark cases with ``size`` items each."""
+    collection = collection_page(1, None, size, size)["items"]
+    search = search_payload("query", size)["results"]
+    return {
+        "parse_album": Case(
+            album_payload(1000, 20000, tracks=size),
+            size,
+            lambda p, data: p.parse_album(data),
+        ),
+        "parse_collection_item": Case(
+            collection,
+            size,
+            lambda p, items: [p.parse_collection_item(item) for item in items],
+        ),
+        "parse_feed_response": Case(
+            feed_page(T0 + 1, stories=size, size=size),
+            size,
+            lambda p, data: p.parse_feed_response(data),
+        ),
+        "parse_search_result_item": Case(
+            search,
+            size,
+            lambda p, items: [p.parse_search_result_item(item) for item in items],
+        ),
+    }
+
+
+def calibrate(rounds: int = 5) -> float:
+    """Return operations per second of a fixed dict- and str-heavy loop."""
+    best = float("inf")
+    for _ in range(rounds):
+        started = perf_counter()
+        for i in range(100_000):
+            _ = {"id": i, "name": str(i), "tags": [i]}
+        best = min(best, perf_counter() - started)
+    return 100_000 / best
+
+
+def time_case(case: Case, rounds: int) -> float:
+    """Return the best seconds per call over ``rounds`` calls."""
+    parsers = BandcampParsers()
+    case.parse(parsers, case.payload)  # warm up the parse context
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = perf_counter()
+            case.parse(parsers, case.payload)
+            best = min(best, perf_counter() - started)
+    finally:
+        gc.enable()
+    return best
+
+
+def allocations(case: Case) -> tuple[int, int]:
+    """Return the blocks and bytes one warm call leaves allocated."""
+    parsers = BandcampParsers()
+    case.parse(parsers, case.payload)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = case.parse(parsers, case.payload)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    del result
+    blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    size = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    return blocks, size
+
+
+def run(size: int = 500, rounds: int = 20) -> dict[str, Any]:
+    """Measure every case and return the results document."""
+    calibrations = []
+    cases = {}
+    for name, case in build_cases(size).items():
+        # Calibrate right before each case so both see the same CPU speed
+        ops_per_sec = calibrate()
+        calibrations.append(ops_per_sec)
+        seconds = time_case(case, rounds)
+        blocks, allocated = allocations(case)
+        items_per_sec = case.items / seconds
+        cases[name] = asdict(
+            CaseResult(
+                items=case.items,
+                items_per_sec=round(items_per_sec, 1),
+                score=round(items_per_sec / ops_per_sec, 4),
+                blocks_per_item=round(blocks / case.items, 2),
+                bytes_per_item=round(allocated / case.items, 1),
+            )
+        )
+    return {
+        "python": platform.python_version(),
+        "size": size,
+        "calibration_ops_per_sec": round(max(calibrations), 1),
+        "cases": cases,
+    }
+
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    """Return a message per case that regressed against the baseline.
+
+    A case regresses when its score drops, or its blocks allocated per item
+    grow, by more than ``threshold``. Allocations are only compared when
+    both runs used the same Python minor version.
+    """
+    same_python = (
+        results["python"].rsplit(".", 1)[0] == baseline["python"].rsplit(".", 1)[0]
+    )
+    regressions = []
+    for name, result in results["cases"].items():
+        before = baseline["cases"].get(name)
+        if before is None:
+            continue
+        if result["score"] < before["score"] * (1 - threshold):
+            regressions.append(
+                f"{name}: score {result['score']} vs {before['score']} in baseline"
+            )
+        if same_python and result["blocks_per_item"] > before["blocks_per_item"] * (
+            1 + threshold
+        ):
+            regressions.append(
+                f"{name}: {result['blocks_per_item']} blocks/item vs "
+                f"{before['blocks_per_item']} in baseline"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks, print a table and return the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=500, help="items per payload")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--check", action="store_true", help="fail on regression")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = run(args.size, args.rounds)
+    print(
+        f"{'case':<26} {'items/s':>12} {'score':>8} {'blocks/item':>12} "
+        f"{'bytes/item':>11}"
+    )
+    for name, r in results["cases"].items():
+        print(
+            f"{name:<26} {r['items_per_sec']:>12.1f} {r['score']:>8.4f} "
+            f"{r['blocks_per_item']:>12.2f} {r['bytes_per_item']:>11.1f}"
+        )
+
+    document = json.dumps(results, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(document)
+    if args.update_baseline:
+        args.baseline.write_text(document)
+    if args.check:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+"""Benchmark test configuration."""
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip timing-sensitive benchmarks unless selected with ``-m benchmark``."""
+    if "benchmark" in (config.option.markexpr or ""):
+        return
+    skip = pytest.mark.skip(reason="benchmark: run with -m benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,196 @@
+"""Local stand-in for the Bandcamp API, for offline benchmarks.
+
+Serves synthetic payloads (see ``payloads.py``) for the endpoints the
+client uses, with configurable latency, server errors and 429s::
+
+    async with FakeBandcamp(latency=0.02, rate_limit_rate=0.01) as server:
+        async with server.client() as client:
+            await client.get_album(1000, 20000)
+"""
+
+import asyncio
+import random
+from collections import Counter
+from typing import Any
+
+from aiohttp import web
+from payloads import (
+    album_payload,
+    band_payload,
+    collection_page,
+    feed_page,
+    search_payload,
+)
+
+from bandcamp_async_api import BandcampAPIClient
+
+FAN_ID = 4242
+
+
+class FakeBandcamp:
+    """aiohttp server answering Bandcamp API requests on localhost."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 0,
+        collection_size: int = 500,
+        feed_size: int = 500,
+        feed_page_size: int = 20,
+        search_results: int = 20,
+        album_tracks: int = 12,
+        band_releases: int = 30,
+        seed: int = 0,
+    ):
+        """Initialize the server.
+
+        Args:
+            latency: Seconds every response is delayed by.
+            jitter: Extra delay drawn uniformly from [0, jitter] seconds.
+            error_rate: Share of requests answered with a 503.
+            rate_limit_rate: Share of requests answered with a 429.
+            retry_after: Retry-After header value of 429 responses.
+            collection_size: Items in every fan's collection.
+            feed_size: Stories in the feed.
+            feed_page_size: Stories per feed page.
+            search_results: Results per search.
+            album_tracks: Tracks per album.
+            band_releases: Discography entries per band.
+            seed: Seed of the error and jitter draws.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.collection_size = collection_size
+        self.feed_size = feed_size
+        self.feed_page_size = feed_page_size
+        self.search_results = search_results
+        self.album_tracks = album_tracks
+        self.band_releases = band_releases
+        self.random = random.Random(seed)
+        self.requests: Counter[str] = Counter()  # per endpoint
+        self.statuses: Counter[int] = Counter()
+        self.bytes_sent = 0
+        self.url = ""
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Replacement for ``BandcampAPIClient.BASE_URL``."""
+        return f"{self.url}/api"
+
+    @property
+    def feed_url(self) -> str:
+        """Replacement for ``BandcampAPIClient.FEED_URL``."""
+        return f"{self.url}/fan_dash_feed_updates"
+
+    def app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application(middlewares=[self._faults])
+        app.router.add_get("/api/fuzzysearch/1/app_autocomplete", self._search)
+        app.router.add_get("/api/mobile/24/tralbum_details", self._tralbum)
+        app.router.add_post("/api/mobile/24/band_details", self._band)
+        app.router.add_get("/api/fan/2/collection_summary", self._summary)
+        app.router.add_post("/api/fancollection/1/{collection_type}", self._collection)
+        app.router.add_post("/fan_dash_feed_updates", self._feed)
+        return app
+
+    async def start(self) -> None:
+        """Listen on a free localhost port."""
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        """Shut the server down."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    def configure(self, client: BandcampAPIClient) -> BandcampAPIClient:
+        """Point a client at this server."""
+        client.BASE_URL = self.base_url
+        client.FEED_URL = self.feed_url
+        return client
+
+    def client(self, **kwargs) -> BandcampAPIClient:
+        """Create a logged-in client pointed at this server."""
+        kwargs.setdefault("identity_token", "benchmark")
+        return self.configure(BandcampAPIClient(**kwargs))
+
+    @web.middleware
+    async def _faults(self, request: web.Request, handler) -> web.StreamResponse:
+        self.requests[request.path.rsplit("/", 1)[-1]] += 1
+        delay = self.latency + self.random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        draw = self.random.random()
+        if draw < self.rate_limit_rate:
+            response = web.Response(
+                status=429, headers={"Retry-After": str(self.retry_after)}
+            )
+        elif draw < self.rate_limit_rate + self.error_rate:
+            response = web.Response(status=503)
+        else:
+            response = await handler(request)
+        self.statuses[response.status] += 1
+        self.bytes_sent += response.content_length or 0
+        return response
+
+    async def _search(self, request: web.Request) -> web.Response:
+        query = request.query.get("q", "")
+        return web.json_response(search_payload(query, self.search_results))
+
+    async def _tralbum(self, request: web.Request) -> web.Response:
+        band_id = int(request.query["band_id"])
+        tralbum_id = int(request.query["tralbum_id"])
+        payload: dict[str, Any] = album_payload(band_id, tralbum_id, self.album_tracks)
+        if request.query.get("tralbum_type") == "t":
+            payload["tracks"] = payload["tracks"][:1]
+        return web.json_response(payload)
+
+    async def _band(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response(band_payload(int(body["band_id"]), self.band_releases))
+
+    async def _summary(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"fan_id": FAN_ID, "collection_count": self.collection_size}
+        )
+
+    async def _collection(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response(
+            collection_page(
+                int(body["fan_id"]),
+                body.get("older_than_token"),
+                int(body.get("count", 50)),
+                self.collection_size,
+            )
+        )
+
+    async def _feed(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        return web.json_response(
+            feed_page(
+                int(str(form["older_than"])),
+                stories=self.feed_page_size,
+                size=self.feed_size,
+            )
+        )
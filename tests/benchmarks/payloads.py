@@ -0,0 +1,287 @@
+"""Synthetic Bandcamp API payloads for benchmarks.
+
+The payloads follow the shape of real responses (see the fixtures in
+``tests/conftest.py``) and are deterministic: the same arguments always
+build the same payload. Sizes are parameters, so parsers and the client
+can be measured on responses far larger than the recorded samples.
+"""
+
+from email.utils import formatdate
+from typing import Any
+
+# 13 Mar 2026 18:27:25 GMT, the newest item of every collection and feed
+T0 = 1773426445
+
+GENRES = ["Electronic", "Ambient", "Folk", "Rock", "Jazz", "Metal", "Hip-Hop/Rap"]
+TAGS = ["electronic", "ambient", "folk", "experimental", "drone", "techno"]
+CURRENCIES = ["USD", "EUR", "GBP"]
+
+
+def band_url(band_id: int) -> str:
+    """Return the page URL of a synthetic band."""
+    return f"https://band{band_id}.bandcamp.com"
+
+
+def band_name(band_id: int) -> str:
+    """Return the name of a synthetic band."""
+    return f"Band {band_id}"
+
+
+def search_payload(query: str, results: int = 20) -> dict[str, Any]:
+    """Build a fuzzysearch response with bands, albums and tracks in turn.
+
+    Result URLs repeat the band URL in front, as the real endpoint does.
+    """
+    entries = []
+    for i in range(results):
+        band_id = 1000 + i
+        kind = "bat"[i % 3]
+        entry: dict[str, Any] = {"type": kind, "id": 10_000 + i, "img_id": 500 + i}
+        if kind == "b":
+            entry |= {
+                "id": band_id,
+                "name": f"{query} {band_name(band_id)}",
+                "url": band_url(band_id) * 2,
+                "location": "Test City",
+                "is_label": i % 7 == 0,
+                "tag_names": TAGS[: 1 + i % len(TAGS)],
+                "genre_name": GENRES[i % len(GENRES)],
+            }
+        else:
+            path = "album" if kind == "a" else "track"
+            entry |= {
+                "name": f"{query} Release {i}",
+                "url": f"{band_url(band_id) * 2}/{path}/release-{i}",
+                "band_id": band_id,
+                "band_name": band_name(band_id),
+                "art_id": 2000 + i,
+            }
+            if kind == "t":
+                entry |= {"album_name": f"Album {i}", "album_id": 20_000 + i}
+        entries.append(entry)
+    return {"results": entries}
+
+
+def album_payload(band_id: int, album_id: int, tracks: int = 12) -> dict[str, Any]:
+    """Build a tralbum_details response for an album with ``tracks`` tracks."""
+    url = f"{band_url(band_id)}/album/album-{album_id}"
+    return {
+        "id": album_id,
+        "title": f"Album {album_id}",
+        "bandcamp_url": url,
+        "art_id": album_id % 10_000_000,
+        "release_date": T0 - album_id % 100_000,
+        "price": 7.0,
+        "currency": CURRENCIES[album_id % len(CURRENCIES)],
+        "is_preorder": False,
+        "is_purchasable": True,
+        "is_set_price": True,
+        "about": "An album about nothing in particular. " * 8,
+        "credits": "Written and performed by the band. Mastered elsewhere.",
+        "tags": [{"name": tag} for tag in TAGS[:4]],
+        "num_downloadable_tracks": tracks,
+        "tracks": [
+            {
+                "track_id": album_id * 100 + n,
+                "title": f"Track {n}",
+                "duration": 120.0 + n * 7.5,
+                "track_num": n,
+                "streaming_url": {
+                    "mp3-128": f"https://t4.bcbits.com/stream/{album_id}/{n}"
+                },
+                "lyrics": "La la la\n" * 12 if n % 3 == 0 else None,
+                "is_streamable": True,
+            }
+            for n in range(1, tracks + 1)
+        ],
+        "band": {"band_id": band_id, "name": band_name(band_id), "location": "City"},
+        "tralbum_artist": band_name(band_id),
+    }
+
+
+def band_payload(band_id: int, releases: int = 30) -> dict[str, Any]:
+    """Build a band_details response with ``releases`` discography entries."""
+    return {
+        "id": band_id,
+        "name": band_name(band_id),
+        "bandcamp_url": band_url(band_id),
+        "location_text": "Test City, Country",
+        "bio_image_id": band_id % 10_000_000,
+        "bio": "A band that makes music. " * 10,
+        "tags": [{"name": tag} for tag in TAGS[:3]],
+        "genre_name": GENRES[band_id % len(GENRES)],
+        "band": {"is_label": False},
+        "discography": [
+            {
+                "item_id": band_id * 1000 + n,
+                "item_type": "album" if n % 4 else "track",
+                "band_id": band_id,
+                "title": f"Release {n}",
+                "artist_name": None,
+                "band_name": band_name(band_id),
+                "art_id": 3000 + n,
+                "release_date": formatdate(T0 - n * 86400, usegmt=True),
+                "is_purchasable": True,
+            }
+            for n in range(releases)
+        ],
+    }
+
+
+def collection_item(fan_id: int, index: int, bands: int = 200) -> dict[str, Any]:
+    """Build the ``index``-th (newest first) item of a fan's collection."""
+    band_id = 1000 + index % bands
+    item_id = 50_000 + index
+    is_track = index % 5 == 0
+    timestamp = T0 - index * 60
+    return {
+        "fan_id": fan_id,
+        "item_type": "track" if is_track else "album",
+        "item_id": item_id,
+        "band_id": band_id,
+        "tralbum_type": "t" if is_track else "a",
+        "band_name": band_name(band_id),
+        "item_title": f"Release {item_id}",
+        "item_url": f"{band_url(band_id)}/album/release-{item_id}",
+        "art_id": 4000 + index,
+        "num_streamable_tracks": 1 if is_track else 10,
+        "is_purchasable": True,
+        "price": {"currency": CURRENCIES[index % 3], "amount": 8.0},
+        "token": f"{timestamp}:{item_id}:a::",
+    }
+
+
+def token_timestamp(token: str | None) -> float:
+    """Return the timestamp part of an ``older_than_token``."""
+    if not token:
+        return float("inf")
+    try:
+        return float(token.split(":", 1)[0])
+    except ValueError:
+        return float("inf")
+
+
+def collection_page(
+    fan_id: int, older_than_token: str | None, count: int, size: int
+) -> dict[str, Any]:
+    """Build the fancollection page after ``older_than_token``.
+
+    The collection holds ``size`` items, one minute apart, newest at T0.
+    """
+    older_than = token_timestamp(older_than_token)
+    # Index of the first item strictly older than the token
+    start = 0 if older_than > T0 else max(0, int((T0 - older_than) // 60) + 1)
+    end = min(size, start + count)
+    items = [collection_item(fan_id, i) for i in range(start, end)]
+    return {
+        "items": items,
+        "more_available": end < size,
+        "last_token": items[-1]["token"] if items else None,
+    }
+
+
+def feed_page(
+    older_than: int,
+    stories: int = 20,
+    size: int = 1000,
+    fans: int = 50,
+    bands: int = 200,
+) -> dict[str, Any]:
+    """Build the fan_dash_feed_updates page before ``older_than``.
+
+    The feed holds ``size`` stories, one hour apart, newest at T0. Stories
+    reference ``fans`` fans and ``bands`` bands in turn, so later pages
+    repeat fan_info and band_info entries of earlier ones.
+    """
+    start = 0 if older_than > T0 else (T0 - older_than) // 3600 + 1
+    indexes = range(start, min(size, start + stories))
+    entries, tracks = [], []
+    fan_info, band_info = {}, {}
+    for i in indexes:
+        fan_id = 7000 + i % fans
+        band_id = 1000 + i % bands
+        item_id = 90_000 + i
+        track_id = item_id * 10
+        is_track = i % 4 == 0
+        timestamp = T0 - i * 3600
+        entries.append(
+            {
+                "fan_id": fan_id,
+                "item_id": item_id,
+                "item_type": "t" if is_track else "a",
+                "tralbum_id": item_id,
+                "tralbum_type": "t" if is_track else "a",
+                "band_id": band_id,
+                "story_date": formatdate(timestamp, usegmt=True),
+                "story_type": "nr" if i % 3 else "np",
+                "item_title": f"Release {item_id}",
+                "item_url": f"{band_url(band_id)}/album/release-{item_id}",
+                "item_art_url": f"https://f4.bcbits.com/img/a{item_id}_9.jpg",
+                "item_art_id": item_id,
+                "band_name": band_name(band_id),
+                "band_url": band_url(band_id),
+                "genre_id": i % 20,
+                "is_purchasable": True,
+                "currency": CURRENCIES[i % 3],
+                "price": 9.0,
+                "is_preorder": False,
+                "num_streamable_tracks": 1 if is_track else 10,
+                "also_collected_count": i % 30,
+                "featured_track": track_id,
+                "featured_track_title": f"Track {track_id}",
+                "featured_track_duration": 200.5,
+                "tags": [{"name": "Folk", "norm_name": "folk"}],
+            }
+        )
+        tracks.append(
+            {
+                "track_id": track_id,
+                "title": f"Track {track_id}",
+                "track_num": None if is_track else 1,
+                "streaming_url": {
+                    "mp3-128": f"https://bandcamp.com/stream_redirect?track_id={track_id}"
+                },
+                "duration": 200.5,
+                "album_title": f"Release {item_id}",
+                "band_name": band_name(band_id),
+                "art_id": item_id,
+                "album_id": None if is_track else item_id,
+                "band_id": band_id,
+                "is_purchasable": True,
+                "currency": CURRENCIES[i % 3],
+                "price": 9.0,
+                "track_url": f"{band_url(band_id)}/track/track-{track_id}",
+            }
+        )
+        fan_info[str(fan_id)] = {
+            "fan_id": fan_id,
+            "name": f"Fan {fan_id}",
+            "username": f"fan{fan_id}",
+            "trackpipe_url": f"https://bandcamp.com/fan{fan_id}",
+            "image_id": fan_id,
+            "collection_size": fan_id % 5000,
+            "fav_genre_name": GENRES[fan_id % len(GENRES)],
+        }
+        band_info[str(band_id)] = {
+            "name": band_name(band_id),
+            "band_id": band_id,
+            "image_id": band_id,
+            "genre_id": band_id % 20,
+            "followed": 1,
+        }
+
+    dates = [T0 - i * 3600 for i in indexes]
+    return {
+        "ok": True,
+        "stories": {
+            "entries": entries,
+            "oldest_story_date": min(dates) if dates else None,
+            "newest_story_date": max(dates) if dates else None,
+            "track_list": tracks,
+            "feed_timestamp": None,
+        },
+        "fan_info": fan_info,
+        "band_info": band_info,
+        "story_collectors": {},
+        "item_lookup": {},
+    }
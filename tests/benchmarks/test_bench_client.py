@@ -0,0 +1,90 @@
+"""Smoke tests for the offline benchmark harness."""
+
+import json
+
+import pytest
+from bench_client import compare, main, percentile
+from fake_server import FAN_ID, FakeBandcamp
+
+from bandcamp_async_api.client import BandcampRateLimitError
+
+
+class TestFakeBandcamp:
+    """Test the fake server against the real client."""
+
+    @pytest.mark.asyncio
+    async def test_serves_client_endpoints(self):
+        """Every endpoint the benchmarks use answers in the real shape."""
+        async with (
+            FakeBandcamp(collection_size=120, feed_size=30) as server,
+            server.client() as client,
+        ):
+            assert len(await client.search("query")) == server.search_results
+            album = await client.get_album(1000, 50001)
+            assert len(album.tracks) == server.album_tracks
+            artist = await client.get_artist_with_discography(1000)
+            assert len(artist.discography) == server.band_releases
+
+            items = [item async for item in client.iter_collection(count=50)]
+            assert len(items) == 120
+            assert len({item.item_id for item in items}) == 120
+            assert client._fan_id == FAN_ID
+
+            stories = [story async for story, _ in client.iter_feed()]
+            assert len(stories) == 30
+
+    @pytest.mark.asyncio
+    async def test_injects_rate_limits(self):
+        """429s are served at the configured rate."""
+        async with (
+            FakeBandcamp(rate_limit_rate=1.0, retry_after=7) as server,
+            server.client() as client,
+        ):
+            with pytest.raises(BandcampRateLimitError) as excinfo:
+                await client.search("query")
+        assert excinfo.value.retry_after == 7
+        assert server.statuses[429] == 1
+
+
+class TestBenchClient:
+    """Test the benchmark runner."""
+
+    def test_percentile(self):
+        """Nearest-rank percentiles."""
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) == 0.0
+
+    def test_runs_and_compares(self, tmp_path):
+        """A small run writes JSON results and passes against itself."""
+        output = tmp_path / "results.json"
+        args = [
+            "--latency=0",
+            "--jitter=0",
+            "--error-rate=0.05",
+            "--rate-limit-rate=0.05",
+            "--searches=10",
+            "--artists=10",
+            "--collection-size=30",
+            "--page-size=10",
+            "--feed-size=30",
+            f"--output={output}",
+        ]
+
+        assert main(args) == 0
+        results = json.loads(output.read_text())
+        assert set(results["scenarios"]) == {
+            "search",
+            "artists",
+            "hydration",
+            "collection",
+            "feed",
+        }
+        assert results["scenarios"]["collection"]["items"] == 30
+        assert results["scenarios"]["feed"]["items"] == 30
+        assert not compare(results, results, threshold=0.2)
+
+        slower = json.loads(output.read_text())
+        slower["scenarios"]["feed"]["items_per_sec"] *= 2
+        assert compare(results, slower, threshold=0.2)[0].startswith("feed:")
@@ -0,0 +1,52 @@
+"""Tests for the parser benchmarks and their regression gate."""
+
+import copy
+import json
+
+import pytest
+from bench_parsers import BASELINE, build_cases, compare, run
+
+from bandcamp_async_api.models import BCAlbum, FeedResponse
+from bandcamp_async_api.parsers import BandcampParsers
+
+
+class TestBenchParsers:
+    """Test the payload generator, runner and comparison."""
+
+    def test_cases_parse(self):
+        """Every generated payload parses into the expected number of items."""
+        parsers = BandcampParsers()
+        cases = build_cases(6)
+
+        album = cases["parse_album"].parse(parsers, cases["parse_album"].payload)
+        assert isinstance(album, BCAlbum)
+        assert len(album.tracks) == 6
+        feed_case = cases["parse_feed_response"]
+        feed = feed_case.parse(parsers, feed_case.payload)
+        assert isinstance(feed, FeedResponse)
+        assert len(feed.stories) == 6
+        assert all(feed.track_for(story) for story in feed.stories)
+        for name in ("parse_collection_item", "parse_search_result_item"):
+            case = cases[name]
+            assert len([i for i in case.parse(parsers, case.payload) if i]) == 6
+
+    def test_compare(self):
+        """Score drops and allocation growth beyond the threshold are reported."""
+        baseline = json.loads(BASELINE.read_text())
+        results = copy.deepcopy(baseline)
+        assert not compare(results, baseline)
+
+        results["cases"]["parse_album"]["score"] *= 0.5
+        results["cases"]["parse_feed_response"]["blocks_per_item"] *= 2
+        regressions = compare(results, baseline)
+        assert [message.split(":")[0] for message in regressions] == [
+            "parse_album",
+            "parse_feed_response",
+        ]
+
+    @pytest.mark.benchmark
+    def test_within_baseline(self):
+        """Parse speed and allocations have not regressed."""
+        baseline = json.loads(BASELINE.read_text())
+        results = run(baseline["size"])
+        assert not compare(results, baseline)
@@ -68,7 +68,7 @@ def mock_response():
     """Mock aiohttp ClientResponse."""
     response = Mock()
     response.raise_for_status = Mock()
-    response.json = AsyncMock()
+    response.read = AsyncMock()
     return response
 
 
@@ -0,0 +1,136 @@
+"""Tests for batch fetching."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from bandcamp_async_api.batch import BatchIterator, BatchResult, fetch_batch
+from bandcamp_async_api.client import BandcampAPIClient, BandcampNotFoundError
+
+
+class TestFetchBatch:
+    """Test concurrency, ordering, dedupe and errors."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self):
+        """Results follow the input order whatever the completion order."""
+
+        async def fetch(key):
+            await asyncio.sleep(0.01 * (3 - key))
+            return key * 10
+
+        results = await fetch_batch([1, 2, 3], fetch, concurrency=3)
+        assert [r.value for r in results] == [10, 20, 30]
+        assert all(r.ok for r in results)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than `concurrency` fetches run at once."""
+        running = peak = 0
+
+        async def fetch(key):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return key
+
+        await fetch_batch(range(20), fetch, concurrency=4)
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_duplicates_fetched_once(self):
+        """Duplicate keys share one fetch and one result."""
+        calls = []
+
+        async def fetch(key):
+            calls.append(key)
+            return key
+
+        results = await fetch_batch([1, 2, 1], fetch)
+        assert sorted(calls) == [1, 2]
+        assert results[0] is results[2]
+
+    @pytest.mark.asyncio
+    async def test_errors_do_not_fail_fast(self):
+        """A failing item carries its error; the others still succeed."""
+
+        async def fetch(key):
+            if key == 2:
+                raise BandcampNotFoundError("No such album")
+            return key
+
+        results = await fetch_batch([1, 2, 3], fetch)
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, BandcampNotFoundError)
+        with pytest.raises(BandcampNotFoundError):
+            results[1].unwrap()
+        assert results[2].unwrap() == 3
+
+    @pytest.mark.asyncio
+    async def test_iterator_streams_and_cancels(self):
+        """Results stream as they complete; closing cancels the rest."""
+        release = asyncio.Event()
+
+        async def fetch(key):
+            if key != 1:
+                await release.wait()
+            return key
+
+        async with BatchIterator([1, 2, 3], fetch, concurrency=3) as batch:
+            first = await anext(batch)
+            workers = list(batch._tasks)
+        assert first == BatchResult(1, 1)
+        assert all(worker.done() for worker in workers)
+
+    def test_invalid_concurrency(self):
+        """Concurrency must allow at least one fetch."""
+        with pytest.raises(ValueError):
+            BatchIterator([1], None, concurrency=0)
+
+
+class TestClientBatch:
+    """Test the client's batch methods."""
+
+    @pytest.mark.asyncio
+    async def test_get_albums(self):
+        """Albums are fetched per (artist_id, album_id) pair."""
+        client = BandcampAPIClient()
+
+        async def get_album(artist_id, album_id):
+            return (artist_id, album_id)
+
+        with patch.object(client, "get_album", side_effect=get_album) as mock:
+            results = await client.get_albums([(1, 10), [1, 11], (1, 10)])
+
+        assert [r.value for r in results] == [(1, 10), (1, 11), (1, 10)]
+        assert mock.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_artists(self):
+        """Artists stream through the batch iterator."""
+        client = BandcampAPIClient()
+
+        async def get_artist(artist_id):
+            return artist_id
+
+        with patch.object(client, "get_artist", side_effect=get_artist):
+            async with client.iter_artists([3, 4], concurrency=1) as batch:
+                keys = [result.key async for result in batch]
+
+        assert keys == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_get_tracks(self):
+        """Track errors are reported per item."""
+        client = BandcampAPIClient()
+
+        with patch.object(
+            client, "get_track", side_effect=BandcampNotFoundError("No such track")
+        ):
+            results = await client.get_tracks([(1, 2)])
+
+        assert results[0].key == (1, 2)
+        assert not results[0].ok
@@ -0,0 +1,212 @@
+"""Tests for the response cache."""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from bandcamp_async_api.cache import CacheBackend, MemoryCache, ResponseCache
+from bandcamp_async_api.client import BandcampAPIClient, BandcampNotFoundError
+
+
+class TestMemoryCache:
+    """Test the in-memory LRU backend."""
+
+    @pytest.mark.asyncio
+    async def test_get_set_and_size_accounting(self):
+        """Test that stored bodies are returned and counted in bytes."""
+        cache = MemoryCache()
+        await cache.set("k", b"12345", ttl=60)
+
+        assert await cache.get("k") == b"12345"
+        assert cache.size_bytes == len("k") + 5
+        assert len(cache) == 1
+
+        await cache.delete("k")
+        assert cache.size_bytes == 0
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_dropped(self):
+        """Test that an entry past its TTL is not returned."""
+        cache = MemoryCache()
+        with patch("bandcamp_async_api.cache.monotonic", return_value=100.0):
+            await cache.set("k", b"v", ttl=10)
+        with patch("bandcamp_async_api.cache.monotonic", return_value=111.0):
+            assert await cache.get("k") is None
+        assert cache.size_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_bytes(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = MemoryCache(max_bytes=30)
+        await cache.set("a", b"x" * 9, ttl=60)
+        await cache.set("b", b"x" * 9, ttl=60)
+        await cache.set("c", b"x" * 9, ttl=60)
+        await cache.get("a")  # "b" is now least recently used
+
+        await cache.set("d", b"x" * 9, ttl=60)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert cache.evictions == 1
+        assert cache.size_bytes <= 30
+
+    @pytest.mark.asyncio
+    async def test_oversized_entry_is_not_stored(self):
+        """Test that a body larger than the whole cache is skipped."""
+        cache = MemoryCache(max_bytes=10)
+        await cache.set("k", b"x" * 20, ttl=60)
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_prefix(self):
+        """Test prefix deletion used for per-endpoint invalidation."""
+        cache = MemoryCache()
+        await cache.set("band_details|1", b"a", ttl=60)
+        await cache.set("band_details|2", b"b", ttl=60)
+        await cache.set("tralbum_details|1", b"c", ttl=60)
+
+        assert await cache.delete_prefix("band_details|") == 2
+        assert len(cache) == 1
+
+    def test_memory_cache_satisfies_protocol(self):
+        """Test that MemoryCache implements the CacheBackend protocol."""
+        assert isinstance(MemoryCache(), CacheBackend)
+
+
+class TestResponseCache:
+    """Test TTL selection and counters."""
+
+    @pytest.mark.asyncio
+    async def test_only_endpoints_with_ttl_are_stored(self):
+        """Test that endpoints without a TTL are not cached."""
+        cache = ResponseCache(ttls={"band_details": 60})
+
+        await cache.set("band_details|x", "band_details", b"1")
+        await cache.set("search|x", "search", b"2")
+
+        assert cache.is_cacheable("band_details")
+        assert not cache.is_cacheable("search")
+        assert await cache.get("band_details|x") == b"1"
+        assert await cache.get("search|x") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_ratio == 0.5
+
+    @pytest.mark.asyncio
+    async def test_invalidate_endpoint(self):
+        """Test invalidating every response of one endpoint."""
+        cache = ResponseCache()
+        await cache.set("band_details|x", "band_details", b"1")
+        await cache.set("tralbum_details|x", "tralbum_details", b"2")
+
+        await cache.invalidate("band_details")
+
+        assert await cache.get("band_details|x") is None
+        assert await cache.get("tralbum_details|x") == b"2"
+
+
+class TestClientCaching:
+    """Test the cache wired into BandcampAPIClient."""
+
+    @staticmethod
+    def _respond(mock_session, payload):
+        response = AsyncMock()
+        response.status = 200
+        response.raise_for_status = Mock()
+        response.read = AsyncMock(return_value=json.dumps(payload).encode())
+        mock_session.get.return_value.__aenter__.return_value = response
+        mock_session.post.return_value.__aenter__.return_value = response
+
+    @pytest.mark.asyncio
+    async def test_repeat_album_lookup_is_served_from_cache(
+        self, mock_session, sample_album_data
+    ):
+        """Test that a second get_album call does not hit the network."""
+        self._respond(mock_session, sample_album_data)
+        client = BandcampAPIClient(session=mock_session, cache=ResponseCache())
+
+        first = await client.get_album(123, 789)
+        second = await client.get_album(123, 789)
+
+        assert mock_session.get.call_count == 1
+        assert first.title == second.title
+        assert first is not second
+        assert client.cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_search_is_cached_by_default(self, mock_session, sample_search_data):
+        """Test that the default TTLs cover search results."""
+        self._respond(mock_session, sample_search_data)
+        client = BandcampAPIClient(session=mock_session, cache=ResponseCache())
+
+        await client.search("test")
+        await client.search("test")
+
+        assert mock_session.get.call_count == 1
+        assert client.cache.ttl_for("search") == 300.0
+
+    @pytest.mark.asyncio
+    async def test_uncached_endpoint_always_requests(
+        self, mock_session, sample_search_data
+    ):
+        """Test that search is not cached when it has no TTL."""
+        self._respond(mock_session, sample_search_data)
+        cache = ResponseCache(ttls={"tralbum_details": 60})
+        client = BandcampAPIClient(session=mock_session, cache=cache)
+
+        await client.search("test")
+        await client.search("test")
+
+        assert mock_session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_error_responses_are_not_cached(self, mock_session):
+        """Test that API errors are raised again instead of cached."""
+        self._respond(mock_session, {"error": True, "error_message": "No such"})
+        client = BandcampAPIClient(session=mock_session, cache=ResponseCache())
+
+        for _ in range(2):
+            with pytest.raises(BandcampNotFoundError):
+                await client.get_track(123, 1)
+
+        assert mock_session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_artist(self, mock_session, sample_artist_data):
+        """Test that invalidate_artist forces the next lookup to refetch."""
+        self._respond(mock_session, sample_artist_data)
+        client = BandcampAPIClient(session=mock_session, cache=ResponseCache())
+
+        await client.get_artist(123)
+        await client.invalidate_artist(123)
+        await client.get_artist(123)
+
+        assert mock_session.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_artist_with_string_id(
+        self, mock_session, sample_artist_data
+    ):
+        """Test that an artist cached by int ID is invalidated by its str ID."""
+        self._respond(mock_session, sample_artist_data)
+        client = BandcampAPIClient(session=mock_session, cache=ResponseCache())
+
+        await client.get_artist(123)
+        await client.invalidate_artist("123")
+        await client.get_artist(123)
+
+        assert mock_session.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tralbum(self, mock_session, sample_album_data):
+        """Test that invalidate_tralbum forces the next lookup to refetch."""
+        self._respond(mock_session, sample_album_data)
+        client = BandcampAPIClient(session=mock_session, cache=ResponseCache())
+
+        await client.get_album(123, 789)
+        await client.invalidate_tralbum(123, 789)
+        await client.get_album(123, 789)
+
+        assert mock_session.get.call_count == 2
@@ -0,0 +1,197 @@
+"""Tests for cassette recording and replay."""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
+import pytest
+
+from bandcamp_async_api.cassette import (
+    Cassette,
+    CassetteMissError,
+    Interaction,
+    RecordingSession,
+    ReplaySession,
+)
+from bandcamp_async_api.client import BandcampAPIClient, BandcampRateLimitError
+from bandcamp_async_api.retry import RetryPolicy
+
+SEARCH_URL = f"{BandcampAPIClient.BASE_URL}/fuzzysearch/1/app_autocomplete"
+SEARCH_PARAMS = {"q": "query", "param_with_locations": "true"}
+
+
+def _search_interaction(sample_search_data, status=200, headers=None):
+    body = json.dumps(sample_search_data).encode() if status == 200 else b""
+    return Interaction(
+        method="GET",
+        url=SEARCH_URL,
+        status=status,
+        body=body,
+        params=SEARCH_PARAMS,
+        headers=headers or {},
+        duration=0.5,
+    )
+
+
+class TestCassette:
+    """Test storing interactions."""
+
+    @pytest.mark.parametrize("name", ["traffic.jsonl", "traffic.jsonl.gz"])
+    def test_save_and_load(self, tmp_path, name):
+        """Interactions survive a round trip, binary bodies included."""
+        cassette = Cassette(
+            [
+                Interaction("GET", SEARCH_URL, 200, b'{"results":[]}', SEARCH_PARAMS),
+                Interaction(
+                    "POST",
+                    f"{BandcampAPIClient.BASE_URL}/mobile/24/band_details",
+                    429,
+                    b"\xff\x00",
+                    json={"band_id": 1},
+                    headers={"Retry-After": "3"},
+                    duration=0.25,
+                ),
+            ]
+        )
+        cassette.save(tmp_path / name)
+
+        loaded = Cassette.load(tmp_path / name)
+        assert loaded.interactions == cassette.interactions
+
+    def test_rejects_unknown_version(self, tmp_path):
+        """Files of another format version are not read."""
+        path = tmp_path / "traffic.jsonl"
+        path.write_text('{"version": 99}\n')
+
+        with pytest.raises(ValueError, match="version"):
+            Cassette.load(path)
+
+
+class TestRecordingSession:
+    """Test recording real responses."""
+
+    @pytest.mark.asyncio
+    async def test_records_responses(self, sample_search_data, mock_async_context):
+        """Status, selected headers and body are recorded; request headers are not."""
+        response = Mock(status=200, headers={"Content-Type": "application/json"})
+        response.read = AsyncMock(return_value=json.dumps(sample_search_data).encode())
+        inner = Mock()
+        inner.request = Mock(return_value=mock_async_context(response))
+        cassette = Cassette()
+
+        async with (
+            RecordingSession(cassette, session=inner) as session,
+            BandcampAPIClient(session=session, identity_token="secret") as client,
+        ):
+            results = await client.search("query")
+
+        assert len(results) == 3
+        (interaction,) = cassette.interactions
+        assert interaction.key().startswith("search|GET|")
+        assert interaction.params == SEARCH_PARAMS
+        assert interaction.headers == {"Content-Type": "application/json"}
+        assert "secret" not in json.dumps(interaction.to_dict())
+        assert inner.request.call_args.kwargs["headers"]["Cookie"] == "identity=secret"
+
+
+class TestReplaySession:
+    """Test answering requests from a cassette."""
+
+    @pytest.mark.asyncio
+    async def test_replays_through_client(self, sample_search_data):
+        """The client parses replayed responses like live ones."""
+        session = ReplaySession(Cassette([_search_interaction(sample_search_data)]))
+
+        async with BandcampAPIClient(session=session) as client:
+            first = await client.search("query")
+            second = await client.search("query")
+
+        assert [item.name for item in first] == [item.name for item in second]
+        assert session.replayed == 2
+
+    @pytest.mark.asyncio
+    async def test_replays_in_order_with_status(self, sample_search_data):
+        """A recorded 429 then 200 replays in that order."""
+        cassette = Cassette(
+            [
+                _search_interaction(
+                    sample_search_data, status=429, headers={"Retry-After": "0"}
+                ),
+                _search_interaction(sample_search_data),
+            ]
+        )
+
+        async with BandcampAPIClient(session=ReplaySession(cassette)) as client:
+            with pytest.raises(BandcampRateLimitError):
+                await client.search("query")
+            assert len(await client.search("query")) == 3
+
+        retrying = BandcampAPIClient(
+            session=ReplaySession(cassette),
+            retry_policy=RetryPolicy(base_delay=0),
+        )
+        assert len(await retrying.search("query")) == 3
+        assert retrying.last_request_info.attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_server_errors_raise(self):
+        """Recorded 5xx responses raise ClientResponseError."""
+        cassette = Cassette([Interaction("GET", SEARCH_URL, 503, b"", SEARCH_PARAMS)])
+
+        async with BandcampAPIClient(session=ReplaySession(cassette)) as client:
+            with pytest.raises(aiohttp.ClientResponseError) as excinfo:
+                await client.search("query")
+        assert excinfo.value.status == 503
+
+    @pytest.mark.asyncio
+    async def test_time_dependent_fields(self, sample_feed_data):
+        """A first feed page recorded earlier matches despite its timestamp."""
+        cassette = Cassette(
+            [
+                Interaction(
+                    "POST",
+                    BandcampAPIClient.FEED_URL,
+                    200,
+                    json.dumps(sample_feed_data).encode(),
+                    data={"fan_id": "999", "older_than": "1700000000"},
+                )
+            ]
+        )
+        client = BandcampAPIClient(
+            session=ReplaySession(cassette), identity_token="token"
+        )
+        client._fan_id = 999
+
+        feed = await client.get_feed()
+
+        assert len(feed.stories) == 2
+
+    @pytest.mark.asyncio
+    async def test_miss_and_no_repeat(self, sample_search_data):
+        """Unrecorded requests raise; repeat=False uses each response once."""
+        session = ReplaySession(
+            Cassette([_search_interaction(sample_search_data)]), repeat=False
+        )
+
+        async with BandcampAPIClient(session=session) as client:
+            await client.search("query")
+            with pytest.raises(CassetteMissError):
+                await client.search("query")
+            with pytest.raises(CassetteMissError):
+                await client.search("other")
+
+    @pytest.mark.asyncio
+    async def test_speed(self, sample_search_data):
+        """Recorded durations are divided by the speed factor."""
+        cassette = Cassette([_search_interaction(sample_search_data)])
+        sleep = AsyncMock()
+
+        with patch("bandcamp_async_api.cassette.asyncio.sleep", sleep):
+            async with BandcampAPIClient(
+                session=ReplaySession(cassette, speed=100)
+            ) as client:
+                await client.search("query")
+            async with BandcampAPIClient(session=ReplaySession(cassette)) as client:
+                await client.search("query")
+
+        sleep.assert_awaited_once_with(0.005)
@@ -1,7 +1,10 @@
 """Tests for BandcampAPIClient."""
 
+import asyncio
+import json
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from bandcamp_async_api.client import (
     BandcampAPIClient,
@@ -281,8 +284,10 @@ class TestBandcampAPIClient:
         # Mock the session methods to return error data
         mock_response = AsyncMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json = AsyncMock(
-            return_value={"error": True, "error_message": "Test error"}
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {"error": True, "error_message": "Test error"}
+            ).encode()
         )
         mock_session.get.return_value.__aenter__.return_value = mock_response
 
@@ -297,8 +302,10 @@ class TestBandcampAPIClient:
         # Mock the session methods to return error data
         mock_response = AsyncMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json = AsyncMock(
-            return_value={"error": True, "error_message": "No such album"}
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {"error": True, "error_message": "No such album"}
+            ).encode()
         )
         mock_session.get.return_value.__aenter__.return_value = mock_response
 
@@ -313,7 +320,7 @@ class TestBandcampAPIClient:
         # Mock the response
         mock_response = AsyncMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json = AsyncMock(return_value={"results": []})
+        mock_response.read = AsyncMock(return_value=b'{"results": []}')
         mock_session.get.return_value.__aenter__.return_value = mock_response
 
         await client.search("test")
@@ -828,3 +835,274 @@ class TestBandcampAPIClient:
 
             call_args = mock_post_form.call_args
             assert call_args[1]["data"]["older_than"] == "1769576630"
+
+
+class TestRequestCoalescing:
+    """Test single-flight deduplication of identical in-flight requests."""
+
+    @staticmethod
+    def _slow_session(mock_session, payload, delay=0.01):
+        """Make session.get/post return a response after a short delay."""
+
+        class SlowContext:
+            async def __aenter__(self):
+                await asyncio.sleep(delay)
+                response = AsyncMock()
+                response.status = 200
+                response.raise_for_status = Mock()
+                response.read = AsyncMock(return_value=json.dumps(payload).encode())
+                return response
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+        mock_session.get = Mock(side_effect=lambda *a, **kw: SlowContext())
+        mock_session.post = Mock(side_effect=lambda *a, **kw: SlowContext())
+        return mock_session
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_call(
+        self, mock_session, sample_album_data
+    ):
+        """Test that concurrent identical requests hit the network once."""
+        self._slow_session(mock_session, sample_album_data)
+        client = BandcampAPIClient(session=mock_session)
+
+        albums = await asyncio.gather(*(client.get_album(123, 789) for _ in range(5)))
+
+        assert mock_session.get.call_count == 1
+        assert all(album.id == 789 for album in albums)
+        # Every caller gets its own model instance
+        assert len({id(album) for album in albums}) == 5
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_requests_are_not_coalesced(
+        self, mock_session, sample_album_data
+    ):
+        """Test that requests with different params are sent separately."""
+        self._slow_session(mock_session, sample_album_data)
+        client = BandcampAPIClient(session=mock_session)
+
+        await asyncio.gather(client.get_album(123, 789), client.get_album(123, 790))
+
+        assert mock_session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_fans_out_to_all_waiters(self, mock_session):
+        """Test that an error from the shared call is raised in every waiter."""
+        self._slow_session(mock_session, {"error": True, "error_message": "No such"})
+        client = BandcampAPIClient(session=mock_session)
+
+        results = await asyncio.gather(
+            *(client.get_track(123, 1) for _ in range(3)), return_exceptions=True
+        )
+
+        assert mock_session.get.call_count == 1
+        assert all(isinstance(r, BandcampNotFoundError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(
+        self, mock_session, sample_artist_data
+    ):
+        """Test that cancelling one waiter leaves the shared call running."""
+        self._slow_session(mock_session, sample_artist_data, delay=0.05)
+        client = BandcampAPIClient(session=mock_session)
+
+        first = asyncio.create_task(client.get_artist(123))
+        second = asyncio.create_task(client.get_artist(123))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        artist = await second
+        assert artist.id == 123
+        assert mock_session.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_coalescing_can_be_disabled(self, mock_session, sample_album_data):
+        """Test that coalesce_requests=False sends every request."""
+        self._slow_session(mock_session, sample_album_data)
+        client = BandcampAPIClient(session=mock_session, coalesce_requests=False)
+
+        await asyncio.gather(*(client.get_album(123, 789) for _ in range(3)))
+
+        assert mock_session.get.call_count == 3
+
+
+class TestTralbumTypeHints:
+    """Test album/track type hints that avoid double round-trips."""
+
+    @staticmethod
+    def _tralbum_get(found_type, payload):
+        """Fake _get that only finds the release as ``found_type``."""
+
+        async def fake_get(url, params):
+            if params["tralbum_type"] != found_type:
+                raise BandcampNotFoundError("No such tralbum")
+            return payload
+
+        return AsyncMock(side_effect=fake_get)
+
+    @pytest.fixture
+    def single_track_data(self, sample_track_data):
+        """Track response as returned for a single-track release."""
+        track = {**sample_track_data["tracks"][0], "track_id": 131415}
+        return {**sample_track_data, "tracks": [track]}
+
+    @pytest.mark.asyncio
+    async def test_fallback_result_is_remembered(self, single_track_data):
+        """Test that a track found via fallback is requested directly next time."""
+        client = BandcampAPIClient()
+        fake_get = self._tralbum_get("t", single_track_data)
+
+        with patch.object(client, '_get', fake_get):
+            await client.get_album(123, 131415)
+            assert fake_get.call_count == 2
+
+            await client.get_album(123, 131415)
+            assert fake_get.call_count == 3
+
+        assert client.tralbum_type_hint(123, "131415") == "t"
+
+    @pytest.mark.asyncio
+    async def test_search_results_seed_hints(
+        self, sample_search_data, single_track_data
+    ):
+        """Test that a track from search results is fetched as a track first."""
+        client = BandcampAPIClient()
+
+        with patch.object(client, '_get', return_value=sample_search_data):
+            await client.search("test")
+
+        assert client.tralbum_type_hint(123, 789) == "a"
+        assert client.tralbum_type_hint(123, 131415) == "t"
+
+        fake_get = self._tralbum_get("t", single_track_data)
+        with patch.object(client, '_get', fake_get):
+            await client.get_album(123, 131415)
+
+        assert fake_get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_collection_items_seed_hints(self, sample_collection_items_data):
+        """Test that collection items record their tralbum_type."""
+        client = BandcampAPIClient()
+
+        with patch.object(client, '_post', return_value=sample_collection_items_data):
+            summary = await client.get_collection_items(fan_id=999)
+
+        item = summary.items[0]
+        assert client.tralbum_type_hint(item.band_id, item.item_id) == "a"
+
+    @pytest.mark.asyncio
+    async def test_feed_and_discography_seed_hints(self, sample_feed_data):
+        """Test that feed stories and discography entries record their type."""
+        client = BandcampAPIClient(identity_token="test_token")
+        client._fan_id = 999
+
+        with patch.object(client, '_post', return_value=sample_feed_data):
+            await client.get_feed()
+
+        assert client.tralbum_type_hint(1942662887, 3105067265) == "t"
+        assert client.tralbum_type_hint(1942662887, 4182926504) == "a"
+
+        discography = {
+            "discography": [
+                {"item_type": "track", "item_id": 5, "band_id": 7},
+                {"item_type": "album", "item_id": 6, "band_id": 7},
+            ]
+        }
+        with patch.object(client, '_post', return_value=discography):
+            await client.get_artist_discography(7)
+
+        assert client.tralbum_type_hint(7, 5) == "t"
+        assert client.tralbum_type_hint(7, 6) == "a"
+
+    @pytest.mark.asyncio
+    async def test_race_requests_both_variants(self, single_track_data):
+        """Test that racing sends both variants at once and uses the one found."""
+        client = BandcampAPIClient(race_tralbum_types=True)
+        fake_get = self._tralbum_get("t", single_track_data)
+
+        with patch.object(client, '_get', fake_get):
+            album = await client.get_album(123, 131415)
+
+        assert album.id == 131415
+        assert fake_get.call_count == 2
+        assert client.tralbum_type_hint(123, 131415) == "t"
+
+    @pytest.mark.asyncio
+    async def test_race_raises_when_neither_variant_exists(self):
+        """Test that racing raises not-found when both variants are missing."""
+        client = BandcampAPIClient()
+        fake_get = self._tralbum_get("x", {})
+
+        with (
+            patch.object(client, '_get', fake_get),
+            pytest.raises(BandcampNotFoundError),
+        ):
+            await client.get_album(123, 1, race=True)
+
+
+class TestArtistWithDiscography:
+    """Test fetching artist and discography from one band_details call."""
+
+    @pytest.fixture
+    def artist_with_discography_data(self, sample_artist_data):
+        """band_details response including a discography."""
+        return {
+            **sample_artist_data,
+            "discography": [
+                {"item_id": 789, "item_type": "album", "band_id": 123, "title": "A"},
+                {"item_id": 790, "item_type": "track", "band_id": 123, "title": "T"},
+            ],
+        }
+
+    @pytest.mark.asyncio
+    async def test_single_request(self, artist_with_discography_data):
+        """Test that artist and typed discography come from one request."""
+        client = BandcampAPIClient()
+
+        with patch.object(
+            client, '_post', return_value=artist_with_discography_data
+        ) as mock_post:
+            result = await client.get_artist_with_discography(123)
+
+        assert mock_post.call_count == 1
+        assert result.artist.id == 123
+        assert [item.title for item in result.discography] == ["A", "T"]
+        assert client.tralbum_type_hint(123, 790) == "t"
+
+    @pytest.mark.asyncio
+    async def test_reuse_window_shares_payload(self, artist_with_discography_data):
+        """Test that back-to-back artist calls share one band_details payload."""
+        client = BandcampAPIClient(band_details_reuse_window=5.0)
+
+        with patch.object(
+            client, '_post', return_value=artist_with_discography_data
+        ) as mock_post:
+            artist = await client.get_artist(123)
+            discography = await client.get_artist_discography(123)
+
+        assert mock_post.call_count == 1
+        assert artist.name == "Test Artist"
+        assert len(discography) == 2
+
+    @pytest.mark.asyncio
+    async def test_reuse_window_expires(self, artist_with_discography_data):
+        """Test that a payload older than the window is fetched again."""
+        client = BandcampAPIClient(band_details_reuse_window=5.0)
+
+        with (
+            patch.object(
+                client, '_post', return_value=artist_with_discography_data
+            ) as mock_post,
+            patch(
+                "bandcamp_async_api.client.monotonic",
+                side_effect=[0.0, 10.0, 10.0],
+            ),
+        ):
+            await client.get_artist(123)
+            await client.get_artist_discography(123)
+
+        assert mock_post.call_count == 2
@@ -0,0 +1,151 @@
+"""Tests for the columnar collection store."""
+
+from array import array
+from unittest.mock import patch
+
+import pytest
+
+from bandcamp_async_api.client import BandcampAPIClient
+from bandcamp_async_api.columnar import MISSING, CollectionColumns
+from bandcamp_async_api.models import CollectionType
+
+RAW_ITEMS = [
+    {
+        "item_type": "album",
+        "item_id": 10,
+        "band_id": 1,
+        "tralbum_type": "a",
+        "band_name": "Band One",
+        "item_title": "First",
+        "item_url": "https://one.bandcamp.com/album/first",
+        "art_id": 100,
+        "num_streamable_tracks": 8,
+        "is_purchasable": True,
+        "price": 7.0,
+        "token": "t:10",
+    },
+    {
+        "item_type": "track",
+        "item_id": 11,
+        "band_id": 2,
+        "tralbum_type": "t",
+        "band_name": "Band Two",
+        "item_title": "Second",
+        "token": "t:11",
+    },
+    {
+        "item_type": "album",
+        "item_id": 12,
+        "band_id": 1,
+        "tralbum_type": "a",
+        "band_name": "Band One",
+        "item_title": "Third",
+        "token": "t:12",
+    },
+]
+
+
+@pytest.fixture
+def columns():
+    """Store filled with RAW_ITEMS."""
+    store = CollectionColumns(fan_id=5)
+    store.extend(RAW_ITEMS)
+    return store
+
+
+class TestCollectionColumns:
+    """Test storage, row views, filtering and export."""
+
+    def test_rows_materialize_like_parser(self, columns):
+        """Materialized rows equal the items the parser would build."""
+        client = BandcampAPIClient()
+        expected = [client._parsers.parse_collection_item(raw) for raw in RAW_ITEMS]
+        assert columns.items() == expected
+        assert columns[0].to_item() == expected[0]
+
+    def test_row_view_reads_columns(self, columns):
+        """Row views read fields without building a CollectionItem."""
+        row = columns[1]
+        assert row.item_id == 11
+        assert row.band_name == "Band Two"
+        assert row.art_id is None
+        assert row.price is None
+        assert row.is_purchasable is False
+        assert columns[-1].item_title == "Third"
+        with pytest.raises(IndexError):
+            columns[3]
+        with pytest.raises(AttributeError):
+            row.unknown  # noqa: B018
+
+    def test_missing_ints_use_sentinel(self, columns):
+        """None integer fields are stored as MISSING in the arrays."""
+        assert columns.art_id == array("q", [100, MISSING, MISSING])
+
+    def test_strings_are_dictionary_encoded(self, columns):
+        """Repeated band names are stored once and shared by every row."""
+        assert columns.band_name.values == ["Band One", "Band Two"]
+        assert list(columns.band_name.codes) == [0, 1, 0]
+        assert columns[0].band_name is columns[2].band_name
+
+    def test_filter_by_band_and_type(self, columns):
+        """Filters combine and return a new store."""
+        assert list(columns.rows(band_id=1)) == [0, 2]
+        assert list(columns.rows(item_type="track")) == [1]
+        assert list(columns.rows(band_id=1, item_type="track")) == []
+        assert list(columns.rows(item_type="package")) == []
+
+        albums = columns.filter(item_type="album")
+        assert len(albums) == 2
+        assert [row.item_id for row in albums] == [10, 12]
+        assert albums.fan_id == 5
+
+    def test_to_columns_exports_buffers(self, columns):
+        """Integer columns are exported as the stored arrays."""
+        exported = columns.to_columns()
+        assert exported["item_id"] is columns.item_id
+        assert memoryview(exported["band_id"]).tolist() == [1, 2, 1]
+        assert exported["item_type"] == ["album", "track", "album"]
+        assert exported["token"] == ["t:10", "t:11", "t:12"]
+
+
+class TestGetCollectionColumns:
+    """Test the bulk columnar collection fetch."""
+
+    @pytest.mark.asyncio
+    async def test_walks_every_page(self):
+        """Every page is appended and the last item token is followed."""
+        client = BandcampAPIClient()
+        pages = [
+            {"items": RAW_ITEMS[:2], "more_available": True},
+            {"items": RAW_ITEMS[2:], "more_available": False},
+        ]
+
+        with patch.object(client, "_post", side_effect=pages) as mock_post:
+            columns = await client.get_collection_columns(fan_id=5, count=2)
+
+        assert len(columns) == 3
+        assert columns.has_more is False
+        assert columns.last_token == "t:12"
+        second = mock_post.call_args_list[1].kwargs["json"]
+        assert second["older_than_token"] == "t:11"
+        assert client.tralbum_type_hint(2, 11) == "t"
+
+    @pytest.mark.asyncio
+    async def test_max_items_stops_early(self):
+        """The walk stops once max_items are stored and can be resumed."""
+        client = BandcampAPIClient()
+        page = {"items": RAW_ITEMS[:2], "more_available": True}
+
+        with patch.object(client, "_post", return_value=page) as mock_post:
+            columns = await client.get_collection_columns(fan_id=5, max_items=2)
+
+        assert mock_post.call_count == 1
+        assert columns.has_more is True
+        assert columns.last_token == "t:11"
+
+    @pytest.mark.asyncio
+    async def test_following_types_rejected(self):
+        """Following lists have no collection item columns."""
+        client = BandcampAPIClient()
+        with pytest.raises(ValueError):
+            await client.get_collection_columns(CollectionType.FOLLOWING, fan_id=5)
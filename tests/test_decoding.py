@@ -0,0 +1,68 @@
+"""Tests for JSON decoding."""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from bandcamp_async_api.client import BandcampAPIClient, BandcampAPIError
+from bandcamp_async_api.decoding import decode_json, default_json_loads
+
+
+class TestDecoding:
+    """Test decoder selection and offloading."""
+
+    def test_default_loads_decodes_bytes(self):
+        """The default decoder accepts raw bytes whatever backend it is."""
+        assert default_json_loads()(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_default_loads_falls_back_to_stdlib(self):
+        """Without orjson and msgspec the stdlib decoder is used."""
+        with patch.dict("sys.modules", {"orjson": None, "msgspec": None}):
+            assert default_json_loads() is json.loads
+
+    @pytest.mark.asyncio
+    async def test_small_body_decoded_inline(self):
+        """Bodies under the threshold never touch a worker thread."""
+        with patch("asyncio.to_thread") as to_thread:
+            assert await decode_json(b"[1]", json.loads, offload_threshold=10) == [1]
+        to_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_body_offloaded(self):
+        """Bodies at or over the threshold are decoded in a worker thread."""
+        body = json.dumps(list(range(100))).encode()
+        with patch("asyncio.to_thread", AsyncMock(return_value=[0])) as to_thread:
+            assert await decode_json(body, json.loads, offload_threshold=10) == [0]
+        to_thread.assert_awaited_once_with(json.loads, body)
+
+    @pytest.mark.asyncio
+    async def test_client_uses_custom_loads(self, mock_session):
+        """The client decodes response bytes with the configured function."""
+        loads = Mock(side_effect=json.loads)
+        client = BandcampAPIClient(session=mock_session, json_loads=loads)
+
+        response = AsyncMock()
+        response.status = 200
+        response.raise_for_status = Mock()
+        response.read = AsyncMock(return_value=b'{"results": []}')
+        mock_session.get.return_value.__aenter__.return_value = response
+
+        assert await client.search("test") == []
+        loads.assert_called_once_with(b'{"results": []}')
+
+    @pytest.mark.parametrize("body", [b"<html>Service Unavailable</html>", b""])
+    @pytest.mark.asyncio
+    async def test_invalid_body_raises_api_error(self, mock_session, body):
+        """Bodies that are not JSON raise BandcampAPIError, not a decoder error."""
+        client = BandcampAPIClient(session=mock_session)
+
+        response = AsyncMock()
+        response.status = 200
+        response.raise_for_status = Mock()
+        response.read = AsyncMock(return_value=body)
+        mock_session.get.return_value.__aenter__.return_value = response
+
+        with pytest.raises(BandcampAPIError, match="Invalid JSON") as excinfo:
+            await client.search("test")
+        assert excinfo.value.__cause__ is not None
@@ -0,0 +1,53 @@
+"""Tests for endpoint naming and request keys."""
+
+import pytest
+
+from bandcamp_async_api.endpoints import endpoint_name, request_key
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://bandcamp.com/api/fuzzysearch/1/app_autocomplete", "search"),
+        ("https://bandcamp.com/api/mobile/24/tralbum_details", "tralbum_details"),
+        ("https://bandcamp.com/api/mobile/24/band_details", "band_details"),
+        ("https://bandcamp.com/api/fan/2/collection_summary", "collection_summary"),
+        (
+            "https://bandcamp.com/api/fancollection/1/wishlist_items",
+            "fancollection/wishlist_items",
+        ),
+        ("https://bandcamp.com/fan_dash_feed_updates", "feed"),
+        ("https://bandcamp.com/api/something/else", "else"),
+    ],
+)
+def test_endpoint_name(url, expected):
+    """Test canonical endpoint names derived from URLs."""
+    assert endpoint_name(url) == expected
+
+
+def test_request_key_is_order_and_type_insensitive_for_params():
+    """Test that query params compare as wire strings regardless of order."""
+    url = "https://bandcamp.com/api/mobile/24/tralbum_details"
+    first = request_key("get", url, params={"band_id": 1, "tralbum_id": 2})
+    second = request_key("GET", url, params={"tralbum_id": "2", "band_id": "1"})
+    assert first == second
+    assert first.startswith("tralbum_details|GET|")
+
+
+def test_request_key_distinguishes_bodies():
+    """Test that different JSON bodies produce different keys."""
+    url = "https://bandcamp.com/api/mobile/24/band_details"
+    assert request_key("POST", url, json={"band_id": 1}) != request_key(
+        "POST", url, json={"band_id": 2}
+    )
+
+
+def test_request_key_compares_json_ids_as_strings():
+    """Test that numeric and string IDs in a JSON body give the same key."""
+    url = "https://bandcamp.com/api/mobile/24/band_details"
+    assert request_key("POST", url, json={"band_id": 123}) == request_key(
+        "POST", url, json={"band_id": "123"}
+    )
+    assert request_key("POST", url, json={"flag": True}) != request_key(
+        "POST", url, json={"flag": "True"}
+    )
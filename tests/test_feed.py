@@ -0,0 +1,288 @@
+"""Tests for feed watching."""
+
+import asyncio
+from email.utils import formatdate
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bandcamp_async_api.client import BandcampAPIClient, BandcampAPIError
+from bandcamp_async_api.feed import FeedWatcher, story_timestamp
+from bandcamp_async_api.models import FeedResponse, FeedStory, FeedTrack
+
+# 13 Mar 2026 18:27:25 GMT
+T0 = 1773426445
+
+
+def _story(item_id, offset=0, story_type="nr"):
+    return FeedStory(
+        story_type=story_type,
+        fan_id=1,
+        item_id=item_id,
+        item_type="a",
+        tralbum_id=item_id,
+        tralbum_type="a",
+        band_id=2,
+        story_date=formatdate(T0 + offset, usegmt=True),
+        featured_track=item_id * 10,
+    )
+
+
+def _feed(stories, has_more=False):
+    dates = [story_timestamp(s) for s in stories]
+    return FeedResponse(
+        stories=stories,
+        track_list=[FeedTrack(track_id=s.item_id * 10) for s in stories[:1]],
+        fan_info={},
+        band_info={},
+        oldest_story_date=min(dates) if dates else None,
+        newest_story_date=max(dates) if dates else None,
+        has_more=has_more,
+    )
+
+
+class TestFeedWatcher:
+    """Test polling, dedupe, delivery and intervals."""
+
+    @pytest.mark.asyncio
+    async def test_first_poll_sets_high_water(self):
+        """Existing stories are not delivered by default."""
+        client = BandcampAPIClient()
+        callback = AsyncMock()
+        watcher = FeedWatcher(client, callback=callback)
+
+        with patch.object(
+            client, "get_feed", AsyncMock(return_value=_feed([_story(1)]))
+        ):
+            assert await watcher.poll_once() == []
+
+        callback.assert_not_awaited()
+        assert watcher.high_water == T0
+
+    @pytest.mark.asyncio
+    async def test_new_stories_delivered_once(self):
+        """Only unseen stories are delivered, oldest first, with tracks."""
+        client = BandcampAPIClient()
+        queue = asyncio.Queue()
+        watcher = FeedWatcher(client, queue=queue)
+        pages = [
+            _feed([_story(1)]),
+            _feed([_story(3, 20), _story(2, 10), _story(1)]),
+            _feed([_story(3, 20), _story(2, 10), _story(1)]),
+        ]
+
+        with patch.object(client, "get_feed", AsyncMock(side_effect=pages)):
+            await watcher.poll_once()
+            new = await watcher.poll_once()
+            assert await watcher.poll_once() == []
+
+        assert [story.item_id for story, _ in new] == [2, 3]
+        assert queue.qsize() == 2
+        story, track = queue.get_nowait()
+        assert story.item_id == 2
+        assert track is None  # not in this page's track_list
+        assert queue.get_nowait()[1].track_id == 30
+        assert watcher.high_water == T0 + 20
+
+    @pytest.mark.asyncio
+    async def test_pages_back_to_high_water(self):
+        """Older pages are read while the whole page is new."""
+        client = BandcampAPIClient()
+        watcher = FeedWatcher(client, since=T0)
+        pages = [
+            _feed([_story(3, 20), _story(2, 10)], has_more=True),
+            _feed([_story(1, 5), _story(0, -5)], has_more=True),
+        ]
+
+        with patch.object(client, "get_feed", AsyncMock(side_effect=pages)) as mock:
+            new = await watcher.poll_once()
+
+        assert [story.item_id for story, _ in new] == [1, 2, 3]
+        assert mock.await_args_list[1].kwargs["older_than"] == T0 + 10
+
+    @pytest.mark.asyncio
+    async def test_callback_errors_do_not_stop_delivery(self):
+        """A failing callback is logged and the next story still delivered."""
+        client = BandcampAPIClient()
+        delivered = []
+
+        async def callback(story, track):
+            delivered.append(story.item_id)
+            raise RuntimeError("boom")
+
+        watcher = FeedWatcher(client, callback=callback, deliver_existing=True)
+        feed = _feed([_story(2, 10), _story(1)])
+        with patch.object(client, "get_feed", AsyncMock(return_value=feed)):
+            await watcher.poll_once()
+
+        assert delivered == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_interval_adapts(self):
+        """Idle polls back off; errors count as idle; new stories reset it."""
+        client = BandcampAPIClient()
+        watcher = FeedWatcher(client, min_interval=1, max_interval=4)
+        pages = [
+            _feed([_story(1)]),
+            BandcampAPIError("down"),
+            _feed([_story(1)]),
+            _feed([_story(2, 10), _story(1)]),
+        ]
+        intervals = []
+
+        async def sleep(delay):
+            intervals.append(delay)
+            if len(intervals) == len(pages):
+                raise asyncio.CancelledError
+
+        with (
+            patch.object(client, "get_feed", AsyncMock(side_effect=pages)),
+            patch("bandcamp_async_api.feed.asyncio.sleep", sleep),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await watcher._run()
+
+        assert intervals == [2, 4, 4, 1]
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self):
+        """The watcher polls in a background task until stopped."""
+        client = BandcampAPIClient()
+        queue = asyncio.Queue()
+        feed = _feed([_story(1)])
+
+        with patch.object(client, "get_feed", AsyncMock(return_value=feed)):
+            async with client.watch_feed(queue=queue, deliver_existing=True):
+                story, _ = await asyncio.wait_for(queue.get(), 1)
+
+        assert story.item_id == 1
+
+
+def _raw_page(item_ids, offsets, fans=(), bands=()):
+    dates = [T0 + offset for offset in offsets]
+    return {
+        "stories": {
+            "entries": [
+                {
+                    "story_type": "nr",
+                    "fan_id": 1,
+                    "item_id": item_id,
+                    "band_id": 2,
+                    "story_date": formatdate(date, usegmt=True),
+                    "featured_track": item_id * 10,
+                }
+                for item_id, date in zip(item_ids, dates, strict=True)
+            ],
+            "track_list": [{"track_id": item_id * 10} for item_id in item_ids],
+            "oldest_story_date": min(dates) if dates else None,
+            "newest_story_date": max(dates) if dates else None,
+        },
+        "fan_info": {str(fan_id): {"fan_id": fan_id} for fan_id in fans},
+        "band_info": {str(band_id): {"band_id": band_id} for band_id in bands},
+    }
+
+
+class TestFeedIterator:
+    """Test walking the feed history."""
+
+    @pytest.mark.asyncio
+    async def test_walks_pages_and_pairs_tracks(self):
+        """Stories of every page are yielded with their featured track."""
+        client = BandcampAPIClient()
+        pages = [_raw_page([3, 2], [20, 10]), _raw_page([1], [0]), _raw_page([], [])]
+
+        with patch.object(client, "_feed_page", AsyncMock(side_effect=pages)) as mock:
+            entries = [entry async for entry in client.iter_feed()]
+
+        assert [story.item_id for story, _ in entries] == [3, 2, 1]
+        assert [track.track_id for _, track in entries] == [30, 20, 10]
+        assert [call.args[0] for call in mock.call_args_list] == [None, T0 + 10, T0]
+
+    @pytest.mark.asyncio
+    async def test_lookups_are_merged(self):
+        """fan_info and band_info accumulate; known entries are not reparsed."""
+        client = BandcampAPIClient()
+        pages = [
+            _raw_page([2], [10], fans=[5], bands=[7]),
+            _raw_page([1], [0], fans=[5, 6], bands=[7]),
+            _raw_page([], []),
+        ]
+        feed = client.iter_feed()
+
+        with (
+            patch.object(client, "_feed_page", AsyncMock(side_effect=pages)),
+            patch.object(
+                client._parsers,
+                "parse_feed_fan_info",
+                wraps=client._parsers.parse_feed_fan_info,
+            ) as parse_fan,
+        ):
+            _ = [entry async for entry in feed]
+
+        assert sorted(feed.fan_info) == [5, 6]
+        assert list(feed.band_info) == [7]
+        assert parse_fan.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stops_at_until(self):
+        """Stories older than until are not yielded nor paged into."""
+        client = BandcampAPIClient()
+        pages = [_raw_page([3, 2], [20, 10]), _raw_page([1, 0], [5, -5])]
+
+        with patch.object(client, "_feed_page", AsyncMock(side_effect=pages)) as mock:
+            entries = [entry async for entry in client.iter_feed(until=T0)]
+
+        assert [story.item_id for story, _ in entries] == [3, 2, 1]
+        assert mock.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_stories(self):
+        """Iteration ends after max_stories stories."""
+        client = BandcampAPIClient()
+        pages = [_raw_page([3, 2], [20, 10]), _raw_page([1], [0])]
+
+        with patch.object(client, "_feed_page", AsyncMock(side_effect=pages)):
+            feed = client.iter_feed(max_stories=3, prefetch=0)
+            entries = [entry async for entry in feed]
+
+        assert [story.item_id for story, _ in entries] == [3, 2, 1]
+        assert feed.pages_fetched == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetches_next_page(self):
+        """The next page is requested before the current one is consumed."""
+        client = BandcampAPIClient()
+        pages = [_raw_page([3, 2], [20, 10]), _raw_page([1], [0]), _raw_page([], [])]
+
+        with patch.object(client, "_feed_page", AsyncMock(side_effect=pages)) as mock:
+            async with client.iter_feed(prefetch=1) as feed:
+                await anext(feed)
+                for _ in range(5):
+                    await asyncio.sleep(0)
+                assert mock.call_count >= 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefetch", [0, 1])
+    async def test_cursor_tracks_yielded_stories(self, prefetch):
+        """The cursor is the last yielded story's date, not the fetched page's."""
+        client = BandcampAPIClient()
+        pages = [_raw_page([3, 2], [20, 10]), _raw_page([1], [0]), _raw_page([], [])]
+
+        with patch.object(client, "_feed_page", AsyncMock(side_effect=pages)):
+            async with client.iter_feed(older_than=T0 + 30, prefetch=prefetch) as feed:
+                assert feed.cursor == T0 + 30
+                await anext(feed)
+                for _ in range(5):
+                    await asyncio.sleep(0)
+                assert feed.cursor == T0 + 20
+                await anext(feed)
+                assert feed.cursor == T0 + 10
+
+        resumed = [_raw_page([1], [0]), _raw_page([], [])]
+        with patch.object(client, "_feed_page", AsyncMock(side_effect=resumed)) as mock:
+            entries = [
+                entry async for entry in client.iter_feed(older_than=feed.cursor)
+            ]
+
+        assert [story.item_id for story, _ in entries] == [1]
+        assert mock.call_args_list[0].args[0] == T0 + 10
@@ -0,0 +1,149 @@
+"""Tests for the collection hydration pipeline."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bandcamp_async_api.client import BandcampAPIClient, BandcampNotFoundError
+from bandcamp_async_api.hydration import CollectionHydrator
+from bandcamp_async_api.models import CollectionItem, CollectionType
+
+
+def _item(item_id, tralbum_type="a"):
+    return CollectionItem(
+        item_type="album" if tralbum_type == "a" else "track",
+        item_id=item_id,
+        band_id=1,
+        tralbum_type=tralbum_type,
+    )
+
+
+async def _items(items, read=None):
+    for item in items:
+        if read is not None:
+            read.append(item.item_id)
+        yield item
+
+
+class TestCollectionHydrator:
+    """Test hydration, errors, progress and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_albums_and_tracks_hydrated(self):
+        """Albums use get_album and tracks use get_track."""
+        client = BandcampAPIClient()
+        items = [_item(1), _item(2, "t")]
+
+        with (
+            patch.object(client, "get_album", AsyncMock(return_value="album")),
+            patch.object(client, "get_track", AsyncMock(return_value="track")),
+        ):
+            results = [r async for r in CollectionHydrator(client, _items(items))]
+
+        models = {r.item.item_id: r.model for r in results}
+        assert models == {1: "album", 2: "track"}
+        assert all(r.ok for r in results)
+
+    @pytest.mark.asyncio
+    async def test_errors_reported_per_item(self):
+        """A failed lookup is yielded with its error; the walk continues."""
+        client = BandcampAPIClient()
+        progress = []
+
+        async def get_album(band_id, item_id):
+            if item_id == 2:
+                raise BandcampNotFoundError("No such album")
+            return item_id
+
+        with patch.object(client, "get_album", side_effect=get_album):
+            hydrator = CollectionHydrator(
+                client,
+                _items([_item(1), _item(2), _item(3)]),
+                concurrency=1,
+                on_progress=lambda p: progress.append((p.hydrated, p.failed)),
+            )
+            results = [r async for r in hydrator]
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert progress == [(1, 0), (1, 1), (2, 1)]
+        assert hydrator.progress.items_read == 3
+
+    @pytest.mark.asyncio
+    async def test_async_progress_callback_awaited(self):
+        """Awaitable progress callbacks are awaited."""
+        client = BandcampAPIClient()
+        on_progress = AsyncMock()
+
+        with patch.object(client, "get_album", AsyncMock(return_value="album")):
+            async for _ in CollectionHydrator(
+                client, _items([_item(1)]), on_progress=on_progress
+            ):
+                pass
+
+        on_progress.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_limits_reads(self):
+        """Items are not read far ahead of an idle consumer."""
+        client = BandcampAPIClient()
+        read = []
+
+        with patch.object(client, "get_album", AsyncMock(return_value="album")):
+            async with CollectionHydrator(
+                client,
+                _items([_item(i) for i in range(100)], read),
+                concurrency=2,
+                max_pending=2,
+            ) as hydrator:
+                await anext(hydrator)
+                for _ in range(10):
+                    await asyncio.sleep(0)
+
+        # 2 buffered + 1 consumed + 1 blocked per worker
+        assert len(read) <= 6
+
+    @pytest.mark.asyncio
+    async def test_source_error_raised(self):
+        """A failing collection walk is raised to the consumer."""
+        client = BandcampAPIClient()
+
+        async def broken():
+            yield _item(1)
+            raise BandcampNotFoundError("No such fan")
+
+        with (
+            patch.object(client, "get_album", AsyncMock(return_value="album")),
+            pytest.raises(BandcampNotFoundError),
+        ):
+            async for _ in CollectionHydrator(client, broken(), concurrency=1):
+                pass
+
+
+class TestHydrateCollection:
+    """Test the client entry point."""
+
+    @pytest.mark.asyncio
+    async def test_walks_collection_pages(self):
+        """hydrate_collection walks the collection with iter_collection."""
+        client = BandcampAPIClient()
+        page = {
+            "items": [{"item_type": "album", "item_id": 5, "band_id": 1}],
+            "more_available": False,
+        }
+
+        with (
+            patch.object(client, "_post", AsyncMock(return_value=page)),
+            patch.object(client, "get_album", AsyncMock(return_value="album")),
+        ):
+            async with client.hydrate_collection(fan_id=9) as hydrator:
+                results = [r async for r in hydrator]
+
+        assert [r.model for r in results] == ["album"]
+        assert hydrator.progress.pages_fetched == 1
+
+    def test_following_types_rejected(self):
+        """Following lists have no albums to hydrate."""
+        client = BandcampAPIClient()
+        with pytest.raises(ValueError):
+            client.hydrate_collection(CollectionType.FOLLOWERS)
@@ -1,5 +1,6 @@
 """Integration tests for bandcamp_async_api."""
 
+import json
 import pytest
 from unittest.mock import AsyncMock, patch
 
@@ -93,8 +94,10 @@ class TestBandcampAPIIntegration:
         # Mock error response that bypasses _get method
         mock_response = AsyncMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json = AsyncMock(
-            return_value={"error": True, "error_message": "API Error"}
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {"error": True, "error_message": "API Error"}
+            ).encode()
         )
         mock_session.get.return_value.__aenter__.return_value = mock_response
 
@@ -152,7 +155,9 @@ class TestBandcampAPIIntegration:
         # Mock the response
         mock_response = AsyncMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json = AsyncMock(return_value=sample_collection_summary_data)
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(sample_collection_summary_data).encode()
+        )
         mock_session.get.return_value.__aenter__.return_value = mock_response
 
         # Execute operation that requires identity
@@ -0,0 +1,189 @@
+"""Tests for request metrics."""
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+import aiohttp
+import pytest
+
+from bandcamp_async_api.cache import ResponseCache
+from bandcamp_async_api.cassette import Cassette, Interaction, ReplaySession
+from bandcamp_async_api.client import BandcampAPIClient
+from bandcamp_async_api.metrics import LatencyHistogram, RequestMetrics
+from bandcamp_async_api.retry import RetryPolicy
+
+BASE_URL = BandcampAPIClient.BASE_URL
+SEARCH_URL = f"{BASE_URL}/fuzzysearch/1/app_autocomplete"
+SEARCH_PARAMS = {"q": "query", "param_with_locations": "true"}
+TRALBUM_URL = f"{BASE_URL}/mobile/24/tralbum_details"
+ALBUM_PARAMS = {"band_id": "123", "tralbum_id": "789", "tralbum_type": "a"}
+
+
+def _client(*interactions, **kwargs):
+    metrics = RequestMetrics()
+    session = ReplaySession(Cassette(list(interactions)))
+    return BandcampAPIClient(session=session, metrics=metrics, **kwargs), metrics
+
+
+class TestLatencyHistogram:
+    """Test the histogram."""
+
+    def test_observe_and_quantile(self):
+        """Durations land in the first bucket bounding them."""
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(seconds)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.mean == pytest.approx(2.65 / 4)
+        assert histogram.quantile(0.5) == pytest.approx(0.1)
+        assert 0.1 < histogram.quantile(0.75) <= 1.0
+        assert histogram.quantile(0.99) == 1.0
+        assert LatencyHistogram().quantile(0.5) == 0.0
+
+
+class TestRequestMetrics:
+    """Test metrics collected by the client."""
+
+    @pytest.mark.asyncio
+    async def test_successful_call(self, sample_search_data):
+        """Calls, attempts, statuses, bytes and latency are recorded."""
+        body = json.dumps(sample_search_data).encode()
+        client, metrics = _client(
+            Interaction("GET", SEARCH_URL, 200, body, SEARCH_PARAMS)
+        )
+
+        await client.search("query")
+
+        stats = metrics.snapshot()["search"]
+        assert stats.calls == 1
+        assert stats.attempts == 1
+        assert stats.statuses == {200: 1}
+        assert stats.bytes_received == len(body)
+        assert stats.latency.count == 1
+        assert stats.errors == stats.retries == stats.rate_limited == 0
+
+    @pytest.mark.asyncio
+    async def test_retries_and_rate_limits(self, sample_search_data):
+        """429s and retried attempts are counted."""
+        body = json.dumps(sample_search_data).encode()
+        client, metrics = _client(
+            Interaction(
+                "GET", SEARCH_URL, 429, b"", SEARCH_PARAMS, headers={"Retry-After": "0"}
+            ),
+            Interaction("GET", SEARCH_URL, 503, b"", SEARCH_PARAMS),
+            Interaction("GET", SEARCH_URL, 200, body, SEARCH_PARAMS),
+            retry_policy=RetryPolicy(base_delay=0),
+        )
+
+        await client.search("query")
+
+        stats = metrics.endpoints["search"]
+        assert stats.calls == 1
+        assert stats.attempts == 3
+        assert stats.retries == 2
+        assert stats.rate_limited == 1
+        assert stats.statuses == {429: 1, 503: 1, 200: 1}
+        assert stats.errors == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_wait_is_not_latency(self, sample_search_data):
+        """Attempts are timed from the moment the rate limiter lets them go."""
+
+        async def acquire(endpoint):
+            await asyncio.sleep(0.2)
+
+        limiter = Mock(acquire=acquire)
+        body = json.dumps(sample_search_data).encode()
+        client, metrics = _client(
+            Interaction("GET", SEARCH_URL, 200, body, SEARCH_PARAMS),
+            rate_limiter=limiter,
+        )
+
+        await client.search("query")
+
+        stats = metrics.endpoints["search"]
+        assert stats.latency.count == 1
+        assert stats.latency.mean < 0.1
+        limiter.on_success.assert_called_once_with("search")
+
+    @pytest.mark.asyncio
+    async def test_connection_errors(self, mock_session):
+        """Attempts failing without a response count as errors."""
+        mock_session.get = Mock(side_effect=aiohttp.ClientConnectionError())
+        metrics = RequestMetrics()
+        client = BandcampAPIClient(session=mock_session, metrics=metrics)
+
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await client.search("query")
+
+        stats = metrics.endpoints["search"]
+        assert stats.errors == 1
+        assert stats.attempts == 1
+        assert not stats.statuses
+
+    @pytest.mark.asyncio
+    async def test_cache_and_coalescing(self, sample_album_data):
+        """Cache lookups and coalesced calls are counted per endpoint."""
+        body = json.dumps(sample_album_data).encode()
+        client, metrics = _client(
+            Interaction("GET", TRALBUM_URL, 200, body, ALBUM_PARAMS),
+            cache=ResponseCache(),
+        )
+
+        await asyncio.gather(client.get_album(123, 789), client.get_album(123, 789))
+        await client.get_album(123, 789)
+
+        stats = metrics.endpoints["tralbum_details"]
+        assert stats.calls == 3
+        assert stats.attempts == 1
+        assert stats.coalesced == 1
+        assert (stats.cache_hits, stats.cache_misses) == (1, 2)
+        assert stats.cache_hit_ratio == pytest.approx(1 / 3)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_a_copy(self, sample_search_data):
+        """Snapshots do not change as more requests are made."""
+        body = json.dumps(sample_search_data).encode()
+        client, metrics = _client(
+            Interaction("GET", SEARCH_URL, 200, body, SEARCH_PARAMS)
+        )
+        await client.search("query")
+        snapshot = metrics.snapshot()
+
+        await client.search("query")
+
+        assert snapshot["search"].calls == 1
+        assert metrics.endpoints["search"].calls == 2
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_disabled_by_default(self):
+        """Clients collect nothing without a metrics object."""
+        assert BandcampAPIClient().metrics is None
+
+    @pytest.mark.asyncio
+    async def test_prometheus_export(self, sample_search_data):
+        """The text format lists counters, statuses and histogram buckets."""
+        body = json.dumps(sample_search_data).encode()
+        client, metrics = _client(
+            Interaction("GET", SEARCH_URL, 200, body, SEARCH_PARAMS)
+        )
+        await client.search("query")
+
+        text = metrics.to_prometheus()
+
+        assert "# TYPE bandcamp_api_calls_total counter" in text
+        assert 'bandcamp_api_calls_total{endpoint="search"} 1' in text
+        assert 'bandcamp_api_responses_total{endpoint="search",status="200"} 1' in text
+        assert "# TYPE bandcamp_api_request_duration_seconds histogram" in text
+        assert (
+            'bandcamp_api_request_duration_seconds_bucket{endpoint="search",le="+Inf"} 1'
+            in text
+        )
+        assert (
+            'bandcamp_api_request_duration_seconds_count{endpoint="search"} 1' in text
+        )
+        assert text.endswith("\n")
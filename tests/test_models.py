@@ -1,5 +1,7 @@
 """Tests for data models."""
 
+import pytest
+
 from bandcamp_async_api.models import (
     BCAlbum,
     BCArtist,
@@ -374,3 +376,40 @@ class TestCollectionModels:
         assert item.name == "Test Fan"
         assert item.url == "https://bandcamp.com/testfan"
         assert item.is_following is True
+
+
+class TestModelSlots:
+    """Test that models are slot-based and keep their dataclass behavior."""
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            SearchResultItem,
+            SearchResultArtist,
+            SearchResultAlbum,
+            SearchResultTrack,
+            BCArtist,
+            BCAlbum,
+            BCTrack,
+            CollectionItem,
+            FollowingItem,
+            FanItem,
+            CollectionSummary,
+        ],
+    )
+    def test_models_have_slots(self, model):
+        """Instances carry no per-instance __dict__."""
+        assert all("__slots__" in cls.__dict__ for cls in model.__mro__[:-1])
+
+    def test_unknown_attribute_rejected(self):
+        """Slots reject attributes that are not fields."""
+        item = FollowingItem(band_id=1)
+        with pytest.raises(AttributeError):
+            item.extra = True
+
+    def test_search_result_subclass_keeps_type_default(self):
+        """Subclasses still fix ``type`` and compare and print by value."""
+        album = SearchResultAlbum(id=1, name="Album", url="https://x")
+        assert album.type == "album"
+        assert album == SearchResultAlbum(id=1, name="Album", url="https://x")
+        assert repr(album).startswith("SearchResultAlbum(type='album', id=1")
@@ -0,0 +1,173 @@
+"""Tests for collection iteration."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from bandcamp_async_api.client import BandcampAPIClient, BandcampAPIError
+from bandcamp_async_api.models import CollectionType
+
+
+def _page(start, size, more=True):
+    """Build a fancollection response with `size` items starting at `start`."""
+    return {
+        "items": [
+            {"item_type": "album", "item_id": i, "band_id": 1, "token": f"t:{i}"}
+            for i in range(start, start + size)
+        ],
+        "more_available": more,
+        "last_token": f"response:{start + size}",
+    }
+
+
+class TestCollectionIterator:
+    """Test iter_collection pagination and prefetching."""
+
+    @pytest.mark.asyncio
+    async def test_yields_all_items_across_pages(self):
+        """Test that every page is walked using the last item token."""
+        client = BandcampAPIClient()
+        pages = [_page(0, 2), _page(2, 2), _page(4, 1, more=False)]
+
+        with patch.object(client, '_post', side_effect=pages) as mock_post:
+            items = [item async for item in client.iter_collection(fan_id=9)]
+
+        assert [item.item_id for item in items] == [0, 1, 2, 3, 4]
+        assert mock_post.call_count == 3
+        tokens = [
+            c.kwargs["json"]["older_than_token"] for c in mock_post.call_args_list
+        ]
+        assert tokens[1:] == ["t:1", "t:3"]
+
+    @pytest.mark.asyncio
+    async def test_prefetches_next_page_while_consuming(self):
+        """Test that the next page is requested before the current is consumed."""
+        client = BandcampAPIClient()
+        pages = [_page(0, 2), _page(2, 2, more=False)]
+
+        with patch.object(client, '_post', side_effect=pages) as mock_post:
+            async with client.iter_collection(fan_id=9, prefetch=1) as items:
+                first = await anext(items)
+                await asyncio.sleep(0)
+                await asyncio.sleep(0)
+                assert first.item_id == 0
+                assert mock_post.call_count == 2
+
+    @pytest.mark.parametrize("prefetch", [1, 2, 3])
+    @pytest.mark.asyncio
+    async def test_prefetch_limits_pages_ahead(self, prefetch):
+        """Test that exactly `prefetch` pages are fetched ahead of the consumer."""
+        client = BandcampAPIClient()
+        pages = [_page(i * 2, 2) for i in range(10)]
+
+        with patch.object(client, '_post', side_effect=pages) as mock_post:
+            async with client.iter_collection(fan_id=9, prefetch=prefetch) as items:
+                await anext(items)
+                for _ in range(20):
+                    await asyncio.sleep(0)
+                assert mock_post.call_count == 1 + prefetch
+
+                await anext(items)
+                await anext(items)
+                for _ in range(20):
+                    await asyncio.sleep(0)
+                assert mock_post.call_count == 2 + prefetch
+
+    @pytest.mark.asyncio
+    async def test_no_prefetch_is_serial(self):
+        """Test that prefetch=0 requests a page only when needed."""
+        client = BandcampAPIClient()
+        pages = [_page(0, 2), _page(2, 2, more=False)]
+
+        with patch.object(client, '_post', side_effect=pages) as mock_post:
+            items = client.iter_collection(fan_id=9, prefetch=0)
+            await anext(items)
+            await asyncio.sleep(0)
+            assert mock_post.call_count == 1
+            rest = [item async for item in items]
+
+        assert [item.item_id for item in rest] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_cursor_resumes_walk(self):
+        """Test that the cursor of an interrupted walk resumes after it."""
+        client = BandcampAPIClient()
+
+        with patch.object(client, '_post', side_effect=[_page(0, 3)]):
+            async with client.iter_collection(fan_id=9, prefetch=0) as items:
+                await anext(items)
+                await anext(items)
+                cursor = items.cursor
+
+        assert cursor == "t:1"
+
+        with patch.object(
+            client, '_post', side_effect=[_page(2, 1, more=False)]
+        ) as mock_post:
+            resumed = client.iter_collection(fan_id=9, older_than_token=cursor)
+            items = [item async for item in resumed]
+
+        assert mock_post.call_args.kwargs["json"]["older_than_token"] == "t:1"
+        assert [item.item_id for item in items] == [2]
+
+    @pytest.mark.asyncio
+    async def test_error_is_raised_to_consumer(self):
+        """Test that a failing page request surfaces in the loop."""
+        client = BandcampAPIClient()
+
+        with patch.object(
+            client, '_post', side_effect=[_page(0, 1), BandcampAPIError("boom")]
+        ):
+            items = client.iter_collection(fan_id=9)
+            assert (await anext(items)).item_id == 0
+            with pytest.raises(BandcampAPIError, match="boom"):
+                await anext(items)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefetch", [0, 1])
+    async def test_iteration_continues_after_error(self, prefetch):
+        """Test that the failed page is requested again by the next anext."""
+        client = BandcampAPIClient()
+        responses = [_page(0, 1), BandcampAPIError("boom"), _page(1, 1, more=False)]
+
+        with patch.object(client, '_post', side_effect=responses) as mock_post:
+            items = client.iter_collection(fan_id=9, prefetch=prefetch)
+            assert (await anext(items)).item_id == 0
+            with pytest.raises(BandcampAPIError, match="boom"):
+                await anext(items)
+            assert (await asyncio.wait_for(anext(items), 1)).item_id == 1
+            with pytest.raises(StopAsyncIteration):
+                await asyncio.wait_for(anext(items), 1)
+
+        tokens = [
+            call.kwargs["json"]["older_than_token"] for call in mock_post.mock_calls
+        ]
+        assert tokens[1:] == ["t:0", "t:0"]
+
+    @pytest.mark.asyncio
+    async def test_following_items(self, sample_following_bands_data):
+        """Test iterating a following endpoint."""
+        client = BandcampAPIClient()
+        data = {**sample_following_bands_data, "more_available": False}
+
+        with patch.object(client, '_post', return_value=data):
+            items = [
+                item
+                async for item in client.iter_collection(
+                    CollectionType.FOLLOWING, fan_id=9
+                )
+            ]
+
+        assert [item.band_id for item in items] == [111, 333]
+
+    @pytest.mark.asyncio
+    async def test_exhausted_iterator_keeps_stopping(self):
+        """anext after the end raises StopAsyncIteration again, not hang."""
+        client = BandcampAPIClient()
+
+        with patch.object(client, '_post', return_value=_page(0, 1, more=False)):
+            items = client.iter_collection(fan_id=9)
+            assert [item.item_id async for item in items] == [0]
+            with pytest.raises(StopAsyncIteration):
+                await asyncio.wait_for(anext(items), 1)
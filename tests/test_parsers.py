@@ -6,14 +6,17 @@ from bandcamp_async_api import (
     SearchResultTrack,
     SearchResultArtist,
     SearchResultAlbum,
+    BCAlbum,
     BCArtist,
+    BCTrack,
+    DiscographyItem,
     FanItem,
     FeedResponse,
     FeedStory,
     FeedTrack,
     FollowingItem,
 )
-from bandcamp_async_api.parsers import BandcampParsers
+from bandcamp_async_api.parsers import BandcampParsers, ParseContext
 
 
 class TestBandcampParsers:
@@ -145,6 +148,47 @@ class TestBandcampParsers:
         assert artist.tags == [tag['name'] for tag in data['tags']]  # ty:ignore[non-subscriptable, not-iterable, invalid-argument-type]
         assert artist.genre == data['genre_name']
 
+    def test_parse_discography_item(self, parsers):
+        """Test parsing a discography entry."""
+        data = {
+            "item_id": 789,
+            "item_type": "album",
+            "band_id": 123,
+            "title": "Test Album",
+            "artist_name": "Guest Artist",
+            "band_name": "Test Artist",
+            "art_id": 101112,
+            "release_date": "01 Jan 2022 00:00:00 GMT",
+            "is_purchasable": True,
+        }
+
+        item = parsers.parse_discography_item(data)
+
+        assert isinstance(item, DiscographyItem)
+        assert item.item_id == 789
+        assert item.item_type == "album"
+        assert item.title == "Test Album"
+        assert item.artist_name == "Guest Artist"
+        assert item.art_url == "https://f4.bcbits.com/img/a101112_0.jpg"
+        assert item.is_purchasable is True
+
+    def test_parse_artist_with_discography(self, parsers, sample_artist_data):
+        """Test parsing artist and discography from one response."""
+        data = {
+            **sample_artist_data,
+            "discography": [
+                {"item_id": 1, "item_type": "album", "band_id": 123},
+                {"item_id": 2, "item_type": "track", "band_id": 123},
+            ],
+        }
+
+        result = parsers.parse_artist_with_discography(data)
+
+        assert result.artist.name == "Test Artist"
+        assert [d.item_id for d in result.discography] == [1, 2]
+        assert result.discography[1].item_type == "track"
+        assert result.discography[0].art_url is None
+
     def test_parse_album(self, parsers):
         """Test parsing album data."""
         # noinspection DuplicatedCode
@@ -740,6 +784,18 @@ class TestBandcampParsers:
         assert feed.newest_story_date == 1773426445
         assert feed.has_more is True
 
+    def test_feed_response_indexes(self, parsers, sample_feed_data):
+        """Stories resolve their track, fan and band through int-keyed indexes."""
+        feed = parsers.parse_feed_response(sample_feed_data)
+        first, second = feed.stories
+
+        assert feed.track_for(first).track_id == 3105067265
+        assert feed.track_for(second).track_id == 2747948712
+        assert feed.fan_for(first) is feed.fan_info["4407009"]
+        assert feed.fan_for(second) is None  # fan 999 is not in fan_info
+        assert feed.band_for(first) is feed.band_info["1942662887"]
+        assert "tracks_by_id" not in repr(feed)
+
     def test_parse_feed_response_empty(self, parsers, sample_feed_empty_data):
         """Test empty feed doesn't crash and has_more is False."""
         feed = parsers.parse_feed_response(sample_feed_empty_data)
@@ -747,3 +803,132 @@ class TestBandcampParsers:
         assert len(feed.stories) == 0
         assert feed.oldest_story_date is None
         assert feed.has_more is False
+
+
+class TestLazyParsing:
+    """Test lazy parsing of heavy fields."""
+
+    @pytest.fixture
+    def parsers(self):
+        """Create a lazy BandcampParsers instance."""
+        return BandcampParsers(lazy=True)
+
+    def test_lazy_album_matches_eager(self, parsers, sample_album_data):
+        """Lazy fields resolve to the eagerly parsed values."""
+        eager = BandcampParsers().parse_album(sample_album_data)
+        album = parsers.parse_album(sample_album_data)
+
+        assert isinstance(album, BCAlbum)
+        assert not album.is_hydrated
+        assert album.title == eager.title
+        assert album.about == "Test album description"
+        assert album.credits == "Test credits"
+        assert [t.title for t in album.tracks] == [t.title for t in eager.tracks]
+        assert album.tracks[0].album is album
+        assert album.tracks[0].lyrics == "Test lyrics"
+        assert album.is_hydrated
+        assert album._raw is None  # payload released once hydrated
+
+    def test_lazy_fields_not_parsed_until_read(self, parsers, sample_album_data):
+        """The payload is read on first access, not at parse time."""
+        album = parsers.parse_album(sample_album_data)
+        sample_album_data["about"] = "Changed"
+        assert album.about == "Changed"
+        sample_album_data["about"] = "Changed again"
+        assert album.about == "Changed"  # resolved only once
+
+    def test_assignment_skips_loading(self, parsers, sample_album_data):
+        """Assigning a lazy field replaces the pending value."""
+        album = parsers.parse_album(sample_album_data)
+        album.tracks = []
+        assert album.tracks == []
+        assert album.about == "Test album description"
+
+    def test_lazy_track(self, parsers, sample_track_data):
+        """Standalone track lyrics, about and credits resolve lazily."""
+        sample_track_data["about"] = "About the track"
+        track = parsers.parse_track(sample_track_data)
+
+        assert isinstance(track, BCTrack)
+        assert track.lyrics == "Test lyrics"
+        assert track.about == "About the track"
+        assert track.credits is None
+        assert track.is_hydrated
+
+    def test_lazy_artist_equality_and_repr(self, parsers, sample_artist_data):
+        """Equality and repr see the resolved values."""
+        artist = parsers.parse_artist(sample_artist_data)
+        other = parsers.parse_artist(sample_artist_data)
+
+        assert isinstance(artist, BCArtist)
+        assert artist == other
+        assert "bio='Test artist biography'" in repr(artist)
+
+    def test_lazy_equals_eager(
+        self, parsers, sample_album_data, sample_track_data, sample_artist_data
+    ):
+        """Lazy models compare equal to eager ones, in both directions."""
+        eager_parsers = BandcampParsers()
+        for parse, data in (
+            ("parse_track", sample_track_data),
+            ("parse_artist", sample_artist_data),
+        ):
+            eager = getattr(eager_parsers, parse)(data)
+            lazy = getattr(parsers, parse)(data)
+            assert not lazy.is_hydrated
+            assert eager == lazy
+            assert lazy == eager
+
+        eager = eager_parsers.parse_album(sample_album_data)
+        lazy = parsers.parse_album(sample_album_data)
+        # Tracks point back at their album, so compare albums without them
+        eager.tracks = lazy.tracks = None
+        assert lazy == eager
+        assert eager == lazy
+        lazy.about = "Changed"
+        assert lazy != eager
+        assert eager != lazy
+
+
+class TestParseContext:
+    """Test string interning and shared artists."""
+
+    @pytest.fixture
+    def parsers(self):
+        """Create a BandcampParsers instance with its own context."""
+        return BandcampParsers()
+
+    def test_repeated_strings_shared(self, parsers):
+        """Equal strings from different items are one object."""
+        # Built at runtime so the inputs are distinct objects, unlike literals
+        names = [str(bytearray(b"Band"), "ascii") for _ in range(2)]
+        assert names[0] is not names[1]
+        first = parsers.parse_collection_item(
+            {"item_id": 1, "band_id": 2, "band_name": names[0]}
+        )
+        second = parsers.parse_collection_item(
+            {"item_id": 3, "band_id": 2, "band_name": names[1]}
+        )
+        assert first.band_name is second.band_name
+
+    def test_one_artist_per_band(self, parsers, sample_album_data):
+        """Albums of the same band share one BCArtist."""
+        first = parsers.parse_album(sample_album_data)
+        second = parsers.parse_album({**sample_album_data, "id": 790})
+        assert first.artist is second.artist
+
+    def test_changed_artist_replaced(self, parsers, sample_album_data):
+        """A band whose data changed gets a new BCArtist."""
+        first = parsers.parse_album(sample_album_data)
+        renamed = {**sample_album_data, "band": {"band_id": 123, "name": "Renamed"}}
+        second = parsers.parse_album(renamed)
+        assert second.artist is not first.artist
+        assert second.artist.name == "Renamed"
+        assert first.artist.name == "Test Artist"
+
+    def test_context_is_bounded(self, sample_album_data):
+        """Least recently used artists are dropped above max_artists."""
+        parsers = BandcampParsers(context=ParseContext(max_artists=1))
+        first = parsers.parse_album(sample_album_data)
+        parsers.parse_album({**sample_album_data, "band": {"band_id": 5, "name": "B"}})
+        assert parsers.parse_album(sample_album_data).artist is not first.artist
@@ -0,0 +1,125 @@
+"""Tests for the client-side rate limiter."""
+
+import json
+from time import monotonic
+from unittest.mock import AsyncMock
+
+import pytest
+
+from bandcamp_async_api.client import BandcampAPIClient, BandcampRateLimitError
+from bandcamp_async_api.ratelimit import RateLimiter, TokenBucket, endpoint_family
+
+
+@pytest.mark.parametrize(
+    "endpoint,family",
+    [
+        ("search", "search"),
+        ("tralbum_details", "tralbum"),
+        ("band_details", "band"),
+        ("fancollection/collection_items", "fancollection"),
+        ("collection_summary", "fancollection"),
+        ("feed", "feed"),
+        ("something_else", "default"),
+    ],
+)
+def test_endpoint_family(endpoint, family):
+    """Test mapping endpoint names to limiter families."""
+    assert endpoint_family(endpoint) == family
+
+
+class TestTokenBucket:
+    """Test token bucket pacing and AIMD adaptation."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self):
+        """Test that requests beyond the burst wait for a refill."""
+        bucket = TokenBucket(rate=50.0, burst=2)
+        start = monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        # Third request needs one token at 50/s, i.e. ~20ms
+        assert monotonic() - start >= 0.015
+
+    def test_aimd_decrease_and_recovery(self):
+        """Test multiplicative decrease on 429 and additive recovery."""
+        bucket = TokenBucket(rate=4.0, min_rate=0.5, increase_step=1.0)
+
+        bucket.on_rate_limited()
+        assert bucket.rate == 2.0
+        bucket.on_rate_limited()
+        bucket.on_rate_limited()
+        bucket.on_rate_limited()
+        assert bucket.rate == 0.5
+
+        for _ in range(10):
+            bucket.on_success()
+        assert bucket.rate == 4.0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_blocks_acquire(self, monkeypatch):
+        """Test that Retry-After pauses the bucket before the next token."""
+        bucket = TokenBucket(rate=1000.0, burst=1)
+        bucket.on_rate_limited(retry_after=30)
+
+        calls = []
+
+        async def fake_sleep(delay):
+            # Record the wait and let the pause elapse immediately
+            calls.append(delay)
+            bucket._blocked_until = 0.0
+
+        monkeypatch.setattr("bandcamp_async_api.ratelimit.asyncio.sleep", fake_sleep)
+        await bucket.acquire()
+
+        assert calls
+        assert calls[0] == pytest.approx(30, abs=1)
+
+
+class TestRateLimiter:
+    """Test the limiter wired into clients."""
+
+    def test_shared_instance(self):
+        """Test that shared() returns one process-wide limiter."""
+        assert RateLimiter.shared() is RateLimiter.shared()
+
+    def test_families_have_independent_buckets(self):
+        """Test that a 429 on search does not slow down album lookups."""
+        limiter = RateLimiter(rates={"search": 2.0, "tralbum": 4.0})
+        limiter.on_rate_limited("search")
+
+        assert limiter.bucket("search").rate == 1.0
+        assert limiter.bucket("tralbum_details").rate == 4.0
+
+    @pytest.mark.asyncio
+    async def test_client_reports_429_to_limiter(self, mock_session):
+        """Test that a 429 response shrinks the endpoint family's rate."""
+        response = AsyncMock()
+        response.status = 429
+        response.headers = {"Retry-After": "0"}
+        mock_session.get.return_value.__aenter__.return_value = response
+
+        limiter = RateLimiter(rates={"search": 2.0})
+        client = BandcampAPIClient(session=mock_session, rate_limiter=limiter)
+
+        with pytest.raises(BandcampRateLimitError):
+            await client.search("test")
+
+        assert limiter.bucket("search").rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_clients_share_limiter(self, mock_session, sample_search_data):
+        """Test that two clients draw tokens from the same bucket."""
+        response = AsyncMock()
+        response.status = 200
+        response.raise_for_status = lambda: None
+        response.read = AsyncMock(return_value=json.dumps(sample_search_data).encode())
+        mock_session.get.return_value.__aenter__.return_value = response
+
+        limiter = RateLimiter(burst=2)
+        first = BandcampAPIClient(session=mock_session, rate_limiter=limiter)
+        second = BandcampAPIClient(session=mock_session, rate_limiter=limiter)
+
+        await first.search("a")
+        await second.search("b")
+
+        assert limiter.bucket("search").tokens < 1
@@ -0,0 +1,279 @@
+"""Tests for the retry policy and the client's retry loop."""
+
+import asyncio
+import json
+from contextvars import ContextVar
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
+import pytest
+
+from bandcamp_async_api.cache import ResponseCache
+from bandcamp_async_api.client import BandcampAPIClient, BandcampRateLimitError
+from bandcamp_async_api.retry import RetryPolicy, is_idempotent
+
+
+def _response(status=200, payload=None, headers=None):
+    """Build a mock response with the given status."""
+    response = AsyncMock()
+    response.status = status
+    response.headers = headers or {}
+    response.read = AsyncMock(return_value=json.dumps(payload).encode())
+    if status >= 400:
+        response.raise_for_status = Mock(
+            side_effect=aiohttp.ClientResponseError(Mock(), (), status=status)
+        )
+    else:
+        response.raise_for_status = Mock()
+    return response
+
+
+class TestRetryPolicy:
+    """Test backoff computation and give-up rules."""
+
+    def test_full_jitter_is_bounded(self):
+        """Test that backoff stays within the exponential ceiling."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        for attempt, ceiling in ((1, 1.0), (2, 2.0), (3, 4.0), (6, 5.0)):
+            for _ in range(50):
+                assert 0 <= policy.backoff(attempt) <= ceiling
+
+    def test_retry_after_is_minimum_wait(self):
+        """Test that Retry-After raises the jittered delay."""
+        policy = RetryPolicy(base_delay=0.1)
+        assert policy.backoff(1, retry_after=7) >= 7
+
+    def test_gives_up_after_max_attempts(self):
+        """Test that no delay is returned once attempts are exhausted."""
+        policy = RetryPolicy(max_attempts=2)
+        assert policy.next_delay(1, elapsed=0) is not None
+        assert policy.next_delay(2, elapsed=0) is None
+
+    def test_deadline_budget(self):
+        """Test that a retry which would overrun the deadline is skipped."""
+        policy = RetryPolicy(deadline=5.0)
+        assert policy.next_delay(1, elapsed=1.0, retry_after=3) == 3
+        assert policy.next_delay(1, elapsed=3.0, retry_after=3) is None
+        assert policy.next_delay(1, elapsed=3.0, retry_after=3, deadline=10) == 3
+
+    @pytest.mark.parametrize(
+        "method,endpoint,expected",
+        [
+            ("GET", "tralbum_details", True),
+            ("POST", "band_details", True),
+            ("POST", "fancollection/collection_items", True),
+            ("POST", "feed", True),
+            ("POST", "purchase", False),
+        ],
+    )
+    def test_is_idempotent(self, method, endpoint, expected):
+        """Test which requests are safe to repeat."""
+        assert is_idempotent(method, endpoint) is expected
+
+
+@pytest.fixture
+def no_sleep():
+    """Make retry backoff sleeps return immediately."""
+    with patch(
+        "bandcamp_async_api.client.asyncio.sleep", new=AsyncMock()
+    ) as mock_sleep:
+        yield mock_sleep
+
+
+class TestClientRetries:
+    """Test retries performed by BandcampAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_retries_5xx_then_succeeds(
+        self, mock_session, sample_album_data, no_sleep
+    ):
+        """Test that a 503 is retried and attempts are reported."""
+        mock_session.get.return_value.__aenter__.side_effect = [
+            _response(503),
+            _response(200, sample_album_data),
+        ]
+        client = BandcampAPIClient(session=mock_session, retry_policy=RetryPolicy())
+
+        album = await client.get_album(123, 789)
+
+        assert album.id == 789
+        assert mock_session.get.call_count == 2
+        assert client.last_request_info.attempts == 2
+        assert client.last_request_info.retries == 1
+        no_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retries_429_honoring_retry_after(
+        self, mock_session, sample_artist_data, no_sleep
+    ):
+        """Test that a 429 waits at least Retry-After before retrying."""
+        mock_session.post.return_value.__aenter__.side_effect = [
+            _response(429, headers={"Retry-After": "12"}),
+            _response(200, sample_artist_data),
+        ]
+        client = BandcampAPIClient(session=mock_session, retry_policy=RetryPolicy())
+
+        artist = await client.get_artist(123)
+
+        assert artist.id == 123
+        assert no_sleep.await_args.args[0] >= 12
+
+    @pytest.mark.asyncio
+    async def test_retries_connection_errors(
+        self, mock_session, sample_search_data, no_sleep
+    ):
+        """Test that connection resets are retried."""
+        mock_session.get.return_value.__aenter__.side_effect = [
+            aiohttp.ServerDisconnectedError(),
+            _response(200, sample_search_data),
+        ]
+        client = BandcampAPIClient(session=mock_session, retry_policy=RetryPolicy())
+
+        results = await client.search("test")
+
+        assert len(results) == 3
+        assert client.last_request_info.attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, mock_session, no_sleep):
+        """Test that the last error is raised once attempts run out."""
+        mock_session.get.return_value.__aenter__.side_effect = [
+            _response(429, headers={"Retry-After": "1"}) for _ in range(3)
+        ]
+        client = BandcampAPIClient(
+            session=mock_session, retry_policy=RetryPolicy(max_attempts=3)
+        )
+
+        with pytest.raises(BandcampRateLimitError):
+            await client.search("test")
+
+        assert mock_session.get.call_count == 3
+        assert client.last_request_info.attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, mock_session, no_sleep):
+        """Test that a 404 HTTP status is raised without retrying."""
+        mock_session.get.return_value.__aenter__.side_effect = [_response(404)]
+        client = BandcampAPIClient(session=mock_session, retry_policy=RetryPolicy())
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.search("test")
+
+        assert mock_session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_no_retries_without_policy(self, mock_session):
+        """Test that the default client raises on the first failure."""
+        mock_session.get.return_value.__aenter__.side_effect = [_response(503)]
+        client = BandcampAPIClient(session=mock_session)
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.search("test")
+
+        assert client.last_request_info.attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_reports_no_attempts(self, mock_session, sample_album_data):
+        """Test that request info marks cache hits."""
+        mock_session.get.return_value.__aenter__.return_value = _response(
+            200, sample_album_data
+        )
+        client = BandcampAPIClient(session=mock_session, cache=ResponseCache())
+
+        await client.get_album(123, 789)
+        await client.get_album(123, 789)
+
+        assert client.last_request_info.from_cache is True
+        assert client.last_request_info.attempts == 0
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_each_attempt(self, mock_session):
+        """Test that a retry started before the deadline cannot outlive it."""
+
+        responses = iter([_response(503)])
+
+        async def respond(*_):
+            response = next(responses, None)
+            if response is None:
+                await asyncio.sleep(10)
+            return response
+
+        mock_session.get.return_value.__aenter__.side_effect = respond
+        client = BandcampAPIClient(
+            session=mock_session,
+            retry_policy=RetryPolicy(base_delay=0, deadline=0.05),
+        )
+
+        started = asyncio.get_running_loop().time()
+        with pytest.raises(TimeoutError):
+            await client.search("test")
+
+        assert asyncio.get_running_loop().time() - started < 1
+        assert client.last_request_info.attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_per_call_deadline(self, mock_session, sample_search_data):
+        """Test that client.deadline() applies to calls made in the block only."""
+
+        async def slow(*_):
+            await asyncio.sleep(0.2)
+            return _response(200, sample_search_data)
+
+        mock_session.get.return_value.__aenter__.side_effect = slow
+        client = BandcampAPIClient(
+            session=mock_session, retry_policy=RetryPolicy(deadline=0.01)
+        )
+
+        with client.deadline(5):
+            assert len(await client.search("test")) == 3
+        with pytest.raises(TimeoutError):
+            await client.search("test")
+
+        client = BandcampAPIClient(session=mock_session)
+        with pytest.raises(TimeoutError), client.deadline(0.01):
+            await client.search("test")
+
+    @pytest.mark.asyncio
+    async def test_coalesced_waiters_get_own_info(
+        self, mock_session, sample_search_data
+    ):
+        """Test that only the joining caller's request info is marked coalesced."""
+        mock_session.get.return_value.__aenter__.return_value = _response(
+            200, sample_search_data
+        )
+        client = BandcampAPIClient(session=mock_session)
+
+        async def search():
+            await client.search("test")
+            return client.last_request_info
+
+        first, second = await asyncio.gather(search(), search())
+
+        assert mock_session.get.call_count == 1
+        assert first is not second
+        assert (first.coalesced, first.attempts) == (False, 1)
+        assert (second.coalesced, second.attempts) == (True, 1)
+
+    @pytest.mark.asyncio
+    async def test_request_state_is_kept_per_client(
+        self, mock_session, sample_search_data
+    ):
+        """Test that clients sharing a task keep their own info and deadline."""
+
+        async def slow(*_):
+            await asyncio.sleep(0.1)
+            return _response(200, sample_search_data)
+
+        mock_session.get.return_value.__aenter__.side_effect = slow
+        first = BandcampAPIClient(session=mock_session)
+        second = BandcampAPIClient(session=mock_session)
+
+        with first.deadline(0.01), second.deadline(5):
+            with pytest.raises(TimeoutError):
+                await first.search("test")
+            await second.search("test")
+
+        assert first.last_request_info is not second.last_request_info
+        assert first.last_request_info.attempts == 1
+        assert second.last_request_info.attempts == 1
+        assert not any(isinstance(v, ContextVar) for v in vars(first).values())
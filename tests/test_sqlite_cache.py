@@ -0,0 +1,132 @@
+"""Tests for the SQLite cache backend."""
+
+from unittest.mock import patch
+
+import pytest
+
+from bandcamp_async_api.cache import CacheBackend, ResponseCache
+from bandcamp_async_api.sqlite_cache import SQLiteCache
+
+
+@pytest.fixture
+async def sqlite_cache(tmp_path):
+    """SQLite cache in a temporary directory."""
+    cache = SQLiteCache(tmp_path / "cache.db")
+    yield cache
+    await cache.close()
+
+
+class TestSQLiteCache:
+    """Test SQLiteCache storage, expiry and maintenance."""
+
+    def test_satisfies_protocol(self, tmp_path):
+        """Test that SQLiteCache implements the CacheBackend protocol."""
+        assert isinstance(SQLiteCache(tmp_path / "cache.db"), CacheBackend)
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_is_compressed(self, sqlite_cache):
+        """Test that bodies round-trip and are stored compressed."""
+        body = b'{"title": "Test Album"}' * 100
+        await sqlite_cache.set("tralbum_details|1", body, ttl=60)
+
+        assert await sqlite_cache.get("tralbum_details|1") == body
+        assert 0 < await sqlite_cache.size_bytes() < len(body)
+
+    @pytest.mark.asyncio
+    async def test_uses_wal_mode(self, sqlite_cache):
+        """Test that the database runs in WAL journal mode."""
+        await sqlite_cache.set("k", b"v", ttl=60)
+        mode = await sqlite_cache._run(
+            lambda conn: conn.execute("PRAGMA journal_mode").fetchone()[0]
+        )
+        assert mode == "wal"
+
+    @pytest.mark.asyncio
+    async def test_survives_reopen(self, tmp_path):
+        """Test that entries persist across cache instances."""
+        path = tmp_path / "cache.db"
+        first = SQLiteCache(path)
+        await first.set("band_details|1", b"artist", ttl=60)
+        await first.close()
+
+        second = SQLiteCache(path)
+        try:
+            assert await second.get("band_details|1") == b"artist"
+        finally:
+            await second.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_not_returned(self, sqlite_cache):
+        """Test that expired entries are treated as missing."""
+        with patch("bandcamp_async_api.sqlite_cache.time", return_value=1000.0):
+            await sqlite_cache.set("k", b"v", ttl=10)
+        with patch("bandcamp_async_api.sqlite_cache.time", return_value=1011.0):
+            assert await sqlite_cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_prefix_and_clear(self, sqlite_cache):
+        """Test prefix deletion and clearing."""
+        await sqlite_cache.set("band_details|1", b"a", ttl=60)
+        await sqlite_cache.set("band_details|2", b"b", ttl=60)
+        await sqlite_cache.set("search|x", b"c", ttl=60)
+
+        assert await sqlite_cache.delete_prefix("band_details|") == 2
+        assert await sqlite_cache.get("search|x") == b"c"
+
+        await sqlite_cache.clear()
+        assert await sqlite_cache.get("search|x") is None
+
+    @pytest.mark.asyncio
+    async def test_maintain_purges_and_evicts(self, tmp_path):
+        """Test that maintenance drops expired rows and enforces max_bytes."""
+        cache = SQLiteCache(tmp_path / "cache.db", max_bytes=30, compress_level=0)
+        try:
+            with patch("bandcamp_async_api.sqlite_cache.time", return_value=1000.0):
+                await cache.set("expired", b"x", ttl=1)
+            with patch("bandcamp_async_api.sqlite_cache.time", return_value=2000.0):
+                await cache.set("old", b"o" * 10, ttl=600)
+            with patch("bandcamp_async_api.sqlite_cache.time", return_value=2001.0):
+                await cache.set("new", b"n" * 10, ttl=600)
+                removed = await cache.maintain()
+                assert await cache.get("new") == b"n" * 10
+
+            assert removed == 2
+            assert await cache.size_bytes() <= 30
+        finally:
+            await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_maintain_reclaims_free_pages(self, tmp_path):
+        """Test that maintenance returns every freed page to the filesystem."""
+        path = tmp_path / "cache.db"
+        cache = SQLiteCache(path, compress_level=0)
+        try:
+            for i in range(50):
+                await cache.set(f"k{i}", bytes([i]) * 20_000, ttl=60)
+            await cache.clear()
+            freelist = await cache._run(
+                lambda conn: conn.execute("PRAGMA freelist_count").fetchone()[0]
+            )
+            assert freelist > 1
+
+            await cache.maintain()
+            await cache._run(
+                lambda conn: conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            )
+
+            freelist = await cache._run(
+                lambda conn: conn.execute("PRAGMA freelist_count").fetchone()[0]
+            )
+            assert freelist == 0
+            assert path.stat().st_size < 50 * 20_000 / 10
+        finally:
+            await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_works_as_response_cache_backend(self, sqlite_cache):
+        """Test plugging SQLiteCache into ResponseCache."""
+        cache = ResponseCache(backend=sqlite_cache, ttls={"search": 60})
+        await cache.set("search|q", "search", b"[]")
+
+        assert await cache.get("search|q") == b"[]"
+        assert cache.stats.hits == 1
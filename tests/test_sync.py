@@ -0,0 +1,125 @@
+"""Tests for incremental collection sync."""
+
+from unittest.mock import patch
+
+import pytest
+
+from bandcamp_async_api.client import BandcampAPIClient
+from bandcamp_async_api.models import CollectionType, FollowingItem
+from bandcamp_async_api.sync import (
+    JSONFileSyncStore,
+    MemorySyncStore,
+    SyncState,
+    item_key,
+)
+
+
+def _page(item_ids, more=False):
+    """Build a fancollection page with the given items, newest first."""
+    return {
+        "items": [
+            {
+                "item_type": "album",
+                "tralbum_type": "a",
+                "item_id": i,
+                "band_id": 1,
+                "token": f"{i}:{i}:a::",
+            }
+            for i in item_ids
+        ],
+        "more_available": more,
+    }
+
+
+class TestSyncCollection:
+    """Test incremental and full syncs."""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_is_full(self):
+        """Without a stored state every page is walked and saved."""
+        client = BandcampAPIClient()
+        store = MemorySyncStore()
+        pages = [_page([5, 4], more=True), _page([3])]
+
+        with patch.object(client, "_post", side_effect=pages):
+            delta = await client.sync_collection(store, fan_id=9, count=2)
+
+        assert delta.full
+        assert [item.item_id for item in delta.added] == [5, 4, 3]
+        assert delta.pages_fetched == 2
+        state = await store.load(9, CollectionType.COLLECTION)
+        assert state.high_water_token == "5:5:a::"
+        assert state.item_keys == ["a5", "a4", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_incremental_stops_at_known_item(self):
+        """Only items newer than the known ones are fetched and reported."""
+        client = BandcampAPIClient()
+        store = MemorySyncStore()
+        await store.save(
+            SyncState(9, "collection_items", "5:5:a::", ["a5", "a4", "a3"])
+        )
+
+        with patch.object(
+            client, "_post", return_value=_page([7, 6, 5, 4], more=True)
+        ) as mock_post:
+            delta = await client.sync_collection(store, fan_id=9)
+
+        assert mock_post.call_count == 1
+        assert not delta.full
+        assert [item.item_id for item in delta.added] == [7, 6]
+        assert delta.removed == []
+        state = await store.load(9, CollectionType.COLLECTION)
+        assert state.high_water_token == "7:7:a::"
+        assert state.item_keys == ["a7", "a6", "a5", "a4", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_nothing_new(self):
+        """An unchanged collection costs one request and keeps the state."""
+        client = BandcampAPIClient()
+        store = MemorySyncStore()
+        await store.save(SyncState(9, "collection_items", "5:5:a::", ["a5"]))
+
+        with patch.object(client, "_post", return_value=_page([5])):
+            delta = await client.sync_collection(store, fan_id=9)
+
+        assert delta.added == []
+        state = await store.load(9, CollectionType.COLLECTION)
+        assert state.high_water_token == "5:5:a::"
+        assert state.item_keys == ["a5"]
+
+    @pytest.mark.asyncio
+    async def test_full_sync_reports_removed(self):
+        """A full sync reports known items that are gone."""
+        client = BandcampAPIClient()
+        store = MemorySyncStore()
+        await store.save(SyncState(9, "collection_items", "5:5:a::", ["a5", "a4"]))
+
+        with patch.object(client, "_post", return_value=_page([6, 5])):
+            delta = await client.sync_collection(store, fan_id=9, full=True)
+
+        assert [item.item_id for item in delta.added] == [6]
+        assert delta.removed == ["a4"]
+        state = await store.load(9, CollectionType.COLLECTION)
+        assert state.item_keys == ["a6", "a5"]
+
+    def test_item_keys(self):
+        """Following items are keyed by band."""
+        assert item_key(FollowingItem(band_id=3)) == "b3"
+
+
+class TestJSONFileSyncStore:
+    """Test the JSON file store."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        """States survive a new store instance on the same file."""
+        path = tmp_path / "sync.json"
+        state = SyncState(9, "wishlist_items", "t", ["a1"], 123.0)
+        await JSONFileSyncStore(path).save(state)
+        await JSONFileSyncStore(path).save(SyncState(9, "collection_items"))
+
+        store = JSONFileSyncStore(path)
+        assert await store.load(9, CollectionType.WISHLIST) == state
+        assert await store.load(9, CollectionType.FOLLOWING) is None
+        assert not (tmp_path / "sync.json.tmp").exists()
@@ -0,0 +1,187 @@
+"""Tests for tracing spans."""
+
+import json
+
+import pytest
+from aiohttp import web
+
+from bandcamp_async_api.cassette import Cassette, Interaction, ReplaySession
+from bandcamp_async_api.client import BandcampAPIClient, BandcampRateLimitError
+from bandcamp_async_api.tracing import CallbackTracer, NoOpTracer, Tracer
+
+TRALBUM_URL = f"{BandcampAPIClient.BASE_URL}/mobile/24/tralbum_details"
+ALBUM_PARAMS = {"band_id": "123", "tralbum_id": "789", "tralbum_type": "a"}
+
+
+def _by_name(spans):
+    return {span.name: span for span in spans}
+
+
+class TestCallbackTracer:
+    """Test the dependency-free tracer."""
+
+    def test_nesting_and_hooks(self):
+        """Spans started inside a current span are its children."""
+        started, ended = [], []
+        tracer = CallbackTracer(on_end=ended.append, on_start=started.append)
+
+        with tracer.start_as_current_span("outer", attributes={"a": 1}) as outer:
+            inner = tracer.start_span("inner")
+            inner.set_attribute("b", 2)
+            inner.end()
+            inner.end()
+
+        assert [s.name for s in started] == ["outer", "inner"]
+        assert [s.name for s in ended] == ["inner", "outer"]
+        assert inner.parent is outer
+        assert outer.parent is None
+        assert outer.attributes == {"a": 1}
+        assert inner.attributes == {"b": 2}
+        assert outer.duration >= inner.duration >= 0
+
+    def test_records_exceptions(self):
+        """Exceptions leaving a current span are recorded on it."""
+        ended = []
+        tracer = CallbackTracer(on_end=ended.append)
+
+        with pytest.raises(ValueError), tracer.start_as_current_span("failing"):
+            raise ValueError("boom")
+
+        assert isinstance(ended[0].exception, ValueError)
+
+    def test_protocol(self):
+        """Both tracers implement the Tracer protocol."""
+        assert isinstance(CallbackTracer(), Tracer)
+        assert isinstance(NoOpTracer(), Tracer)
+
+
+class TestClientTracing:
+    """Test spans emitted by the client."""
+
+    def test_disabled_by_default(self):
+        """Clients trace nothing and add no aiohttp hooks without a tracer."""
+        client = BandcampAPIClient()
+
+        assert isinstance(client.tracer, NoOpTracer)
+        assert client._trace_configs is None
+
+    @pytest.mark.asyncio
+    async def test_get_album_phases(self, sample_album_data):
+        """get_album reports request, download, decode and parse spans."""
+        body = json.dumps(sample_album_data).encode()
+        spans = []
+        client = BandcampAPIClient(
+            session=ReplaySession(
+                Cassette([Interaction("GET", TRALBUM_URL, 200, body, ALBUM_PARAMS)])
+            ),
+            tracer=CallbackTracer(on_end=spans.append),
+        )
+
+        album = await client.get_album(123, 789)
+
+        named = _by_name(spans)
+        assert [s.name for s in spans] == [
+            "bandcamp.download",
+            "bandcamp.http",
+            "bandcamp.decode",
+            "bandcamp.request",
+            "bandcamp.parse",
+            "bandcamp.get_album",
+        ]
+        root = named["bandcamp.get_album"]
+        assert root.attributes == {
+            "bandcamp.band_id": 123,
+            "bandcamp.tralbum_id": 789,
+            "bandcamp.tralbum_type": "a",
+        }
+        assert named["bandcamp.request"].parent is root
+        assert named["bandcamp.parse"].parent is root
+        assert named["bandcamp.http"].parent is named["bandcamp.request"]
+        assert named["bandcamp.decode"].parent is named["bandcamp.request"]
+        assert named["bandcamp.download"].parent is named["bandcamp.http"]
+        assert named["bandcamp.request"].attributes["bandcamp.endpoint"] == (
+            "tralbum_details"
+        )
+        assert named["bandcamp.request"].attributes["bandcamp.attempts"] == 1
+        assert named["bandcamp.http"].attributes["http.response.status_code"] == 200
+        assert named["bandcamp.download"].attributes["bandcamp.payload_bytes"] == len(
+            body
+        )
+        assert named["bandcamp.decode"].attributes["bandcamp.payload_bytes"] == len(
+            body
+        )
+        assert named["bandcamp.parse"].attributes == {
+            "bandcamp.parser": "parse_album",
+            "bandcamp.item_count": len(album.tracks),
+        }
+
+    @pytest.mark.asyncio
+    async def test_errors_are_recorded(self):
+        """A 429 is recorded on the HTTP and request spans."""
+        spans = []
+        client = BandcampAPIClient(
+            session=ReplaySession(
+                Cassette(
+                    [
+                        Interaction(
+                            "GET",
+                            TRALBUM_URL,
+                            429,
+                            b"",
+                            ALBUM_PARAMS,
+                            headers={"Retry-After": "1"},
+                        )
+                    ]
+                )
+            ),
+            tracer=CallbackTracer(on_end=spans.append),
+        )
+
+        with pytest.raises(BandcampRateLimitError):
+            await client.get_album(123, 789)
+
+        named = _by_name(spans)
+        assert "bandcamp.parse" not in named
+        assert named["bandcamp.http"].attributes["http.response.status_code"] == 429
+        for name in ("bandcamp.http", "bandcamp.request", "bandcamp.get_album"):
+            assert isinstance(named[name].exception, BandcampRateLimitError)
+
+    @pytest.mark.asyncio
+    async def test_network_phases(self, sample_album_data):
+        """Client-owned sessions report connection and upstream wait spans."""
+
+        async def tralbum_details(request: web.Request) -> web.Response:
+            return web.json_response(sample_album_data)
+
+        app = web.Application()
+        app.router.add_get("/api/mobile/24/tralbum_details", tralbum_details)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        spans = []
+        try:
+            async with BandcampAPIClient(
+                tracer=CallbackTracer(on_end=spans.append)
+            ) as client:
+                client.BASE_URL = f"http://127.0.0.1:{port}/api"
+                await client.get_album(123, 789)
+                await client.get_track(123, 789)
+        finally:
+            await runner.cleanup()
+
+        connects = [s for s in spans if s.name == "bandcamp.connect"]
+        waits = [s for s in spans if s.name == "bandcamp.upstream_wait"]
+        https = [s for s in spans if s.name == "bandcamp.http"]
+        assert len(connects) == len(waits) == 2
+        assert [s.attributes["bandcamp.connection.reused"] for s in connects] == [
+            False,
+            True,
+        ]
+        assert connects[0].attributes["server.address"] == "127.0.0.1"
+        assert waits[0].attributes["http.response.status_code"] == 200
+        assert connects[0].parent is https[0]
+        assert waits[0].parent is https[0]
+        assert waits[0].start_time >= connects[0].end_time
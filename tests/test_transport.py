@@ -0,0 +1,88 @@
+"""Tests for transport configuration and connection warm-up."""
+
+import ssl
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
+import pytest
+
+from bandcamp_async_api.client import BandcampAPIClient
+from bandcamp_async_api.transport import TransportConfig, warm_up_connections
+
+
+class TestTransportConfig:
+    """Test TransportConfig connector construction."""
+
+    @pytest.mark.asyncio
+    async def test_connector_uses_config(self):
+        """Test that connector limits and keep-alive come from the config."""
+        config = TransportConfig(limit=42, limit_per_host=7, keepalive_timeout=90)
+        connector = config.create_connector()
+        try:
+            assert connector.limit == 42
+            assert connector.limit_per_host == 7
+            assert connector.use_dns_cache is True
+        finally:
+            await connector.close()
+
+    @pytest.mark.asyncio
+    async def test_tls_context_is_shared(self):
+        """Test that connectors built from configs share one SSLContext."""
+        with patch("aiohttp.TCPConnector") as connector_class:
+            TransportConfig().create_connector()
+            TransportConfig().create_connector()
+
+        first, second = (c.kwargs["ssl"] for c in connector_class.call_args_list)
+        assert isinstance(first, ssl.SSLContext)
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_happy_eyeballs_toggle(self):
+        """Test that disabling happy eyeballs passes no delay to aiohttp."""
+        with patch("aiohttp.TCPConnector") as connector_class:
+            TransportConfig(happy_eyeballs=False).create_connector()
+
+        assert connector_class.call_args.kwargs["happy_eyeballs_delay"] is None
+
+    @pytest.mark.asyncio
+    async def test_client_session_uses_transport(self):
+        """Test that the client builds its own session from the transport config."""
+        config = TransportConfig(limit_per_host=3)
+        client = BandcampAPIClient(transport=config)
+
+        async with client:
+            assert isinstance(client._session, aiohttp.ClientSession)
+            assert client._session.connector.limit_per_host == 3
+
+        assert client._session is None
+
+
+class TestWarmUp:
+    """Test connection pool warm-up."""
+
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_connections_per_host(self, mock_async_context):
+        """Test that warm-up issues one HEAD request per requested connection."""
+        response = Mock()
+        response.release = AsyncMock()
+        session = Mock()
+        session.head = Mock(return_value=mock_async_context(response))
+
+        opened = await warm_up_connections(
+            session, urls=("https://a.test", "https://b.test"), connections_per_host=3
+        )
+
+        assert opened == 6
+        assert session.head.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_warm_up_ignores_failures(self):
+        """Test that connection errors during warm-up are not raised."""
+        session = Mock()
+        session.head = Mock(side_effect=aiohttp.ClientConnectionError("boom"))
+
+        opened = await warm_up_connections(
+            session, urls=("https://a.test",), connections_per_host=2
+        )
+
+        assert opened == 0
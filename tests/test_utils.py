@@ -0,0 +1,29 @@
+"""Tests for shared helpers."""
+
+from bandcamp_async_api.utils import LRUDict
+
+
+class TestLRUDict:
+    """Test the bounded LRU mapping."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that reading an entry protects it from eviction."""
+        lru = LRUDict(maxsize=2)
+        lru["a"] = 1
+        lru["b"] = 2
+        assert lru.get("a") == 1
+
+        lru["c"] = 3
+
+        assert "b" not in lru
+        assert lru.get("a") == 1
+        assert lru.get("c") == 3
+        assert len(lru) == 2
+
+    def test_get_default_and_pop(self):
+        """Test missing keys and removal."""
+        lru = LRUDict(maxsize=2)
+        assert lru.get("x", 0) == 0
+        lru["x"] = 1
+        assert lru.pop("x") == 1
+        assert len(lru) == 0